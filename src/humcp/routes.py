@@ -7,15 +7,18 @@ import json
 import logging
 import secrets
 import time
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 from urllib.parse import urlencode
 
 import httpx
 from fastapi import Body, Depends, FastAPI, HTTPException, Request
-from fastapi.responses import HTMLResponse, RedirectResponse
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import HTMLResponse, RedirectResponse, Response
 from fastmcp.server.dependencies import get_access_token
 from pydantic import BaseModel, Field, create_model
+from pydantic_core import to_json
 
 from src.humcp.decorator import RegisteredTool
 from src.humcp.schemas import (
@@ -516,11 +519,15 @@ def _add_tool_route(app: FastAPI, reg: RegisteredTool, auth_dependency: Any) ->
     async def endpoint(
         data: BaseModel = Body(...),  # type: ignore[assignment]
         token=Depends(auth_dependency),
-    ) -> dict[str, Any]:
+    ) -> Response:
         try:
             params = data.model_dump(exclude_none=True)
             result = await tool.fn(**params)
-            return {"result": result}
+            # Encode in one pass with pydantic-core rather than FastAPI's
+            # jsonable_encoder walk plus json.dumps; large tool results
+            # (hundreds of listed items) are dominated by that walk.
+            content = to_json({"result": result}, fallback=jsonable_encoder)
+            return Response(content=content, media_type="application/json")
         except HTTPException:
             raise
         except Exception as e:
@@ -591,7 +598,20 @@ def _pascal(name: str) -> str:
 
 
 def _create_model_from_schema(schema: dict[str, Any], name: str) -> type[BaseModel]:
-    """Create Pydantic model from JSON schema."""
+    """Create Pydantic model from JSON schema.
+
+    Models are cached by schema JSON and name, so building routes again
+    (e.g. for another app instance) reuses the classes. Keys are not sorted,
+    keeping fields in schema order.
+    """
+    schema_key = json.dumps(schema, separators=(",", ":"))
+    return _model_for_schema_key(schema_key, name)
+
+
+@lru_cache(maxsize=512)
+def _model_for_schema_key(schema_key: str, name: str) -> type[BaseModel]:
+    """Build the model for a schema JSON string."""
+    schema = json.loads(schema_key)
     if schema.get("type") != "object":
         return create_model(name, value=(Any, ...))
 
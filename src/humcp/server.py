@@ -28,6 +28,7 @@ from src.humcp.decorator import (
 from src.humcp.middleware import APIKeyMiddleware
 from src.humcp.playground import get_playground_html
 from src.humcp.routes import build_openapi_tags, register_routes
+from src.tools.google.auth import close_http_client
 
 load_dotenv()
 
@@ -209,7 +210,10 @@ def create_app(
     @asynccontextmanager
     async def lifespan(_: FastAPI):
         async with mcp_http_app.router.lifespan_context(mcp_http_app):
-            yield
+            try:
+                yield
+            finally:
+                await close_http_client()
 
     # Create FastAPI app
     app = FastAPI(
@@ -1,11 +1,84 @@
+import asyncio
 import contextvars
+import functools
+import gzip
+import hashlib
+import importlib.util
+import json
 import logging
+import random
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+from weakref import WeakKeyDictionary
 
+import httplib2
+import httpx
 from google.oauth2.credentials import Credentials
-from googleapiclient.discovery import build
+from googleapiclient import discovery_cache
+from googleapiclient.discovery import build_from_document
+from googleapiclient.errors import HttpError, UnknownApiNameOrVersion
+from googleapiclient.http import HttpRequest
+from googleapiclient.model import JsonModel
+
+try:
+    import orjson
+except ImportError:  # optional: responses are parsed with the stdlib instead
+    orjson = None
 
 logger = logging.getLogger("humcp.google.auth")
 
+# Timeout (seconds) for requests sent through the shared async HTTP client
+HTTP_TIMEOUT = 30.0
+
+# Connection pool limits for the shared async HTTP client. Search results are
+# expanded with bursts of concurrent requests, so keep enough warm connections.
+HTTP_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=32)
+
+# Multiplex requests over HTTP/2 when the optional h2 package is installed
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Request bodies at least this many bytes are sent gzip-compressed
+GZIP_MIN_BODY_SIZE = 1024
+
+# Maximum number of calls Google accepts in a single batch request
+BATCH_MAX_REQUESTS = 100
+
+# Worker threads for blocking Google calls (batch requests)
+BLOCKING_MAX_WORKERS = 16
+
+# Statuses Google returns when a request was rejected for quota or overload
+RETRY_STATUSES = frozenset({429, 503})
+
+# Server errors that may have happened after the request was applied; only
+# retried for methods that are safe to repeat
+IDEMPOTENT_RETRY_STATUSES = frozenset({500, 502, 504})
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "PUT", "DELETE"})
+
+# Statuses of expected, transient failures logged without a traceback
+TRANSIENT_STATUSES = frozenset({429, 500, 502, 503})
+
+# Retries for a request that failed with a retryable status
+MAX_RETRIES = 3
+
+# Base delay (seconds) of the exponential backoff between retries
+RETRY_BASE_DELAY = 0.5
+
+# Longest wait (seconds) before a retry, even if Retry-After asks for more
+RETRY_MAX_DELAY = 32.0
+
+# Dedicated pool for blocking Google calls, so bursts of batch requests do not
+# compete with other tools for the event loop's default executor
+_blocking_executor = ThreadPoolExecutor(
+    max_workers=BLOCKING_MAX_WORKERS, thread_name_prefix="google-api"
+)
+
+# Shared async HTTP clients, one per event loop (pooled connections cannot be
+# shared across loops). Entries go away with their loop.
+_http_clients: WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient] = (
+    WeakKeyDictionary()
+)
+
 # Context variable to store access token from REST API calls
 # This allows tools to access the token when called via REST (not MCP)
 rest_access_token: contextvars.ContextVar[str | None] = contextvars.ContextVar(
@@ -13,6 +86,40 @@ rest_access_token: contextvars.ContextVar[str | None] = contextvars.ContextVar(
 )
 
 
+class CompactJsonModel(JsonModel):
+    """JSON model that serializes request bodies compactly as UTF-8 bytes.
+
+    The default model uses ``json.dumps`` with spaced separators and escapes
+    every non-ASCII character, which inflates large write payloads (e.g. sheet
+    values) that are then compressed and sent over the wire.
+
+    Response bodies are parsed with ``orjson`` when it is installed, which
+    is markedly faster on multi-megabyte payloads such as large sheet reads.
+    """
+
+    def serialize(self, body_value):
+        if (
+            isinstance(body_value, dict)
+            and "data" not in body_value
+            and self._data_wrapper
+        ):
+            body_value = {"data": body_value}
+        return json.dumps(body_value, separators=(",", ":"), ensure_ascii=False).encode(
+            "utf-8"
+        )
+
+    def deserialize(self, content):
+        if orjson is None:
+            return super().deserialize(content)
+        try:
+            body = orjson.loads(content)
+        except orjson.JSONDecodeError:
+            return super().deserialize(content)
+        if self._data_wrapper and isinstance(body, dict) and "data" in body:
+            body = body["data"]
+        return body
+
+
 def set_rest_access_token(token: str) -> None:
     """Set the access token for REST API calls.
 
@@ -21,6 +128,20 @@ def set_rest_access_token(token: str) -> None:
     rest_access_token.set(token)
 
 
+@functools.lru_cache(maxsize=32)
+def _discovery_document(service_name: str, version: str) -> dict:
+    """Load and parse the bundled discovery document for an API once.
+
+    Parsing the discovery JSON dominates the cost of building a service, so
+    the parsed document is shared by every service built afterwards. Services
+    themselves are still built per call, since they carry per-user credentials.
+    """
+    content = discovery_cache.get_static_doc(service_name, version)
+    if content is None:
+        raise UnknownApiNameOrVersion(f"name: {service_name}  version: {version}")
+    return json.loads(content)
+
+
 def get_google_service_from_mcp(service_name: str, version: str):
     """Build Google API service using the authenticated user's access token.
 
@@ -67,4 +188,213 @@ def get_google_service_from_mcp(service_name: str, version: str):
     creds = Credentials(token=token_value)
 
     # Build and return the Google API service
-    return build(service_name, version, credentials=creds)
+    return build_from_document(
+        _discovery_document(service_name, version),
+        credentials=creds,
+        model=CompactJsonModel(),
+    )
+
+
+def credentials_cache_key(service: Any) -> str:
+    """Return a cache key identifying the credentials a service was built with.
+
+    The access token is hashed so raw tokens are never kept as cache keys.
+
+    Args:
+        service: Service returned by ``get_google_service_from_mcp``.
+
+    Returns:
+        Hex digest unique to the service's access token.
+    """
+    credentials = getattr(service._http, "credentials", None)
+    token = getattr(credentials, "token", None)
+    return hashlib.sha256(str(token).encode()).hexdigest()
+
+
+def gzip_request(request: HttpRequest) -> HttpRequest:
+    """Compress a request body in place and mark it with Content-Encoding.
+
+    Bodies smaller than ``GZIP_MIN_BODY_SIZE`` are left untouched, since
+    compression only pays off on large payloads such as bulk sheet writes.
+    Works for both ``request.execute()`` and ``execute_async(request)``.
+
+    Args:
+        request: Request returned by a service method.
+
+    Returns:
+        The same request, for chaining.
+    """
+    body = request.body
+    if (
+        not isinstance(body, str | bytes)
+        or len(body) < GZIP_MIN_BODY_SIZE
+        or "content-encoding" in request.headers
+    ):
+        return request
+
+    if isinstance(body, str):
+        body = body.encode("utf-8")
+    compressed = gzip.compress(body, compresslevel=6)
+    request.body = compressed
+    request.body_size = len(compressed)
+    request.headers["content-encoding"] = "gzip"
+    request.headers["content-length"] = str(len(compressed))
+    return request
+
+
+def execute_batch(
+    service: Any, requests: list[tuple[str, HttpRequest]]
+) -> tuple[dict[str, Any], dict[str, str]]:
+    """Execute requests through the API's batch endpoint.
+
+    Requests are sent ``BATCH_MAX_REQUESTS`` at a time, each chunk as a single
+    multipart HTTP request. This call blocks; run it with ``run_blocking``.
+
+    Args:
+        service: Service the requests were built from.
+        requests: Pairs of (request_id, request). IDs must be unique.
+
+    Returns:
+        Responses and per-request error messages, both keyed by request ID.
+
+    Raises:
+        HttpError: If the batch request itself is rejected.
+    """
+    responses: dict[str, Any] = {}
+    errors: dict[str, str] = {}
+
+    def _collect(request_id: str, response: Any, exception: Exception | None):
+        if exception is not None:
+            errors[request_id] = str(exception)
+        else:
+            responses[request_id] = response
+
+    for start in range(0, len(requests), BATCH_MAX_REQUESTS):
+        batch = service.new_batch_http_request(callback=_collect)
+        for request_id, request in requests[start : start + BATCH_MAX_REQUESTS]:
+            batch.add(request, request_id=request_id)
+        batch.execute()
+    return responses, errors
+
+
+async def run_blocking(fn: Callable[..., Any], *args: Any) -> Any:
+    """Run a blocking Google call on the dedicated worker pool.
+
+    Args:
+        fn: Blocking callable, e.g. ``execute_batch``.
+        *args: Positional arguments passed to fn.
+
+    Returns:
+        The value returned by fn.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_blocking_executor, fn, *args)
+
+
+def log_tool_error(
+    tool_logger: logging.Logger, operation: str, error: Exception
+) -> None:
+    """Log a failed tool call, keeping tracebacks for unexpected errors only.
+
+    Transient API failures (quota, overload) are routine under load, so they
+    are logged as a one-line warning instead of a full traceback.
+
+    Args:
+        tool_logger: Logger of the calling tool module.
+        operation: Name of the failed operation, e.g. ``"sheets_read_values"``.
+        error: The exception that was raised.
+    """
+    if isinstance(error, HttpError) and error.resp.status in TRANSIENT_STATUSES:
+        tool_logger.warning("%s failed: %s", operation, error)
+    else:
+        tool_logger.exception("%s failed", operation)
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    """Return the shared async HTTP client for the running event loop.
+
+    Connections are pooled across tool calls, and requests are multiplexed
+    over HTTP/2 when ``h2`` is installed. Each event loop gets its own client
+    (e.g. one per test case), kept until the loop is garbage collected or
+    ``close_http_client`` is awaited on it.
+    """
+    loop = asyncio.get_running_loop()
+    client = _http_clients.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            timeout=HTTP_TIMEOUT, limits=HTTP_LIMITS, http2=HTTP2_AVAILABLE
+        )
+        _http_clients[loop] = client
+    return client
+
+
+async def close_http_client() -> None:
+    """Close the running event loop's shared HTTP client, if it has one.
+
+    Call on shutdown so pooled connections are closed rather than left to
+    the garbage collector.
+    """
+    client = _http_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
+def _retry_delay(response: httpx.Response, attempt: int) -> float:
+    """Return how long to wait before retrying a rejected request.
+
+    Capped at RETRY_MAX_DELAY so a long Retry-After cannot stall a tool call.
+    """
+    retry_after = response.headers.get("retry-after", "")
+    if retry_after.isdigit():
+        return min(float(retry_after), RETRY_MAX_DELAY)
+    return random.uniform(0, min(RETRY_BASE_DELAY * 2**attempt, RETRY_MAX_DELAY))
+
+
+async def execute_async(request: HttpRequest) -> Any:
+    """Execute a Google API request natively on the event loop.
+
+    The request is built by ``googleapiclient`` as usual (URI, query string,
+    body serialization), but sent through a shared ``httpx.AsyncClient``
+    instead of blocking a worker thread on ``httplib2`` for the full round trip.
+
+    Requests rejected with 429 or 503 are retried up to ``MAX_RETRIES`` times
+    with exponential backoff and jitter, honouring ``Retry-After`` when sent
+    (up to ``RETRY_MAX_DELAY`` seconds).
+    500, 502 and 504 are retried the same way for idempotent methods only, so
+    an insert is never sent twice.
+
+    Args:
+        request: Request returned by a service method, e.g.
+            ``service.users().messages().list(userId="me")``.
+
+    Returns:
+        The deserialized response body.
+
+    Raises:
+        HttpError: If the API responds with a non-2xx status.
+    """
+    headers = dict(request.headers)
+    credentials = getattr(request.http, "credentials", None)
+    if credentials is not None:
+        credentials.apply(headers)
+
+    client = _get_http_client()
+    retry_statuses = RETRY_STATUSES
+    if request.method in IDEMPOTENT_METHODS:
+        retry_statuses = RETRY_STATUSES | IDEMPOTENT_RETRY_STATUSES
+    for attempt in range(MAX_RETRIES + 1):
+        response = await client.request(
+            request.method, request.uri, content=request.body, headers=headers
+        )
+        if response.status_code not in retry_statuses or attempt == MAX_RETRIES:
+            break
+        delay = _retry_delay(response, attempt)
+        logger.warning(
+            "Google API returned %s, retrying in %.2fs", response.status_code, delay
+        )
+        await asyncio.sleep(delay)
+
+    resp = httplib2.Response({"status": response.status_code, **response.headers})
+    if response.status_code >= 300:
+        raise HttpError(resp, response.content, uri=request.uri)
+    return request.postproc(resp, response.content)
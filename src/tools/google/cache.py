@@ -0,0 +1,94 @@
+"""In-process TTL caches for read-mostly Google API responses."""
+
+import asyncio
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any
+
+
+class TTLCache:
+    """Bounded mapping whose entries expire a fixed time after insertion.
+
+    When full, the least recently inserted entry is evicted. Expired entries
+    are dropped lazily on lookup.
+
+    Args:
+        maxsize: Maximum number of entries kept.
+        ttl: Lifetime of an entry in seconds.
+    """
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[Hashable, tuple[Any, float]] = OrderedDict()
+
+    def get(self, key: Hashable) -> Any | None:
+        """Return the cached value for key, or None if missing or expired."""
+        entry = self.get_with_age(key)
+        return None if entry is None else entry[0]
+
+    def get_with_age(self, key: Hashable) -> tuple[Any, float] | None:
+        """Return the cached value for key and its age in seconds.
+
+        Returns None if the key is missing or expired.
+        """
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        value, cached_at = entry
+        age = time.monotonic() - cached_at
+        if age > self.ttl:
+            del self._data[key]
+            return None
+        return value, age
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store value under key, evicting the oldest entry if full."""
+        self._data.pop(key, None)
+        if len(self._data) >= self.maxsize:
+            self._data.popitem(last=False)
+        self._data[key] = (value, time.monotonic())
+
+    def invalidate(self, predicate: Callable[[Any], bool]) -> None:
+        """Drop every entry whose key matches predicate.
+
+        Keys are passed as stored, so the predicate may index into the tuple
+        keys its caller uses.
+        """
+        for key in [k for k in self._data if predicate(k)]:
+            del self._data[key]
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class SingleFlight:
+    """Share one in-flight call between concurrent callers with the same key.
+
+    While a call for a key is running, further callers with that key await
+    its result instead of starting another request. Once it finishes, the
+    next caller starts a fresh one.
+    """
+
+    def __init__(self) -> None:
+        self._inflight: dict[Hashable, asyncio.Task] = {}
+
+    async def run(
+        self, key: Hashable, fn: Callable[..., Awaitable[Any]], *args: Any
+    ) -> Any:
+        """Return the result of fn(*args), reusing a running call for key if any."""
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn(*args))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # Shielded so one cancelled caller does not cancel the shared call
+        return await asyncio.shield(task)
+
+    def __len__(self) -> int:
+        return len(self._inflight)
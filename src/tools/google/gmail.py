@@ -5,71 +5,205 @@ import base64
 import logging
 from email.mime.text import MIMEText
 
+from googleapiclient.errors import HttpError
+
 from src.humcp.decorator import tool
-from src.tools.google.auth import get_google_service_from_mcp
+from src.tools.google.auth import (
+    credentials_cache_key,
+    execute_async,
+    execute_batch,
+    get_google_service_from_mcp,
+    run_blocking,
+)
+from src.tools.google.cache import TTLCache
 
 logger = logging.getLogger("humcp.tools.google.gmail")
 
+# Maximum number of concurrent metadata fetches when expanding search results
+DETAIL_CONCURRENCY = 10
+
+# Search results per user and query; agents often repeat a search within
+# seconds, and sending mail clears the user's entries
+_SEARCH_CACHE = TTLCache(maxsize=64, ttl=15)
+
+# Label lists per user; labels change rarely so a few minutes of staleness is fine
+_LABELS_CACHE = TTLCache(maxsize=128, ttl=300)
+
+# Headers surfaced by the tools, in the case-folded form used as dict keys
+_WANTED_HEADERS = frozenset({"subject", "from", "to", "cc", "date"})
+
+# Headers requested from the API when only metadata is fetched
+_METADATA_HEADERS = ["Subject", "From", "To", "Date"]
+
+
+def _decode_body_data(data: str) -> str:
+    """Decode base64url body data to text with LF line endings.
+
+    Line endings are normalized on the raw bytes before decoding, so large
+    bodies are processed in single C-level passes.
+    """
+    raw = base64.urlsafe_b64decode(data)
+    return raw.replace(b"\r\n", b"\n").decode("utf-8", errors="replace")
+
+
+def _extract_headers(headers: list[dict]) -> dict[str, str]:
+    """Collect the wanted headers, keyed by case-folded name."""
+    wanted = {}
+    for header in headers:
+        name = header["name"].casefold()
+        if name in _WANTED_HEADERS:
+            wanted[name] = header["value"]
+    return wanted
+
+
+def _extract_body(payload: dict) -> str:
+    """Decode a message body, preferring text/plain over text/html parts.
+
+    Walks the whole MIME tree depth-first in document order, so bodies nested
+    under multipart/mixed (e.g. messages with attachments) are found. Stops at
+    the first text/plain part that has data.
+    """
+    if not payload.get("parts"):
+        data = payload.get("body", {}).get("data")
+        return _decode_body_data(data) if data else ""
+
+    html = None
+    stack = [payload]
+    while stack:
+        part = stack.pop()
+        data = part.get("body", {}).get("data")
+        if data:
+            mime_type = part.get("mimeType", "")
+            if mime_type == "text/plain":
+                return _decode_body_data(data)
+            if mime_type == "text/html" and html is None:
+                html = data
+        stack.extend(reversed(part.get("parts", ())))
+    return _decode_body_data(html) if html else ""
+
+
+def _message_data(msg: dict) -> dict:
+    """Convert a full-format message into the tool output shape."""
+    payload = msg.get("payload", {})
+    headers = _extract_headers(payload.get("headers", []))
+    return {
+        "id": msg["id"],
+        "thread_id": msg.get("threadId"),
+        "subject": headers.get("subject", "(no subject)"),
+        "from": headers.get("from", ""),
+        "to": headers.get("to", ""),
+        "cc": headers.get("cc", ""),
+        "date": headers.get("date", ""),
+        "body": _extract_body(payload),
+        "labels": msg.get("labelIds", []),
+    }
+
 
 @tool()
-async def google_gmail_search(query: str = "", max_results: int = 10) -> dict:
+async def google_gmail_search(
+    query: str = "",
+    max_results: int = 10,
+    prefetch_bodies: int = 0,
+    force_refresh: bool = False,
+) -> dict:
     """Search Gmail messages.
 
     Searches for emails matching the query using Gmail's search syntax.
     Examples: "from:john@example.com", "subject:meeting", "is:unread".
+    Identical searches are served from a cache for a few seconds.
 
     Args:
         query: Gmail search query (default: "" returns recent emails).
         max_results: Maximum number of messages to return (default: 10, max: 100).
+        prefetch_bodies: Also fetch the body of the first N hits, saving a
+            follow-up google_gmail_read call (default: 0).
+        force_refresh: Bypass the short-lived result cache (default: False).
 
     Returns:
         List of messages with id, thread_id, subject, from, to, date, and snippet.
+        When prefetch_bodies > 0, each message also has a body (None beyond the
+        first prefetch_bodies hits).
     """
     try:
         max_results = min(max_results, 100)
-
-        def _search():
-            service = get_google_service_from_mcp("gmail", "v3")
-            results = (
-                service.users()
-                .messages()
-                .list(userId="me", q=query, maxResults=max_results)
-                .execute()
+        logger.info(
+            "gmail_search query=%s max_results=%s prefetch_bodies=%s",
+            query,
+            max_results,
+            prefetch_bodies,
+        )
+
+        service = get_google_service_from_mcp("gmail", "v3")
+        cache_key = (
+            credentials_cache_key(service),
+            query,
+            max_results,
+            prefetch_bodies,
+        )
+        if not force_refresh:
+            cached = _SEARCH_CACHE.get(cache_key)
+            if cached is not None:
+                logger.debug("gmail_search cache hit query=%s", query)
+                return {"success": True, "data": cached}
+
+        results = await execute_async(
+            service.users()
+            .messages()
+            .list(userId="me", q=query, maxResults=max_results)
+        )
+
+        messages = results.get("messages", [])
+        if not messages:
+            data = {"messages": [], "total": 0}
+            _SEARCH_CACHE.set(cache_key, data)
+            return {"success": True, "data": data}
+
+        semaphore = asyncio.Semaphore(DETAIL_CONCURRENCY)
+
+        async def _get_details(msg: dict, with_body: bool) -> dict:
+            async with semaphore:
+                if with_body:
+                    request = (
+                        service.users()
+                        .messages()
+                        .get(userId="me", id=msg["id"], format="full")
+                    )
+                else:
+                    request = (
+                        service.users()
+                        .messages()
+                        .get(
+                            userId="me",
+                            id=msg["id"],
+                            format="metadata",
+                            metadataHeaders=_METADATA_HEADERS,
+                        )
+                    )
+                msg_data = await execute_async(request)
+            payload = msg_data.get("payload", {})
+            headers = _extract_headers(payload.get("headers", []))
+            detail = {
+                "id": msg["id"],
+                "thread_id": msg_data.get("threadId"),
+                "subject": headers.get("subject", "(no subject)"),
+                "from": headers.get("from", ""),
+                "to": headers.get("to", ""),
+                "date": headers.get("date", ""),
+                "snippet": msg_data.get("snippet", ""),
+            }
+            if prefetch_bodies > 0:
+                detail["body"] = _extract_body(payload) if with_body else None
+            return detail
+
+        detailed = await asyncio.gather(
+            *(
+                _get_details(msg, index < prefetch_bodies)
+                for index, msg in enumerate(messages)
             )
-
-            messages = results.get("messages", [])
-            if not messages:
-                return {"messages": [], "total": 0}
-
-            detailed = []
-            for msg in messages:
-                msg_data = (
-                    service.users()
-                    .messages()
-                    .get(userId="me", id=msg["id"], format="metadata")
-                    .execute()
-                )
-                headers = {
-                    h["name"].lower(): h["value"]
-                    for h in msg_data.get("payload", {}).get("headers", [])
-                }
-                detailed.append(
-                    {
-                        "id": msg["id"],
-                        "thread_id": msg_data.get("threadId"),
-                        "subject": headers.get("subject", "(no subject)"),
-                        "from": headers.get("from", ""),
-                        "to": headers.get("to", ""),
-                        "date": headers.get("date", ""),
-                        "snippet": msg_data.get("snippet", ""),
-                    }
-                )
-
-            return {"messages": detailed, "total": len(detailed)}
-
-        logger.info("gmail_search query=%s max_results=%s", query, max_results)
-        result = await asyncio.to_thread(_search)
-        return {"success": True, "data": result}
+        )
+        data = {"messages": list(detailed), "total": len(detailed)}
+        _SEARCH_CACHE.set(cache_key, data)
+        return {"success": True, "data": data}
     except Exception as e:
         logger.exception("gmail_search failed")
         return {"success": False, "error": str(e)}
@@ -88,57 +222,101 @@ async def google_gmail_read(message_id: str) -> dict:
         Full message with id, thread_id, subject, from, to, cc, date, body, and labels.
     """
     try:
+        logger.info("gmail_read message_id=%s", message_id)
+        service = get_google_service_from_mcp("gmail", "v3")
+        msg = await execute_async(
+            service.users().messages().get(userId="me", id=message_id, format="full")
+        )
+        return {"success": True, "data": _message_data(msg)}
+    except Exception as e:
+        logger.exception("gmail_read failed")
+        return {"success": False, "error": str(e)}
+
+
+def _read_batch(service, message_ids: list[str]) -> tuple[dict, dict]:
+    """Fetch messages through Gmail batch requests.
 
-        def _read():
-            service = get_google_service_from_mcp("gmail", "v3")
-            msg = (
+    Returns:
+        Messages and per-message error strings, both keyed by message ID.
+    """
+    return execute_batch(
+        service,
+        [
+            (
+                message_id,
                 service.users()
                 .messages()
-                .get(userId="me", id=message_id, format="full")
-                .execute()
+                .get(userId="me", id=message_id, format="full"),
             )
+            for message_id in message_ids
+        ],
+    )
 
-            headers = {
-                h["name"].lower(): h["value"]
-                for h in msg.get("payload", {}).get("headers", [])
-            }
 
-            body = ""
-            payload = msg.get("payload", {})
-
-            if "body" in payload and payload["body"].get("data"):
-                body = base64.urlsafe_b64decode(payload["body"]["data"]).decode()
-            elif "parts" in payload:
-                for part in payload["parts"]:
-                    if part.get("mimeType") == "text/plain":
-                        if part.get("body", {}).get("data"):
-                            body = base64.urlsafe_b64decode(
-                                part["body"]["data"]
-                            ).decode()
-                            break
-                    elif part.get("mimeType") == "text/html" and not body:
-                        if part.get("body", {}).get("data"):
-                            body = base64.urlsafe_b64decode(
-                                part["body"]["data"]
-                            ).decode()
-
-            return {
-                "id": msg["id"],
-                "thread_id": msg.get("threadId"),
-                "subject": headers.get("subject", "(no subject)"),
-                "from": headers.get("from", ""),
-                "to": headers.get("to", ""),
-                "cc": headers.get("cc", ""),
-                "date": headers.get("date", ""),
-                "body": body,
-                "labels": msg.get("labelIds", []),
-            }
+async def _read_each(service, message_ids: list[str]) -> tuple[dict, dict]:
+    """Fetch messages with concurrent individual requests."""
+    messages: dict[str, dict] = {}
+    errors: dict[str, str] = {}
+    semaphore = asyncio.Semaphore(DETAIL_CONCURRENCY)
 
-        logger.info("gmail_read message_id=%s", message_id)
-        result = await asyncio.to_thread(_read)
-        return {"success": True, "data": result}
+    async def _read_one(message_id: str) -> None:
+        async with semaphore:
+            try:
+                messages[message_id] = await execute_async(
+                    service.users()
+                    .messages()
+                    .get(userId="me", id=message_id, format="full")
+                )
+            except HttpError as e:
+                errors[message_id] = str(e)
+
+    await asyncio.gather(*(_read_one(message_id) for message_id in message_ids))
+    return messages, errors
+
+
+@tool()
+async def google_gmail_read_batch(message_ids: list[str]) -> dict:
+    """Read the full content of several Gmail messages at once.
+
+    Messages are fetched with Gmail batch requests (up to 100 messages per
+    HTTP request) instead of one round trip per message. If the batch
+    endpoint rejects the request, messages are fetched individually.
+
+    Args:
+        message_ids: IDs of the messages to read.
+
+    Returns:
+        Messages (in request order) with the same fields as google_gmail_read,
+        and errors for messages that could not be read.
+    """
+    try:
+        message_ids = list(dict.fromkeys(message_ids))
+        logger.info("gmail_read_batch count=%s", len(message_ids))
+        service = get_google_service_from_mcp("gmail", "v3")
+        try:
+            messages, errors = await run_blocking(_read_batch, service, message_ids)
+        except HttpError as e:
+            logger.warning("gmail_read_batch batch request failed, retrying: %s", e)
+            messages, errors = await _read_each(service, message_ids)
+
+        return {
+            "success": True,
+            "data": {
+                "messages": [
+                    _message_data(messages[message_id])
+                    for message_id in message_ids
+                    if message_id in messages
+                ],
+                "errors": [
+                    {"id": message_id, "error": errors[message_id]}
+                    for message_id in message_ids
+                    if message_id in errors
+                ],
+                "total": len(messages),
+            },
+        }
     except Exception as e:
-        logger.exception("gmail_read failed")
+        logger.exception("gmail_read_batch failed")
         return {"success": False, "error": str(e)}
 
 
@@ -165,65 +343,68 @@ async def google_gmail_send(
         Sent message details with message_id and thread_id.
     """
     try:
-
-        def _send():
-            service = get_google_service_from_mcp("gmail", "v3")
-
-            message = MIMEText(body)
-            message["to"] = to
-            message["subject"] = subject
-            if cc:
-                message["cc"] = cc
-            if bcc:
-                message["bcc"] = bcc
-
-            raw = base64.urlsafe_b64encode(message.as_bytes()).decode()
-            result = (
-                service.users()
-                .messages()
-                .send(userId="me", body={"raw": raw})
-                .execute()
-            )
-
-            return {
+        logger.info("gmail_send to=%s subject=%s", to, subject)
+        service = get_google_service_from_mcp("gmail", "v3")
+
+        message = MIMEText(body)
+        message["to"] = to
+        message["subject"] = subject
+        if cc:
+            message["cc"] = cc
+        if bcc:
+            message["bcc"] = bcc
+
+        raw = base64.urlsafe_b64encode(message.as_bytes()).decode()
+        result = await execute_async(
+            service.users().messages().send(userId="me", body={"raw": raw})
+        )
+        user_key = credentials_cache_key(service)
+        _SEARCH_CACHE.invalidate(lambda key: key[0] == user_key)
+
+        return {
+            "success": True,
+            "data": {
                 "message_id": result.get("id"),
                 "thread_id": result.get("threadId"),
-            }
-
-        logger.info("gmail_send to=%s subject=%s", to, subject)
-        result = await asyncio.to_thread(_send)
-        return {"success": True, "data": result}
+            },
+        }
     except Exception as e:
         logger.exception("gmail_send failed")
         return {"success": False, "error": str(e)}
 
 
 @tool()
-async def google_gmail_labels() -> dict:
+async def google_gmail_labels(force_refresh: bool = False) -> dict:
     """List all Gmail labels.
 
     Returns all labels in the user's mailbox including system labels
-    (INBOX, SENT, etc.) and user-created labels.
+    (INBOX, SENT, etc.) and user-created labels. Results are cached for
+    a few minutes per user.
+
+    Args:
+        force_refresh: Bypass the cache and fetch labels from Gmail (default: False).
 
     Returns:
         List of labels with id and name.
     """
     try:
-
-        def _list_labels():
-            service = get_google_service_from_mcp("gmail", "v3")
-            results = service.users().labels().list(userId="me").execute()
-            items = results.get("labels", [])
-            return {
-                "labels": [
-                    {"id": label["id"], "name": label["name"]} for label in items
-                ],
-                "total": len(items),
-            }
-
-        logger.info("gmail_labels")
-        result = await asyncio.to_thread(_list_labels)
-        return {"success": True, "data": result}
+        logger.info("gmail_labels force_refresh=%s", force_refresh)
+        service = get_google_service_from_mcp("gmail", "v3")
+        cache_key = credentials_cache_key(service)
+        if not force_refresh:
+            cached = _LABELS_CACHE.get(cache_key)
+            if cached is not None:
+                logger.debug("gmail_labels cache hit")
+                return {"success": True, "data": cached}
+
+        results = await execute_async(service.users().labels().list(userId="me"))
+        items = results.get("labels", [])
+        data = {
+            "labels": [{"id": label["id"], "name": label["name"]} for label in items],
+            "total": len(items),
+        }
+        _LABELS_CACHE.set(cache_key, data)
+        return {"success": True, "data": data}
     except Exception as e:
         logger.exception("gmail_labels failed")
         return {"success": False, "error": str(e)}
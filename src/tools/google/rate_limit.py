@@ -0,0 +1,37 @@
+"""Client-side request shaping for per-user Google API quotas."""
+
+import asyncio
+import time
+
+
+class AsyncTokenBucket:
+    """Token bucket that makes callers wait instead of exceeding a rate.
+
+    Up to ``capacity`` calls go through immediately; after that, calls are
+    spaced out so the long-run rate stays at ``rate`` per second.
+
+    Args:
+        rate: Tokens added per second.
+        capacity: Maximum number of tokens held (burst size).
+    """
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._updated) * self.rate
+        )
+        self._updated = now
+
+    async def acquire(self) -> None:
+        """Take one token, sleeping until one is available."""
+        self._refill()
+        while self._tokens < 1:
+            await asyncio.sleep((1 - self._tokens) / self.rate)
+            self._refill()
+        self._tokens -= 1
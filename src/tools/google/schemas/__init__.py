@@ -95,6 +95,9 @@ from src.tools.google.schemas.gmail import (
     GmailLabelsResponse,
     GmailMessage,
     GmailMessageFull,
+    GmailReadBatchData,
+    GmailReadBatchError,
+    GmailReadBatchResponse,
     GmailReadResponse,
     GmailSearchData,
     GmailSearchResponse,
@@ -123,13 +126,22 @@ from src.tools.google.schemas.sheets import (
     SheetInfo,
     SheetsAddSheetData,
     SheetsAddSheetResponse,
+    SheetsAddSheetsData,
+    SheetsAddSheetsResponse,
     SheetsAppendValuesData,
     SheetsAppendValuesResponse,
+    SheetsBatchReadValuesData,
+    SheetsBatchReadValuesResponse,
+    SheetsBatchWriteValuesData,
+    SheetsBatchWriteValuesResponse,
     SheetsClearValuesData,
     SheetsClearValuesResponse,
     SheetsCreateData,
     SheetsCreateResponse,
     SheetsGetInfoData,
+    SheetsGetInfoError,
+    SheetsGetInfoManyData,
+    SheetsGetInfoManyResponse,
     SheetsGetInfoResponse,
     SheetsListData,
     SheetsListResponse,
@@ -146,15 +158,20 @@ from src.tools.google.schemas.slides import (
     SlideAdded,
     SlideElement,
     SlideInfo,
+    SlidesAddManyTextResponse,
     SlidesAddSlideResponse,
     SlidesAddTextResponse,
     SlidesCreatePresentationResponse,
+    SlidesGetAllThumbnailsResponse,
     SlidesGetPresentationResponse,
     SlidesGetThumbnailResponse,
     SlidesListData,
     SlidesListPresentationsResponse,
     SlideThumbnail,
+    SlideThumbnailError,
+    SlideThumbnailsData,
     TextAdded,
+    TextsAddedData,
 )
 from src.tools.google.schemas.tasks import (
     TaskCreated,
@@ -199,6 +216,9 @@ __all__ = [
     "GmailLabelsResponse",
     "GmailMessage",
     "GmailMessageFull",
+    "GmailReadBatchData",
+    "GmailReadBatchError",
+    "GmailReadBatchResponse",
     "GmailReadResponse",
     "GmailSearchData",
     "GmailSearchResponse",
@@ -224,13 +244,22 @@ __all__ = [
     "SheetInfo",
     "SheetsAddSheetData",
     "SheetsAddSheetResponse",
+    "SheetsAddSheetsData",
+    "SheetsAddSheetsResponse",
     "SheetsAppendValuesData",
     "SheetsAppendValuesResponse",
+    "SheetsBatchReadValuesData",
+    "SheetsBatchReadValuesResponse",
+    "SheetsBatchWriteValuesData",
+    "SheetsBatchWriteValuesResponse",
     "SheetsClearValuesData",
     "SheetsClearValuesResponse",
     "SheetsCreateData",
     "SheetsCreateResponse",
     "SheetsGetInfoData",
+    "SheetsGetInfoError",
+    "SheetsGetInfoManyData",
+    "SheetsGetInfoManyResponse",
     "SheetsGetInfoResponse",
     "SheetsListData",
     "SheetsListResponse",
@@ -289,15 +318,20 @@ __all__ = [
     "SlideAdded",
     "SlideElement",
     "SlideInfo",
+    "SlidesAddManyTextResponse",
     "SlidesAddSlideResponse",
     "SlidesAddTextResponse",
     "SlidesCreatePresentationResponse",
+    "SlidesGetAllThumbnailsResponse",
     "SlidesGetPresentationResponse",
     "SlidesGetThumbnailResponse",
     "SlidesListData",
     "SlidesListPresentationsResponse",
     "SlideThumbnail",
+    "SlideThumbnailError",
+    "SlideThumbnailsData",
     "TextAdded",
+    "TextsAddedData",
     # Maps
     "DirectionRoute",
     "DirectionStep",
@@ -40,6 +40,23 @@ class GmailSearchData(BaseModel):
     total: int = Field(..., description="Total number of messages")
 
 
+class GmailReadBatchError(BaseModel):
+    """A message that could not be read in a batch."""
+
+    id: str = Field(..., description="Message ID")
+    error: str = Field(..., description="Error message")
+
+
+class GmailReadBatchData(BaseModel):
+    """Output data for google_gmail_read_batch tool."""
+
+    messages: list[GmailMessageFull] = Field(..., description="Messages read")
+    errors: list[GmailReadBatchError] = Field(
+        default_factory=list, description="Messages that could not be read"
+    )
+    total: int = Field(..., description="Number of messages read")
+
+
 class GmailSendData(BaseModel):
     """Output data for google_gmail_send tool."""
 
@@ -95,6 +112,12 @@ class GmailReadResponse(ToolResponse[GmailMessageFull]):
     pass
 
 
+class GmailReadBatchResponse(ToolResponse[GmailReadBatchData]):
+    """Response for google_gmail_read_batch tool."""
+
+    pass
+
+
 class GmailSendResponse(ToolResponse[GmailSendData]):
     """Response for google_gmail_send tool."""
 
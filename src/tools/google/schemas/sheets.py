@@ -43,6 +43,25 @@ class SheetsGetInfoData(BaseModel):
     web_link: str = Field("", description="Web view link")
 
 
+class SheetsGetInfoError(BaseModel):
+    """A spreadsheet whose metadata could not be read."""
+
+    id: str = Field(..., description="Spreadsheet ID")
+    error: str = Field(..., description="Error message")
+
+
+class SheetsGetInfoManyData(BaseModel):
+    """Output data for google_sheets_get_info_many tool."""
+
+    spreadsheets: list[SheetsGetInfoData] = Field(
+        ..., description="Spreadsheet info, in request order"
+    )
+    errors: list[SheetsGetInfoError] = Field(
+        default_factory=list, description="Spreadsheets that could not be read"
+    )
+    total: int = Field(..., description="Number of spreadsheets read")
+
+
 class SheetsReadValuesData(BaseModel):
     """Output data for google_sheets_read_values tool."""
 
@@ -52,6 +71,16 @@ class SheetsReadValuesData(BaseModel):
     column_count: int = Field(..., description="Number of columns")
 
 
+class SheetsBatchReadValuesData(BaseModel):
+    """Output data for google_sheets_batch_read_values tool."""
+
+    spreadsheet_id: str = Field(..., description="Spreadsheet ID")
+    value_ranges: list[SheetsReadValuesData] = Field(
+        ..., description="Values for each requested range, in request order"
+    )
+    total: int = Field(..., description="Number of ranges read")
+
+
 class SheetsWriteValuesData(BaseModel):
     """Output data for google_sheets_write_values tool."""
 
@@ -61,6 +90,16 @@ class SheetsWriteValuesData(BaseModel):
     updated_cells: int = Field(0, description="Total cells updated")
 
 
+class SheetsBatchWriteValuesData(BaseModel):
+    """Output data for google_sheets_batch_write_values tool."""
+
+    spreadsheet_id: str = Field(..., description="Spreadsheet ID")
+    updated_ranges: list[str] = Field(..., description="Ranges that were updated")
+    total_updated_rows: int = Field(0, description="Number of rows updated")
+    total_updated_columns: int = Field(0, description="Number of columns updated")
+    total_updated_cells: int = Field(0, description="Total cells updated")
+
+
 class SheetsAppendValuesData(BaseModel):
     """Output data for google_sheets_append_values tool."""
 
@@ -86,6 +125,13 @@ class SheetsAddSheetData(BaseModel):
     spreadsheet_id: str = Field(..., description="Parent spreadsheet ID")
 
 
+class SheetsAddSheetsData(BaseModel):
+    """Output data for google_sheets_add_sheets tool."""
+
+    sheets: list[SheetsAddSheetData] = Field(..., description="Sheets that were added")
+    total: int = Field(..., description="Number of sheets added")
+
+
 class SheetsClearValuesData(BaseModel):
     """Output data for google_sheets_clear_values tool."""
 
@@ -106,18 +152,36 @@ class SheetsGetInfoResponse(ToolResponse[SheetsGetInfoData]):
     pass
 
 
+class SheetsGetInfoManyResponse(ToolResponse[SheetsGetInfoManyData]):
+    """Response for google_sheets_get_info_many tool."""
+
+    pass
+
+
 class SheetsReadValuesResponse(ToolResponse[SheetsReadValuesData]):
     """Response for google_sheets_read_values tool."""
 
     pass
 
 
+class SheetsBatchReadValuesResponse(ToolResponse[SheetsBatchReadValuesData]):
+    """Response for google_sheets_batch_read_values tool."""
+
+    pass
+
+
 class SheetsWriteValuesResponse(ToolResponse[SheetsWriteValuesData]):
     """Response for google_sheets_write_values tool."""
 
     pass
 
 
+class SheetsBatchWriteValuesResponse(ToolResponse[SheetsBatchWriteValuesData]):
+    """Response for google_sheets_batch_write_values tool."""
+
+    pass
+
+
 class SheetsAppendValuesResponse(ToolResponse[SheetsAppendValuesData]):
     """Response for google_sheets_append_values tool."""
 
@@ -136,6 +200,12 @@ class SheetsAddSheetResponse(ToolResponse[SheetsAddSheetData]):
     pass
 
 
+class SheetsAddSheetsResponse(ToolResponse[SheetsAddSheetsData]):
+    """Response for google_sheets_add_sheets tool."""
+
+    pass
+
+
 class SheetsClearValuesResponse(ToolResponse[SheetsClearValuesData]):
     """Response for google_sheets_clear_values tool."""
 
@@ -66,6 +66,14 @@ class TextAdded(BaseModel):
     text: str = Field("", description="Text content")
 
 
+class TextsAddedData(BaseModel):
+    """Output data for google_slides_add_many_text tool."""
+
+    presentation_id: str = Field(..., description="Presentation ID")
+    texts: list[TextAdded] = Field(..., description="Created text boxes, in order")
+    total: int = Field(..., description="Number of text boxes created")
+
+
 class SlideThumbnail(BaseModel):
     """Slide thumbnail information."""
 
@@ -75,6 +83,26 @@ class SlideThumbnail(BaseModel):
     height: int = Field(0, description="Thumbnail height")
 
 
+class SlideThumbnailError(BaseModel):
+    """A slide whose thumbnail could not be generated."""
+
+    slide_id: str = Field(..., description="Slide ID")
+    error: str = Field(..., description="Error message")
+
+
+class SlideThumbnailsData(BaseModel):
+    """Output data for google_slides_get_all_thumbnails tool."""
+
+    presentation_id: str = Field(..., description="Presentation ID")
+    thumbnails: list[SlideThumbnail] = Field(
+        ..., description="Thumbnails, in slide order"
+    )
+    errors: list[SlideThumbnailError] = Field(
+        default_factory=list, description="Slides whose thumbnail failed"
+    )
+    total: int = Field(..., description="Number of thumbnails returned")
+
+
 class SlidesListData(BaseModel):
     """Output data for google_slides_list_presentations tool."""
 
@@ -115,7 +143,19 @@ class SlidesAddTextResponse(ToolResponse[TextAdded]):
     pass
 
 
+class SlidesAddManyTextResponse(ToolResponse[TextsAddedData]):
+    """Response for google_slides_add_many_text tool."""
+
+    pass
+
+
 class SlidesGetThumbnailResponse(ToolResponse[SlideThumbnail]):
     """Response for google_slides_get_thumbnail tool."""
 
     pass
+
+
+class SlidesGetAllThumbnailsResponse(ToolResponse[SlideThumbnailsData]):
+    """Response for google_slides_get_all_thumbnails tool."""
+
+    pass
@@ -2,154 +2,504 @@
 
 import asyncio
 import logging
+from typing import Any
 
 from src.humcp.decorator import tool
-from src.tools.google.auth import get_google_service_from_mcp
+from src.tools.google.auth import (
+    credentials_cache_key,
+    execute_async,
+    execute_batch,
+    get_google_service_from_mcp,
+    gzip_request,
+    log_tool_error,
+    run_blocking,
+)
+from src.tools.google.cache import TTLCache
+from src.tools.google.rate_limit import AsyncTokenBucket
 
 logger = logging.getLogger("humcp.tools.google.sheets")
 
+# Spreadsheet metadata keyed by (user, spreadsheet_id)
+_INFO_CACHE = TTLCache(maxsize=256, ttl=120)
+
+# Spreadsheet listings keyed by (user, max_results)
+_LIST_CACHE = TTLCache(maxsize=64, ttl=30)
+
+# Partial response mask for spreadsheet metadata: only the fields _info_data reads
+INFO_FIELDS = (
+    "spreadsheetId,properties(title,locale),spreadsheetUrl,"
+    "sheets(properties(sheetId,title,index,gridProperties(rowCount,columnCount)))"
+)
+
+# Drive query matching the user's non-trashed spreadsheets
+SPREADSHEETS_QUERY = (
+    "mimeType='application/vnd.google-apps.spreadsheet' and trashed=false"
+)
+
+# Shared read-only default for missing nested properties
+_EMPTY: dict = {}
+
+# Maximum number of ranges sent in a single values.batchGet request
+BATCH_GET_MAX_RANGES = 100
+
+# Accepted valueInputOption values for writes. RAW stores values as given and
+# skips Google's formula and type parsing, which is cheaper on large writes.
+VALUE_INPUT_OPTIONS = ("USER_ENTERED", "RAW")
+
+# Sheets allows 60 write requests per minute per user; stay just under it
+WRITE_RATE_PER_MINUTE = 55
+
+# Write token buckets keyed by user
+_WRITE_BUCKETS = TTLCache(maxsize=256, ttl=300)
+
+
+def _invalidate_info(spreadsheet_id: str) -> None:
+    """Drop cached metadata for a spreadsheet after it was modified."""
+    _INFO_CACHE.invalidate(lambda key: key[1] == spreadsheet_id)
+
+
+async def _throttle_write(service) -> None:
+    """Wait until the user's write quota allows another request."""
+    user_key = credentials_cache_key(service)
+    bucket = _WRITE_BUCKETS.get(user_key)
+    if bucket is None:
+        bucket = AsyncTokenBucket(
+            rate=WRITE_RATE_PER_MINUTE / 60, capacity=WRITE_RATE_PER_MINUTE
+        )
+    _WRITE_BUCKETS.set(user_key, bucket)
+    await bucket.acquire()
+
+
+def _invalid_input_option(input_option: str) -> dict | None:
+    """Return an error response if input_option is not a valueInputOption."""
+    if input_option in VALUE_INPUT_OPTIONS:
+        return None
+    return {
+        "success": False,
+        "error": f"input_option must be one of {', '.join(VALUE_INPUT_OPTIONS)}",
+    }
+
+
+def _values_data(value_range: dict) -> dict:
+    """Convert a ValueRange response into the tool output shape."""
+    values = value_range.get("values", [])
+    return {
+        "range": value_range.get("range", ""),
+        "rows": values,
+        "row_count": len(values),
+        "column_count": max(map(len, values), default=0),
+    }
+
+
+async def _list_spreadsheets(service, max_results: int) -> dict:
+    """List recent spreadsheets through the Drive API."""
+    results = await execute_async(
+        service.files().list(
+            q=SPREADSHEETS_QUERY,
+            pageSize=max_results,
+            fields="files(id, name, modifiedTime, webViewLink)",
+            orderBy="modifiedTime desc",
+        )
+    )
+    files = results.get("files", [])
+    return {
+        "spreadsheets": [
+            {
+                "id": f["id"],
+                "name": f["name"],
+                "modified": f.get("modifiedTime", ""),
+                "web_link": f.get("webViewLink", ""),
+            }
+            for f in files
+        ],
+        "total": len(files),
+    }
+
 
 @tool()
-async def google_sheets_list_spreadsheets(max_results: int = 25) -> dict:
+async def google_sheets_list_spreadsheets(
+    max_results: int = 25, force_refresh: bool = False
+) -> dict:
     """List Google Spreadsheets accessible to the user.
 
-    Returns recent spreadsheets ordered by modification time.
+    Returns recent spreadsheets ordered by modification time. Results are
+    cached for 30 seconds per user.
 
     Args:
         max_results: Maximum number of spreadsheets to return (default: 25).
+        force_refresh: Bypass the cache and list spreadsheets from Google (default: False).
 
     Returns:
         List of spreadsheets with id, name, modified date, and web_link.
     """
     try:
-
-        def _list():
-            service = get_google_service_from_mcp("drive", "v3")
-            query = (
-                "mimeType='application/vnd.google-apps.spreadsheet' and trashed=false"
-            )
-            results = (
-                service.files()
-                .list(
-                    q=query,
-                    pageSize=max_results,
-                    fields="files(id, name, modifiedTime, webViewLink)",
-                    orderBy="modifiedTime desc",
-                )
-                .execute()
-            )
-            files = results.get("files", [])
-            return {
-                "spreadsheets": [
-                    {
-                        "id": f["id"],
-                        "name": f["name"],
-                        "modified": f.get("modifiedTime", ""),
-                        "web_link": f.get("webViewLink", ""),
-                    }
-                    for f in files
-                ],
-                "total": len(files),
-            }
-
-        logger.info("sheets_list_spreadsheets")
-        result = await asyncio.to_thread(_list)
+        logger.info("sheets_list_spreadsheets force_refresh=%s", force_refresh)
+        service = get_google_service_from_mcp("drive", "v3")
+        cache_key = (credentials_cache_key(service), max_results)
+        if not force_refresh:
+            cached = _LIST_CACHE.get(cache_key)
+            if cached is not None:
+                logger.debug("sheets_list_spreadsheets cache hit")
+                return {"success": True, "data": cached}
+
+        result = await _list_spreadsheets(service, max_results)
+        _LIST_CACHE.set(cache_key, result)
         return {"success": True, "data": result}
     except Exception as e:
-        logger.exception("sheets_list_spreadsheets failed")
+        log_tool_error(logger, "sheets_list_spreadsheets", e)
         return {"success": False, "error": str(e)}
 
 
+def _info_data(spreadsheet: dict) -> dict:
+    """Summarize spreadsheet metadata and each of its sheets."""
+    properties = spreadsheet.get("properties", {})
+    sheets = []
+    for sheet in spreadsheet.get("sheets", []):
+        sheet_props = sheet["properties"]
+        grid = sheet_props.get("gridProperties", _EMPTY)
+        sheets.append(
+            {
+                "id": sheet_props["sheetId"],
+                "title": sheet_props["title"],
+                "index": sheet_props["index"],
+                "row_count": grid.get("rowCount", 0),
+                "column_count": grid.get("columnCount", 0),
+            }
+        )
+    return {
+        "id": spreadsheet["spreadsheetId"],
+        "title": properties.get("title", ""),
+        "locale": properties.get("locale", ""),
+        "sheets": sheets,
+        "web_link": spreadsheet.get("spreadsheetUrl", ""),
+    }
+
+
 @tool()
-async def google_sheets_get_info(spreadsheet_id: str) -> dict:
+async def google_sheets_get_info(
+    spreadsheet_id: str, force_refresh: bool = False
+) -> dict:
     """Get metadata about a spreadsheet.
 
     Returns information about all sheets in the spreadsheet including dimensions.
+    Results are cached for a couple of minutes per user and spreadsheet.
 
     Args:
         spreadsheet_id: ID of the spreadsheet.
+        force_refresh: Bypass the cache and fetch metadata from Google (default: False).
 
     Returns:
         Spreadsheet info with id, title, locale, sheets list, and web_link.
     """
     try:
+        logger.info(
+            "sheets_get_info id=%s force_refresh=%s", spreadsheet_id, force_refresh
+        )
+        service = get_google_service_from_mcp("sheets", "v3")
+        cache_key = (credentials_cache_key(service), spreadsheet_id)
+        if not force_refresh:
+            cached = _INFO_CACHE.get(cache_key)
+            if cached is not None:
+                logger.debug("sheets_get_info cache hit id=%s", spreadsheet_id)
+                return {"success": True, "data": cached}
+
+        spreadsheet = await execute_async(
+            service.spreadsheets().get(spreadsheetId=spreadsheet_id, fields=INFO_FIELDS)
+        )
+        result = _info_data(spreadsheet)
+        _INFO_CACHE.set(cache_key, result)
+        return {"success": True, "data": result}
+    except Exception as e:
+        log_tool_error(logger, "sheets_get_info", e)
+        return {"success": False, "error": str(e)}
+
+
+@tool()
+async def google_sheets_get_info_many(
+    spreadsheet_ids: list[str], force_refresh: bool = False
+) -> dict:
+    """Get metadata about several spreadsheets at once.
+
+    Spreadsheets missing from the cache are fetched with Google batch requests
+    (up to 100 spreadsheets per HTTP request) instead of one call each.
+
+    Args:
+        spreadsheet_ids: IDs of the spreadsheets.
+        force_refresh: Bypass the cache and fetch metadata from Google (default: False).
 
-        def _get():
-            service = get_google_service_from_mcp("sheets", "v3")
-            spreadsheet = (
-                service.spreadsheets().get(spreadsheetId=spreadsheet_id).execute()
+    Returns:
+        Spreadsheet info (as in google_sheets_get_info) in request order, and
+        errors for spreadsheets that could not be read.
+    """
+    try:
+        spreadsheet_ids = list(dict.fromkeys(spreadsheet_ids))
+        logger.info(
+            "sheets_get_info_many count=%s force_refresh=%s",
+            len(spreadsheet_ids),
+            force_refresh,
+        )
+        service = get_google_service_from_mcp("sheets", "v3")
+        user_key = credentials_cache_key(service)
+
+        infos: dict[str, dict] = {}
+        if not force_refresh:
+            for spreadsheet_id in spreadsheet_ids:
+                cached = _INFO_CACHE.get((user_key, spreadsheet_id))
+                if cached is not None:
+                    infos[spreadsheet_id] = cached
+
+        missing = [i for i in spreadsheet_ids if i not in infos]
+        errors: dict[str, str] = {}
+        if missing:
+            responses, errors = await run_blocking(
+                execute_batch,
+                service,
+                [
+                    (i, service.spreadsheets().get(spreadsheetId=i, fields=INFO_FIELDS))
+                    for i in missing
+                ],
             )
-            sheets = spreadsheet.get("sheets", [])
-            return {
-                "id": spreadsheet["spreadsheetId"],
-                "title": spreadsheet.get("properties", {}).get("title", ""),
-                "locale": spreadsheet.get("properties", {}).get("locale", ""),
-                "sheets": [
-                    {
-                        "id": s["properties"]["sheetId"],
-                        "title": s["properties"]["title"],
-                        "index": s["properties"]["index"],
-                        "row_count": s["properties"]
-                        .get("gridProperties", {})
-                        .get("rowCount", 0),
-                        "column_count": s["properties"]
-                        .get("gridProperties", {})
-                        .get("columnCount", 0),
-                    }
-                    for s in sheets
+            for spreadsheet_id, spreadsheet in responses.items():
+                infos[spreadsheet_id] = _info_data(spreadsheet)
+                _INFO_CACHE.set((user_key, spreadsheet_id), infos[spreadsheet_id])
+
+        return {
+            "success": True,
+            "data": {
+                "spreadsheets": [infos[i] for i in spreadsheet_ids if i in infos],
+                "errors": [
+                    {"id": i, "error": errors[i]}
+                    for i in spreadsheet_ids
+                    if i in errors
                 ],
-                "web_link": spreadsheet.get("spreadsheetUrl", ""),
-            }
-
-        logger.info("sheets_get_info id=%s", spreadsheet_id)
-        result = await asyncio.to_thread(_get)
-        return {"success": True, "data": result}
+                "total": len(infos),
+            },
+        }
     except Exception as e:
-        logger.exception("sheets_get_info failed")
+        log_tool_error(logger, "sheets_get_info_many", e)
         return {"success": False, "error": str(e)}
 
 
+async def _read_values(
+    service,
+    spreadsheet_id: str,
+    range_notation: str,
+    render_option: str,
+    major_dimension: str,
+) -> dict:
+    """Read a single range."""
+    result = await execute_async(
+        service.spreadsheets()
+        .values()
+        .get(
+            spreadsheetId=spreadsheet_id,
+            range=range_notation,
+            valueRenderOption=render_option,
+            majorDimension=major_dimension,
+        )
+    )
+    return _values_data(result)
+
+
 @tool()
 async def google_sheets_read_values(
-    spreadsheet_id: str, range_notation: str = "Sheet1"
+    spreadsheet_id: str,
+    range_notation: str = "Sheet1",
+    value_render_option: str = "FORMATTED_VALUE",
+    major_dimension: str = "ROWS",
 ) -> dict:
     """Read values from a spreadsheet range.
 
-    Reads cell values from the specified range using A1 notation.
+    Reads cell values from the specified range using A1 notation. Use
+    "UNFORMATTED_VALUE" for numeric data: numbers come back as native ints and
+    floats instead of locale-formatted strings, which also shrinks the response.
 
     Args:
         spreadsheet_id: ID of the spreadsheet.
         range_notation: Range in A1 notation (default: "Sheet1", e.g., "Sheet1!A1:D10").
+        value_render_option: How values are rendered ("FORMATTED_VALUE",
+            "UNFORMATTED_VALUE", or "FORMULA"; default: "FORMATTED_VALUE").
+        major_dimension: "ROWS" or "COLUMNS" - whether the outer list holds
+            rows or columns (default: "ROWS").
 
     Returns:
         Values with range, rows (2D array), row_count, and column_count.
     """
     try:
+        logger.info("sheets_read_values id=%s range=%s", spreadsheet_id, range_notation)
+        service = get_google_service_from_mcp("sheets", "v3")
+        result = await _read_values(
+            service,
+            spreadsheet_id,
+            range_notation,
+            value_render_option,
+            major_dimension,
+        )
+        return {"success": True, "data": result}
+    except Exception as e:
+        log_tool_error(logger, "sheets_read_values", e)
+        return {"success": False, "error": str(e)}
 
-        def _read():
-            service = get_google_service_from_mcp("sheets", "v3")
-            result = (
-                service.spreadsheets()
-                .values()
-                .get(spreadsheetId=spreadsheet_id, range=range_notation)
-                .execute()
-            )
-            values = result.get("values", [])
+
+def _quote_sheet_title(sheet_title: str) -> str:
+    """Quote a sheet title for use in A1 notation."""
+    return "'" + sheet_title.replace("'", "''") + "'"
+
+
+@tool()
+async def google_sheets_read_new_rows(
+    spreadsheet_id: str,
+    sheet_title: str,
+    last_row_seen: int = 0,
+    max_rows: int = 1000,
+) -> dict:
+    """Read only the rows added to a sheet since a previous read.
+
+    Intended for polling a sheet that grows by appended rows: pass the
+    new_last_row returned by the previous call as last_row_seen, so each poll
+    transfers only the new rows instead of the whole sheet. Values are
+    returned unformatted (numbers as native ints and floats).
+
+    Args:
+        spreadsheet_id: ID of the spreadsheet.
+        sheet_title: Title of the sheet tab (e.g., "Sheet1").
+        last_row_seen: Number of the last row already read; 0 reads from the
+            first row (default: 0).
+        max_rows: Maximum number of rows returned per call (default: 1000).
+
+    Returns:
+        New rows with range, rows (2D array), row_count, column_count, and
+        new_last_row to pass as last_row_seen on the next call.
+    """
+    try:
+        if last_row_seen < 0 or max_rows < 1:
             return {
-                "range": result.get("range", ""),
-                "rows": values,
-                "row_count": len(values),
-                "column_count": max(len(row) for row in values) if values else 0,
+                "success": False,
+                "error": "last_row_seen must be >= 0 and max_rows must be >= 1",
             }
 
-        logger.info("sheets_read_values id=%s range=%s", spreadsheet_id, range_notation)
-        result = await asyncio.to_thread(_read)
+        logger.info(
+            "sheets_read_new_rows id=%s sheet=%s last_row_seen=%s",
+            spreadsheet_id,
+            sheet_title,
+            last_row_seen,
+        )
+        first_row = last_row_seen + 1
+        range_notation = (
+            f"{_quote_sheet_title(sheet_title)}!{first_row}:{last_row_seen + max_rows}"
+        )
+        service = get_google_service_from_mcp("sheets", "v3")
+        result = await _read_values(
+            service, spreadsheet_id, range_notation, "UNFORMATTED_VALUE", "ROWS"
+        )
+        result["new_last_row"] = last_row_seen + result["row_count"]
         return {"success": True, "data": result}
     except Exception as e:
-        logger.exception("sheets_read_values failed")
+        log_tool_error(logger, "sheets_read_new_rows", e)
+        return {"success": False, "error": str(e)}
+
+
+async def _batch_get_values(
+    service, spreadsheet_id: str, ranges: list[str], render_option: str
+) -> list[dict]:
+    """Read up to BATCH_GET_MAX_RANGES ranges in one values.batchGet request."""
+    result = await execute_async(
+        service.spreadsheets()
+        .values()
+        .batchGet(
+            spreadsheetId=spreadsheet_id,
+            ranges=ranges,
+            valueRenderOption=render_option,
+        )
+    )
+    return [_values_data(vr) for vr in result.get("valueRanges", [])]
+
+
+@tool()
+async def google_sheets_batch_read_values(
+    spreadsheet_id: str,
+    ranges: list[str],
+    render_option: str = "FORMATTED_VALUE",
+    max_concurrency: int = 8,
+) -> dict:
+    """Read values from several ranges of a spreadsheet at once.
+
+    Ranges are fetched with a single values.batchGet request per 100 ranges
+    instead of one request per range. Larger lists are split into chunks that
+    are fetched concurrently; if any chunk fails, the others are cancelled.
+
+    Args:
+        spreadsheet_id: ID of the spreadsheet.
+        ranges: Ranges in A1 notation (e.g., ["Sheet1!A1:D10", "Summary"]).
+        render_option: How values are rendered ("FORMATTED_VALUE",
+            "UNFORMATTED_VALUE", or "FORMULA").
+        max_concurrency: Maximum number of chunks fetched at once (default: 8).
+
+    Returns:
+        Values for each range (in request order) and the number of ranges read.
+    """
+    try:
+        service = get_google_service_from_mcp("sheets", "v3")
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def _fetch(chunk: list[str]) -> list[dict]:
+            async with semaphore:
+                return await _batch_get_values(
+                    service, spreadsheet_id, chunk, render_option
+                )
+
+        logger.info(
+            "sheets_batch_read_values id=%s ranges=%s", spreadsheet_id, len(ranges)
+        )
+        chunks = [
+            ranges[i : i + BATCH_GET_MAX_RANGES]
+            for i in range(0, len(ranges), BATCH_GET_MAX_RANGES)
+        ]
+        # A failed chunk cancels the ones still pending instead of spending
+        # quota on a result that will be discarded anyway.
+        try:
+            async with asyncio.TaskGroup() as tg:
+                tasks = [tg.create_task(_fetch(chunk)) for chunk in chunks]
+        except ExceptionGroup as eg:
+            raise eg.exceptions[0] from None
+        value_ranges = [vr for task in tasks for vr in task.result()]
+        return {
+            "success": True,
+            "data": {
+                "spreadsheet_id": spreadsheet_id,
+                "value_ranges": value_ranges,
+                "total": len(value_ranges),
+            },
+        }
+    except Exception as e:
+        log_tool_error(logger, "sheets_batch_read_values", e)
         return {"success": False, "error": str(e)}
 
 
+async def _write_values(
+    service, spreadsheet_id: str, range_notation: str, values: list, input_option: str
+) -> dict:
+    """Overwrite a range with values."""
+    request = (
+        service.spreadsheets()
+        .values()
+        .update(
+            spreadsheetId=spreadsheet_id,
+            range=range_notation,
+            valueInputOption=input_option,
+            body={"values": values},
+        )
+    )
+    await _throttle_write(service)
+    result = await execute_async(gzip_request(request))
+    return {
+        "updated_range": result.get("updatedRange", ""),
+        "updated_rows": result.get("updatedRows", 0),
+        "updated_columns": result.get("updatedColumns", 0),
+        "updated_cells": result.get("updatedCells", 0),
+    }
+
+
 @tool()
 async def google_sheets_write_values(
     spreadsheet_id: str,
@@ -159,50 +509,124 @@ async def google_sheets_write_values(
 ) -> dict:
     """Write values to a spreadsheet range.
 
-    Updates cells in the specified range with the provided values.
+    Updates cells in the specified range with the provided values. For large
+    writes of already-typed data (numbers, booleans, plain text), use "RAW":
+    values are stored as given, skipping Google's formula and type parsing.
 
     Args:
         spreadsheet_id: ID of the spreadsheet.
         range_notation: Range in A1 notation (e.g., "Sheet1!A1:D10").
         values: 2D array of values to write.
-        input_option: How to interpret input ("USER_ENTERED" or "RAW").
+        input_option: How to interpret input - "USER_ENTERED" parses formulas,
+            dates, and numbers as if typed in the UI; "RAW" stores values as
+            given (default: "USER_ENTERED").
 
     Returns:
         Update result with updated_range, updated_rows, updated_columns, updated_cells.
     """
+    if error := _invalid_input_option(input_option):
+        return error
+
     try:
+        logger.info(
+            "sheets_write_values id=%s range=%s", spreadsheet_id, range_notation
+        )
+        service = get_google_service_from_mcp("sheets", "v3")
+        result = await _write_values(
+            service, spreadsheet_id, range_notation, values, input_option
+        )
+        return {"success": True, "data": result}
+    except Exception as e:
+        log_tool_error(logger, "sheets_write_values", e)
+        return {"success": False, "error": str(e)}
 
-        def _write():
-            service = get_google_service_from_mcp("sheets", "v3")
-            body = {"values": values}
-            result = (
-                service.spreadsheets()
-                .values()
-                .update(
-                    spreadsheetId=spreadsheet_id,
-                    range=range_notation,
-                    valueInputOption=input_option,
-                    body=body,
-                )
-                .execute()
-            )
-            return {
-                "updated_range": result.get("updatedRange", ""),
-                "updated_rows": result.get("updatedRows", 0),
-                "updated_columns": result.get("updatedColumns", 0),
-                "updated_cells": result.get("updatedCells", 0),
-            }
 
+async def _batch_write_values(
+    service, spreadsheet_id: str, data: list[dict], input_option: str
+) -> dict:
+    """Write several ranges with one values.batchUpdate request."""
+    body = {
+        "valueInputOption": input_option,
+        "data": [{"range": d["range"], "values": d["values"]} for d in data],
+    }
+    request = (
+        service.spreadsheets()
+        .values()
+        .batchUpdate(spreadsheetId=spreadsheet_id, body=body)
+    )
+    await _throttle_write(service)
+    result = await execute_async(gzip_request(request))
+    return {
+        "spreadsheet_id": spreadsheet_id,
+        "updated_ranges": [
+            r.get("updatedRange", "") for r in result.get("responses", [])
+        ],
+        "total_updated_rows": result.get("totalUpdatedRows", 0),
+        "total_updated_columns": result.get("totalUpdatedColumns", 0),
+        "total_updated_cells": result.get("totalUpdatedCells", 0),
+    }
+
+
+@tool()
+async def google_sheets_batch_write_values(
+    spreadsheet_id: str,
+    data: list[dict],
+    input_option: str = "USER_ENTERED",
+) -> dict:
+    """Write values to several spreadsheet ranges at once.
+
+    Updates all ranges with a single values.batchUpdate request instead of
+    one request per range.
+
+    Args:
+        spreadsheet_id: ID of the spreadsheet.
+        data: Ranges to write, each a dict with "range" (A1 notation) and
+            "values" (2D array), e.g. [{"range": "Sheet1!A1", "values": [[1, 2]]}].
+        input_option: How to interpret input ("USER_ENTERED" or "RAW").
+
+    Returns:
+        Update result with updated_ranges and total updated rows, columns, and cells.
+    """
+    if error := _invalid_input_option(input_option):
+        return error
+
+    try:
         logger.info(
-            "sheets_write_values id=%s range=%s", spreadsheet_id, range_notation
+            "sheets_batch_write_values id=%s ranges=%s", spreadsheet_id, len(data)
         )
-        result = await asyncio.to_thread(_write)
+        service = get_google_service_from_mcp("sheets", "v3")
+        result = await _batch_write_values(service, spreadsheet_id, data, input_option)
         return {"success": True, "data": result}
     except Exception as e:
-        logger.exception("sheets_write_values failed")
+        log_tool_error(logger, "sheets_batch_write_values", e)
         return {"success": False, "error": str(e)}
 
 
+async def _append_values(
+    service, spreadsheet_id: str, range_notation: str, values: list, input_option: str
+) -> dict:
+    """Append rows after the data in a range."""
+    request = (
+        service.spreadsheets()
+        .values()
+        .append(
+            spreadsheetId=spreadsheet_id,
+            range=range_notation,
+            valueInputOption=input_option,
+            insertDataOption="INSERT_ROWS",
+            body={"values": values},
+        )
+    )
+    await _throttle_write(service)
+    result = await execute_async(gzip_request(request))
+    updates = result.get("updates", {})
+    return {
+        "updated_range": updates.get("updatedRange", ""),
+        "updated_rows": updates.get("updatedRows", 0),
+        "updated_cells": updates.get("updatedCells", 0),
+    }
+
+
 @tool()
 async def google_sheets_append_values(
     spreadsheet_id: str,
@@ -223,40 +647,45 @@ async def google_sheets_append_values(
     Returns:
         Append result with updated_range, updated_rows, updated_cells.
     """
-    try:
-
-        def _append():
-            service = get_google_service_from_mcp("sheets", "v3")
-            body = {"values": values}
-            result = (
-                service.spreadsheets()
-                .values()
-                .append(
-                    spreadsheetId=spreadsheet_id,
-                    range=range_notation,
-                    valueInputOption=input_option,
-                    insertDataOption="INSERT_ROWS",
-                    body=body,
-                )
-                .execute()
-            )
-            updates = result.get("updates", {})
-            return {
-                "updated_range": updates.get("updatedRange", ""),
-                "updated_rows": updates.get("updatedRows", 0),
-                "updated_cells": updates.get("updatedCells", 0),
-            }
+    if error := _invalid_input_option(input_option):
+        return error
 
+    try:
         logger.info(
             "sheets_append_values id=%s range=%s", spreadsheet_id, range_notation
         )
-        result = await asyncio.to_thread(_append)
+        service = get_google_service_from_mcp("sheets", "v3")
+        result = await _append_values(
+            service, spreadsheet_id, range_notation, values, input_option
+        )
+        _invalidate_info(spreadsheet_id)
         return {"success": True, "data": result}
     except Exception as e:
-        logger.exception("sheets_append_values failed")
+        log_tool_error(logger, "sheets_append_values", e)
         return {"success": False, "error": str(e)}
 
 
+async def _create_spreadsheet(
+    service, title: str, sheet_names: list[str] | None
+) -> dict:
+    """Create a spreadsheet with optional named sheets."""
+
+    body: dict[str, Any] = {"properties": {"title": title}}
+
+    if sheet_names:
+        body["sheets"] = [{"properties": {"title": name}} for name in sheet_names]
+
+    await _throttle_write(service)
+    spreadsheet = await execute_async(service.spreadsheets().create(body=body))
+
+    return {
+        "id": spreadsheet["spreadsheetId"],
+        "title": spreadsheet.get("properties", {}).get("title", ""),
+        "sheets": [s["properties"]["title"] for s in spreadsheet.get("sheets", [])],
+        "web_link": spreadsheet.get("spreadsheetUrl", ""),
+    }
+
+
 @tool()
 async def google_sheets_create_spreadsheet(
     title: str, sheet_names: list[str] | None = None
@@ -273,36 +702,41 @@ async def google_sheets_create_spreadsheet(
         Created spreadsheet with id, title, sheets list, and web_link.
     """
     try:
-
-        def _create():
-            service = get_google_service_from_mcp("sheets", "v3")
-
-            body = {"properties": {"title": title}}
-
-            if sheet_names:
-                body["sheets"] = [
-                    {"properties": {"title": name}} for name in sheet_names
-                ]
-
-            spreadsheet = service.spreadsheets().create(body=body).execute()
-
-            return {
-                "id": spreadsheet["spreadsheetId"],
-                "title": spreadsheet.get("properties", {}).get("title", ""),
-                "sheets": [
-                    s["properties"]["title"] for s in spreadsheet.get("sheets", [])
-                ],
-                "web_link": spreadsheet.get("spreadsheetUrl", ""),
-            }
-
         logger.info("sheets_create_spreadsheet title=%s", title)
-        result = await asyncio.to_thread(_create)
+        service = get_google_service_from_mcp("sheets", "v3")
+        result = await _create_spreadsheet(service, title, sheet_names)
+        user_key = credentials_cache_key(service)
+        _LIST_CACHE.invalidate(lambda key: key[0] == user_key)
         return {"success": True, "data": result}
     except Exception as e:
-        logger.exception("sheets_create_spreadsheet failed")
+        log_tool_error(logger, "sheets_create_spreadsheet", e)
         return {"success": False, "error": str(e)}
 
 
+async def _add_sheets(
+    service, spreadsheet_id: str, sheet_titles: list[str]
+) -> list[dict]:
+    """Add sheet tabs with a single spreadsheets.batchUpdate request."""
+    requests = [{"addSheet": {"properties": {"title": t}}} for t in sheet_titles]
+    await _throttle_write(service)
+    result = await execute_async(
+        service.spreadsheets().batchUpdate(
+            spreadsheetId=spreadsheet_id, body={"requests": requests}
+        )
+    )
+    added = []
+    for reply in result.get("replies", []):
+        properties = reply.get("addSheet", {}).get("properties", _EMPTY)
+        added.append(
+            {
+                "sheet_id": properties.get("sheetId"),
+                "title": properties.get("title"),
+                "spreadsheet_id": spreadsheet_id,
+            }
+        )
+    return added
+
+
 @tool()
 async def google_sheets_add_sheet(spreadsheet_id: str, sheet_title: str) -> dict:
     """Add a new sheet to an existing spreadsheet.
@@ -317,30 +751,62 @@ async def google_sheets_add_sheet(spreadsheet_id: str, sheet_title: str) -> dict
         New sheet details with sheet_id, title, and spreadsheet_id.
     """
     try:
-
-        def _add():
-            service = get_google_service_from_mcp("sheets", "v3")
-            request = {"addSheet": {"properties": {"title": sheet_title}}}
-            result = (
-                service.spreadsheets()
-                .batchUpdate(spreadsheetId=spreadsheet_id, body={"requests": [request]})
-                .execute()
-            )
-            new_sheet = result.get("replies", [{}])[0].get("addSheet", {})
-            return {
-                "sheet_id": new_sheet.get("properties", {}).get("sheetId"),
-                "title": new_sheet.get("properties", {}).get("title"),
-                "spreadsheet_id": spreadsheet_id,
-            }
-
         logger.info("sheets_add_sheet id=%s title=%s", spreadsheet_id, sheet_title)
-        result = await asyncio.to_thread(_add)
+        service = get_google_service_from_mcp("sheets", "v3")
+        added = await _add_sheets(service, spreadsheet_id, [sheet_title])
+        _invalidate_info(spreadsheet_id)
+        if added:
+            result = added[0]
+        else:
+            result = {"sheet_id": None, "title": None, "spreadsheet_id": spreadsheet_id}
         return {"success": True, "data": result}
     except Exception as e:
-        logger.exception("sheets_add_sheet failed")
+        log_tool_error(logger, "sheets_add_sheet", e)
+        return {"success": False, "error": str(e)}
+
+
+@tool()
+async def google_sheets_add_sheets(
+    spreadsheet_id: str, sheet_titles: list[str]
+) -> dict:
+    """Add several sheets to an existing spreadsheet in one request.
+
+    Creates all tabs with a single batchUpdate call instead of one call per tab.
+
+    Args:
+        spreadsheet_id: ID of the spreadsheet.
+        sheet_titles: Titles for the new sheets.
+
+    Returns:
+        New sheets with sheet_id, title, and spreadsheet_id, and their count.
+    """
+    try:
+        logger.info(
+            "sheets_add_sheets id=%s count=%s", spreadsheet_id, len(sheet_titles)
+        )
+        service = get_google_service_from_mcp("sheets", "v3")
+        added = await _add_sheets(service, spreadsheet_id, sheet_titles)
+        _invalidate_info(spreadsheet_id)
+        return {"success": True, "data": {"sheets": added, "total": len(added)}}
+    except Exception as e:
+        log_tool_error(logger, "sheets_add_sheets", e)
         return {"success": False, "error": str(e)}
 
 
+async def _clear_values(service, spreadsheet_id: str, range_notation: str) -> dict:
+    """Clear the values of a range."""
+    await _throttle_write(service)
+    result = await execute_async(
+        service.spreadsheets()
+        .values()
+        .clear(spreadsheetId=spreadsheet_id, range=range_notation, body={})
+    )
+    return {
+        "cleared_range": result.get("clearedRange", ""),
+        "spreadsheet_id": spreadsheet_id,
+    }
+
+
 @tool()
 async def google_sheets_clear_values(spreadsheet_id: str, range_notation: str) -> dict:
     """Clear values from a spreadsheet range.
@@ -355,25 +821,12 @@ async def google_sheets_clear_values(spreadsheet_id: str, range_notation: str) -
         Clear result with cleared_range and spreadsheet_id.
     """
     try:
-
-        def _clear():
-            service = get_google_service_from_mcp("sheets", "v3")
-            result = (
-                service.spreadsheets()
-                .values()
-                .clear(spreadsheetId=spreadsheet_id, range=range_notation, body={})
-                .execute()
-            )
-            return {
-                "cleared_range": result.get("clearedRange", ""),
-                "spreadsheet_id": spreadsheet_id,
-            }
-
         logger.info(
             "sheets_clear_values id=%s range=%s", spreadsheet_id, range_notation
         )
-        result = await asyncio.to_thread(_clear)
+        service = get_google_service_from_mcp("sheets", "v3")
+        result = await _clear_values(service, spreadsheet_id, range_notation)
         return {"success": True, "data": result}
     except Exception as e:
-        logger.exception("sheets_clear_values failed")
+        log_tool_error(logger, "sheets_clear_values", e)
         return {"success": False, "error": str(e)}
@@ -1,134 +1,202 @@
 """Google Slides tools for creating and managing presentations."""
 
-import asyncio
 import logging
+import secrets
+from typing import Any
 
 from src.humcp.decorator import tool
-from src.tools.google.auth import get_google_service_from_mcp
+from src.tools.google.auth import (
+    credentials_cache_key,
+    execute_async,
+    execute_batch,
+    get_google_service_from_mcp,
+    log_tool_error,
+    run_blocking,
+)
+from src.tools.google.cache import TTLCache
 
 logger = logging.getLogger("humcp.tools.google.slides")
 
+# Partial response mask for google_slides_get_presentation: only the fields it reads
+PRESENTATION_FIELDS = (
+    "presentationId,title,pageSize,"
+    "slides(objectId,pageElements(shape(text(textElements(textRun(content))))))"
+)
+
+# Drive query matching the user's non-trashed presentations
+PRESENTATIONS_QUERY = (
+    "mimeType='application/vnd.google-apps.presentation' and trashed=false"
+)
+
+# Shared read-only default for missing nested properties
+_EMPTY: dict = {}
+
+# Presentation listings keyed by (user, max_results)
+_LIST_CACHE = TTLCache(maxsize=64, ttl=30)
+
+# Presentation contents keyed by (user, presentation_id)
+_PRESENTATION_CACHE = TTLCache(maxsize=128, ttl=30)
+
+
+def _invalidate_presentation(presentation_id: str) -> None:
+    """Drop cached contents of a presentation after it was modified."""
+    _PRESENTATION_CACHE.invalidate(lambda key: key[1] == presentation_id)
+
+
+async def _list_presentations(service, max_results: int) -> dict:
+    """List recent presentations through the Drive API."""
+    results = await execute_async(
+        service.files().list(
+            q=PRESENTATIONS_QUERY,
+            pageSize=max_results,
+            fields="files(id, name, modifiedTime, webViewLink)",
+            orderBy="modifiedTime desc",
+        )
+    )
+    files = results.get("files", [])
+    return {
+        "presentations": [
+            {
+                "id": f["id"],
+                "name": f["name"],
+                "modified": f.get("modifiedTime", ""),
+                "web_link": f.get("webViewLink", ""),
+            }
+            for f in files
+        ],
+        "total": len(files),
+    }
+
 
 @tool()
-async def google_slides_list_presentations(max_results: int = 25) -> dict:
+async def google_slides_list_presentations(
+    max_results: int = 25, force_refresh: bool = False
+) -> dict:
     """List Google Slides presentations accessible to the user.
 
-    Returns recent presentations ordered by modification time.
+    Returns recent presentations ordered by modification time. Results are
+    cached for 30 seconds per user.
 
     Args:
         max_results: Maximum number of presentations to return (default: 25).
+        force_refresh: Bypass the cache and list presentations from Google (default: False).
 
     Returns:
         List of presentations with id, name, modified date, and web_link.
     """
     try:
-
-        def _list():
-            service = get_google_service_from_mcp("drive", "v3")
-            query = (
-                "mimeType='application/vnd.google-apps.presentation' and trashed=false"
-            )
-            results = (
-                service.files()
-                .list(
-                    q=query,
-                    pageSize=max_results,
-                    fields="files(id, name, modifiedTime, webViewLink)",
-                    orderBy="modifiedTime desc",
-                )
-                .execute()
-            )
-            files = results.get("files", [])
-            return {
-                "presentations": [
-                    {
-                        "id": f["id"],
-                        "name": f["name"],
-                        "modified": f.get("modifiedTime", ""),
-                        "web_link": f.get("webViewLink", ""),
-                    }
-                    for f in files
-                ],
-                "total": len(files),
-            }
-
-        logger.info("slides_list_presentations")
-        result = await asyncio.to_thread(_list)
+        logger.info("slides_list_presentations force_refresh=%s", force_refresh)
+        service = get_google_service_from_mcp("drive", "v3")
+        cache_key = (credentials_cache_key(service), max_results)
+        if not force_refresh:
+            cached = _LIST_CACHE.get(cache_key)
+            if cached is not None:
+                logger.debug("slides_list_presentations cache hit")
+                return {"success": True, "data": cached}
+
+        result = await _list_presentations(service, max_results)
+        _LIST_CACHE.set(cache_key, result)
         return {"success": True, "data": result}
     except Exception as e:
-        logger.exception("slides_list_presentations failed")
+        log_tool_error(logger, "slides_list_presentations", e)
         return {"success": False, "error": str(e)}
 
 
+def _shape_text(element: dict) -> str | None:
+    """Return the stripped text of a shape element, or None if it has no text runs."""
+    text = element.get("shape", _EMPTY).get("text")
+    if text is None:
+        return None
+    runs = [
+        text_element["textRun"].get("content", "")
+        for text_element in text.get("textElements", ())
+        if "textRun" in text_element
+    ]
+    return "".join(runs).strip() if runs else None
+
+
+async def _get_presentation(service, presentation_id: str) -> dict:
+    """Fetch a presentation and extract the text of each slide."""
+    presentation = await execute_async(
+        service.presentations().get(
+            presentationId=presentation_id, fields=PRESENTATION_FIELDS
+        )
+    )
+
+    slides = [
+        {
+            "id": slide["objectId"],
+            "elements": [
+                {"type": "text", "content": content}
+                for element in slide.get("pageElements", ())
+                if (content := _shape_text(element)) is not None
+            ],
+        }
+        for slide in presentation.get("slides", ())
+    ]
+
+    page_size = presentation.get("pageSize", _EMPTY)
+    return {
+        "id": presentation["presentationId"],
+        "title": presentation.get("title", ""),
+        "slide_count": len(slides),
+        "slides": slides,
+        "width": page_size.get("width", _EMPTY).get("magnitude", 0),
+        "height": page_size.get("height", _EMPTY).get("magnitude", 0),
+    }
+
+
 @tool()
-async def google_slides_get_presentation(presentation_id: str) -> dict:
+async def google_slides_get_presentation(
+    presentation_id: str, force_refresh: bool = False
+) -> dict:
     """Get details about a presentation including slides content.
 
-    Returns presentation metadata and text content from all slides.
+    Returns presentation metadata and text content from all slides. Results
+    are cached for 30 seconds per user and presentation.
 
     Args:
         presentation_id: ID of the presentation.
+        force_refresh: Bypass the cache and fetch the presentation from Google (default: False).
 
     Returns:
         Presentation info with id, title, slide_count, slides with text elements, dimensions.
     """
     try:
-
-        def _get():
-            service = get_google_service_from_mcp("slides", "v3")
-            presentation = (
-                service.presentations().get(presentationId=presentation_id).execute()
-            )
-
-            slides = []
-            for slide in presentation.get("slides", []):
-                slide_info = {
-                    "id": slide["objectId"],
-                    "elements": [],
-                }
-
-                # Extract text content from shapes
-                for element in slide.get("pageElements", []):
-                    if "shape" in element and "text" in element.get("shape", {}):
-                        text_content = []
-                        for text_element in element["shape"]["text"].get(
-                            "textElements", []
-                        ):
-                            if "textRun" in text_element:
-                                text_content.append(
-                                    text_element["textRun"].get("content", "")
-                                )
-                        if text_content:
-                            slide_info["elements"].append(
-                                {
-                                    "type": "text",
-                                    "content": "".join(text_content).strip(),
-                                }
-                            )
-
-                slides.append(slide_info)
-
-            return {
-                "id": presentation["presentationId"],
-                "title": presentation.get("title", ""),
-                "slide_count": len(slides),
-                "slides": slides,
-                "width": presentation.get("pageSize", {})
-                .get("width", {})
-                .get("magnitude", 0),
-                "height": presentation.get("pageSize", {})
-                .get("height", {})
-                .get("magnitude", 0),
-            }
-
-        logger.info("slides_get_presentation id=%s", presentation_id)
-        result = await asyncio.to_thread(_get)
+        logger.info(
+            "slides_get_presentation id=%s force_refresh=%s",
+            presentation_id,
+            force_refresh,
+        )
+        service = get_google_service_from_mcp("slides", "v3")
+        cache_key = (credentials_cache_key(service), presentation_id)
+        if not force_refresh:
+            cached = _PRESENTATION_CACHE.get(cache_key)
+            if cached is not None:
+                logger.debug("slides_get_presentation cache hit id=%s", presentation_id)
+                return {"success": True, "data": cached}
+
+        result = await _get_presentation(service, presentation_id)
+        _PRESENTATION_CACHE.set(cache_key, result)
         return {"success": True, "data": result}
     except Exception as e:
-        logger.exception("slides_get_presentation failed")
+        log_tool_error(logger, "slides_get_presentation", e)
         return {"success": False, "error": str(e)}
 
 
+async def _create_presentation(service, title: str) -> dict:
+    """Create an empty presentation."""
+    presentation = await execute_async(
+        service.presentations().create(body={"title": title})
+    )
+    return {
+        "id": presentation["presentationId"],
+        "title": presentation.get("title", ""),
+        "slide_count": len(presentation.get("slides", [])),
+        "web_link": f"https://docs.google.com/presentation/d/{presentation['presentationId']}/edit",
+    }
+
+
 @tool()
 async def google_slides_create_presentation(title: str) -> dict:
     """Create a new Google Slides presentation.
@@ -142,27 +210,46 @@ async def google_slides_create_presentation(title: str) -> dict:
         Created presentation with id, title, slide_count, and web_link.
     """
     try:
-
-        def _create():
-            service = get_google_service_from_mcp("slides", "v3")
-            presentation = (
-                service.presentations().create(body={"title": title}).execute()
-            )
-            return {
-                "id": presentation["presentationId"],
-                "title": presentation.get("title", ""),
-                "slide_count": len(presentation.get("slides", [])),
-                "web_link": f"https://docs.google.com/presentation/d/{presentation['presentationId']}/edit",
-            }
-
         logger.info("slides_create_presentation title=%s", title)
-        result = await asyncio.to_thread(_create)
+        service = get_google_service_from_mcp("slides", "v3")
+        result = await _create_presentation(service, title)
+        user_key = credentials_cache_key(service)
+        _LIST_CACHE.invalidate(lambda key: key[0] == user_key)
         return {"success": True, "data": result}
     except Exception as e:
-        logger.exception("slides_create_presentation failed")
+        log_tool_error(logger, "slides_create_presentation", e)
         return {"success": False, "error": str(e)}
 
 
+async def _add_slide(
+    service, presentation_id: str, layout: str, insert_at: int
+) -> dict:
+    """Add a slide through presentations.batchUpdate."""
+
+    request: dict[str, Any] = {
+        "createSlide": {
+            "slideLayoutReference": {"predefinedLayout": layout},
+        }
+    }
+
+    if insert_at >= 0:
+        request["createSlide"]["insertionIndex"] = insert_at
+
+    result = await execute_async(
+        service.presentations().batchUpdate(
+            presentationId=presentation_id, body={"requests": [request]}
+        )
+    )
+
+    new_slide_id = result.get("replies", [{}])[0].get("createSlide", {}).get("objectId")
+
+    return {
+        "slide_id": new_slide_id,
+        "presentation_id": presentation_id,
+        "layout": layout,
+    }
+
+
 @tool()
 async def google_slides_add_slide(
     presentation_id: str,
@@ -182,43 +269,86 @@ async def google_slides_add_slide(
         New slide info with slide_id, presentation_id, and layout.
     """
     try:
+        logger.info("slides_add_slide id=%s layout=%s", presentation_id, layout)
+        service = get_google_service_from_mcp("slides", "v3")
+        result = await _add_slide(service, presentation_id, layout, insert_at)
+        _invalidate_presentation(presentation_id)
+        return {"success": True, "data": result}
+    except Exception as e:
+        log_tool_error(logger, "slides_add_slide", e)
+        return {"success": False, "error": str(e)}
 
-        def _add():
-            service = get_google_service_from_mcp("slides", "v3")
 
-            request = {
-                "createSlide": {
-                    "slideLayoutReference": {"predefinedLayout": layout},
-                }
+def _text_box_requests(
+    shape_id: str,
+    slide_id: str,
+    text: str,
+    x: float,
+    y: float,
+    width: float,
+    height: float,
+) -> list[dict]:
+    """Build the createShape and insertText requests for one text box."""
+    return [
+        {
+            "createShape": {
+                "objectId": shape_id,
+                "shapeType": "TEXT_BOX",
+                "elementProperties": {
+                    "pageObjectId": slide_id,
+                    "size": {
+                        "width": {"magnitude": width, "unit": "PT"},
+                        "height": {"magnitude": height, "unit": "PT"},
+                    },
+                    "transform": {
+                        "scaleX": 1,
+                        "scaleY": 1,
+                        "translateX": x,
+                        "translateY": y,
+                        "unit": "PT",
+                    },
+                },
             }
-
-            if insert_at >= 0:
-                request["createSlide"]["insertionIndex"] = insert_at
-
-            result = (
-                service.presentations()
-                .batchUpdate(
-                    presentationId=presentation_id, body={"requests": [request]}
-                )
-                .execute()
+        },
+        {
+            "insertText": {
+                "objectId": shape_id,
+                "text": text,
+                "insertionIndex": 0,
+            }
+        },
+    ]
+
+
+async def _add_texts(service, presentation_id: str, items: list[dict]) -> list[dict]:
+    """Create text boxes with a single presentations.batchUpdate request."""
+    requests = []
+    added = []
+    for item in items:
+        # Random ID so text boxes at the same position never collide
+        shape_id = f"tb_{secrets.token_hex(6)}"
+        slide_id = item["slide_id"]
+        requests.extend(
+            _text_box_requests(
+                shape_id,
+                slide_id,
+                item["text"],
+                item.get("x", 100),
+                item.get("y", 100),
+                item.get("width", 400),
+                item.get("height", 100),
             )
+        )
+        added.append({"shape_id": shape_id, "slide_id": slide_id, "text": item["text"]})
 
-            new_slide_id = (
-                result.get("replies", [{}])[0].get("createSlide", {}).get("objectId")
+    if requests:
+        await execute_async(
+            service.presentations().batchUpdate(
+                presentationId=presentation_id, body={"requests": requests}
             )
+        )
 
-            return {
-                "slide_id": new_slide_id,
-                "presentation_id": presentation_id,
-                "layout": layout,
-            }
-
-        logger.info("slides_add_slide id=%s layout=%s", presentation_id, layout)
-        result = await asyncio.to_thread(_add)
-        return {"success": True, "data": result}
-    except Exception as e:
-        logger.exception("slides_add_slide failed")
-        return {"success": False, "error": str(e)}
+    return added
 
 
 @tool()
@@ -248,61 +378,99 @@ async def google_slides_add_text(
         Created text box info with shape_id, slide_id, and text.
     """
     try:
+        logger.info("slides_add_text id=%s slide=%s", presentation_id, slide_id)
+        service = get_google_service_from_mcp("slides", "v3")
+        item = {
+            "slide_id": slide_id,
+            "text": text,
+            "x": x,
+            "y": y,
+            "width": width,
+            "height": height,
+        }
+        added = await _add_texts(service, presentation_id, [item])
+        _invalidate_presentation(presentation_id)
+        return {"success": True, "data": added[0]}
+    except Exception as e:
+        log_tool_error(logger, "slides_add_text", e)
+        return {"success": False, "error": str(e)}
 
-        def _add_text():
-            service = get_google_service_from_mcp("slides", "v3")
-
-            # Create text box shape
-            shape_id = f"textbox_{slide_id}_{int(x)}_{int(y)}"
-
-            requests = [
-                {
-                    "createShape": {
-                        "objectId": shape_id,
-                        "shapeType": "TEXT_BOX",
-                        "elementProperties": {
-                            "pageObjectId": slide_id,
-                            "size": {
-                                "width": {"magnitude": width, "unit": "PT"},
-                                "height": {"magnitude": height, "unit": "PT"},
-                            },
-                            "transform": {
-                                "scaleX": 1,
-                                "scaleY": 1,
-                                "translateX": x,
-                                "translateY": y,
-                                "unit": "PT",
-                            },
-                        },
-                    }
-                },
-                {
-                    "insertText": {
-                        "objectId": shape_id,
-                        "text": text,
-                        "insertionIndex": 0,
-                    }
-                },
-            ]
 
-            service.presentations().batchUpdate(
-                presentationId=presentation_id, body={"requests": requests}
-            ).execute()
+@tool()
+async def google_slides_add_many_text(presentation_id: str, items: list[dict]) -> dict:
+    """Add several text boxes to a presentation at once.
 
-            return {
-                "shape_id": shape_id,
-                "slide_id": slide_id,
-                "text": text,
-            }
+    All text boxes are created with a single presentations.batchUpdate request
+    instead of one request per text box.
 
-        logger.info("slides_add_text id=%s slide=%s", presentation_id, slide_id)
-        result = await asyncio.to_thread(_add_text)
-        return {"success": True, "data": result}
+    Args:
+        presentation_id: ID of the presentation.
+        items: Text boxes to create, each a dict with "slide_id" and "text" and
+            optional "x", "y", "width", and "height" in points (defaults as in
+            google_slides_add_text), e.g. [{"slide_id": "p1", "text": "Hi"}].
+
+    Returns:
+        Created text boxes (in request order) with shape_id, slide_id, and text.
+    """
+    try:
+        logger.info("slides_add_many_text id=%s count=%s", presentation_id, len(items))
+        service = get_google_service_from_mcp("slides", "v3")
+        added = await _add_texts(service, presentation_id, items)
+        _invalidate_presentation(presentation_id)
+        return {
+            "success": True,
+            "data": {
+                "presentation_id": presentation_id,
+                "texts": added,
+                "total": len(added),
+            },
+        }
     except Exception as e:
-        logger.exception("slides_add_text failed")
+        log_tool_error(logger, "slides_add_many_text", e)
         return {"success": False, "error": str(e)}
 
 
+def _thumbnail_request(service, presentation_id: str, slide_id: str, size: str):
+    """Build a pages.getThumbnail request, defaulting unknown sizes to MEDIUM."""
+    size_map = {
+        "SMALL": "SMALL",
+        "MEDIUM": "MEDIUM",
+        "LARGE": "LARGE",
+    }
+    thumbnail_size = size_map.get(size.upper(), "MEDIUM")
+
+    return (
+        service.presentations()
+        .pages()
+        .getThumbnail(
+            presentationId=presentation_id,
+            pageObjectId=slide_id,
+            thumbnailProperties_thumbnailSize=thumbnail_size,
+            fields="contentUrl,width,height",
+        )
+    )
+
+
+def _thumbnail_data(slide_id: str, result: dict) -> dict:
+    """Convert a getThumbnail response into the tool output shape."""
+    return {
+        "slide_id": slide_id,
+        "content_url": result.get("contentUrl", ""),
+        "width": result.get("width", 0),
+        "height": result.get("height", 0),
+    }
+
+
+async def _get_thumbnail(
+    service, presentation_id: str, slide_id: str, size: str
+) -> dict:
+    """Fetch the thumbnail URL of a slide."""
+    result = await execute_async(
+        _thumbnail_request(service, presentation_id, slide_id, size)
+    )
+    return _thumbnail_data(slide_id, result)
+
+
 @tool()
 async def google_slides_get_thumbnail(
     presentation_id: str,
@@ -322,38 +490,72 @@ async def google_slides_get_thumbnail(
         Thumbnail info with slide_id, content_url, width, and height.
     """
     try:
+        logger.info("slides_get_thumbnail id=%s slide=%s", presentation_id, slide_id)
+        service = get_google_service_from_mcp("slides", "v3")
+        result = await _get_thumbnail(service, presentation_id, slide_id, size)
+        return {"success": True, "data": result}
+    except Exception as e:
+        log_tool_error(logger, "slides_get_thumbnail", e)
+        return {"success": False, "error": str(e)}
 
-        def _get_thumbnail():
-            service = get_google_service_from_mcp("slides", "v3")
 
-            size_map = {
-                "SMALL": "SMALL",
-                "MEDIUM": "MEDIUM",
-                "LARGE": "LARGE",
-            }
-            thumbnail_size = size_map.get(size.upper(), "MEDIUM")
-
-            result = (
-                service.presentations()
-                .pages()
-                .getThumbnail(
-                    presentationId=presentation_id,
-                    pageObjectId=slide_id,
-                    thumbnailProperties_thumbnailSize=thumbnail_size,
-                )
-                .execute()
-            )
+@tool()
+async def google_slides_get_all_thumbnails(
+    presentation_id: str,
+    size: str = "MEDIUM",
+) -> dict:
+    """Get thumbnail image URLs for every slide in a presentation.
 
-            return {
-                "slide_id": slide_id,
-                "content_url": result.get("contentUrl", ""),
-                "width": result.get("width", 0),
-                "height": result.get("height", 0),
-            }
+    Thumbnails are requested with Google batch requests (up to 100 slides per
+    HTTP request) instead of one call per slide.
 
-        logger.info("slides_get_thumbnail id=%s slide=%s", presentation_id, slide_id)
-        result = await asyncio.to_thread(_get_thumbnail)
-        return {"success": True, "data": result}
+    Args:
+        presentation_id: ID of the presentation.
+        size: Thumbnail size - "SMALL", "MEDIUM", or "LARGE" (default: "MEDIUM").
+
+    Returns:
+        Thumbnails (in slide order) with slide_id, content_url, width, and height,
+        and errors for slides whose thumbnail could not be generated.
+    """
+    try:
+        logger.info("slides_get_all_thumbnails id=%s", presentation_id)
+        service = get_google_service_from_mcp("slides", "v3")
+        presentation = await execute_async(
+            service.presentations().get(
+                presentationId=presentation_id, fields="slides.objectId"
+            )
+        )
+        slide_ids = [slide["objectId"] for slide in presentation.get("slides", [])]
+
+        responses, errors = await run_blocking(
+            execute_batch,
+            service,
+            [
+                (
+                    slide_id,
+                    _thumbnail_request(service, presentation_id, slide_id, size),
+                )
+                for slide_id in slide_ids
+            ],
+        )
+        thumbnails = [
+            _thumbnail_data(slide_id, responses[slide_id])
+            for slide_id in slide_ids
+            if slide_id in responses
+        ]
+        return {
+            "success": True,
+            "data": {
+                "presentation_id": presentation_id,
+                "thumbnails": thumbnails,
+                "errors": [
+                    {"slide_id": slide_id, "error": errors[slide_id]}
+                    for slide_id in slide_ids
+                    if slide_id in errors
+                ],
+                "total": len(thumbnails),
+            },
+        }
     except Exception as e:
-        logger.exception("slides_get_thumbnail failed")
+        log_tool_error(logger, "slides_get_all_thumbnails", e)
         return {"success": False, "error": str(e)}
@@ -2,80 +2,280 @@
 
 import asyncio
 import logging
+from collections import Counter
+from collections.abc import Callable
+
+from googleapiclient.http import HttpRequest
 
 from src.humcp.decorator import tool
-from src.tools.google.auth import get_google_service_from_mcp
+from src.tools.google.auth import (
+    credentials_cache_key,
+    execute_async,
+    execute_batch,
+    get_google_service_from_mcp,
+    run_blocking,
+)
+from src.tools.google.cache import SingleFlight, TTLCache
 
 logger = logging.getLogger("humcp.tools.google.tasks")
 
+# Task list ID the API accepts for the user's default list
+DEFAULT_TASK_LIST = "@default"
+
+# Read-only responses within one task list, keyed by
+# (user, task_list_id, operation, *args)
+_READ_CACHE = TTLCache(maxsize=1024, ttl=30)
+
+# Keys of a task in the output of create, update, and list/get, respectively
+_CREATED_TASK_KEYS = ("id", "title", "notes", "status", "due")
+_UPDATED_TASK_KEYS = (*_CREATED_TASK_KEYS, "completed")
+_TASK_SUMMARY_KEYS = (*_UPDATED_TASK_KEYS, "parent", "position")
+
+# Partial response masks: only the fields the tool outputs read
+TASK_LIST_FIELDS = "id,title,updated"
+TASK_LISTS_FIELDS = f"nextPageToken,items({TASK_LIST_FIELDS})"
+CREATED_TASK_FIELDS = ",".join(_CREATED_TASK_KEYS)
+UPDATED_TASK_FIELDS = ",".join(_UPDATED_TASK_KEYS)
+TASK_FIELDS = ",".join((*_TASK_SUMMARY_KEYS, "links"))
+TASKS_FIELDS = f"nextPageToken,items({','.join(_TASK_SUMMARY_KEYS)})"
+
+# Output shapes with defaults for fields the API leaves out. Responses are
+# masked to the same keys, so merging one over its defaults projects it.
+_TASK_LIST_DEFAULTS = dict.fromkeys(TASK_LIST_FIELDS.split(","), "")
+_CREATED_TASK_DEFAULTS = dict.fromkeys(_CREATED_TASK_KEYS, "")
+_UPDATED_TASK_DEFAULTS = dict.fromkeys(_UPDATED_TASK_KEYS, "")
+_TASK_SUMMARY_DEFAULTS = dict.fromkeys(_TASK_SUMMARY_KEYS, "")
+
+# Largest page the Tasks API returns for tasks.list and tasklists.list
+PAGE_SIZE = 100
+
+# Identical reads in flight at the same time, keyed like _READ_CACHE
+_INFLIGHT = SingleFlight()
+
+# Listing task lists is usually followed by listing the first list's tasks,
+# so that listing is prefetched into _READ_CACHE in the background
+PREFETCH_FIRST_LIST = True
+
+# Running background prefetches and refreshes, referenced until they finish
+_PREFETCHES: set[asyncio.Task] = set()
+
+# Task lists rarely change, so listings of them are served stale-while-
+# revalidate: fresh for TASK_LISTS_FRESH_TTL seconds, then served as is while
+# refreshed in the background, and refetched once TASK_LISTS_STALE_TTL passes.
+# Keyed like _READ_CACHE, with task_list_id None
+TASK_LISTS_FRESH_TTL = 30
+TASK_LISTS_STALE_TTL = 600
+_TASK_LISTS_CACHE = TTLCache(maxsize=256, ttl=TASK_LISTS_STALE_TTL)
+
+# Number of times each task list's cached reads were invalidated, keyed like
+# the task_list_id of cache keys. A read only caches its result if the version
+# is unchanged since it started, so a fetch that overlapped a write (such as
+# a background refresh or prefetch) does not cache what the write replaced.
+_VERSIONS: Counter[str | None] = Counter()
+
+
+def _invalidate_task_list(task_list_id: str | None) -> None:
+    """Drop cached reads of a task list and its tasks after it was modified.
+
+    None stands for the set of task lists itself. DEFAULT_TASK_LIST aliases a
+    list whose real ID is not known here, so modifying it drops the reads of
+    every task list, and modifying any task list drops the alias's reads.
+    """
+    _VERSIONS[task_list_id] += 1
+    if task_list_id is None:
+        _READ_CACHE.invalidate(lambda key: key[1] is None)
+        _TASK_LISTS_CACHE.clear()
+    elif task_list_id == DEFAULT_TASK_LIST:
+        _READ_CACHE.invalidate(lambda key: key[1] is not None)
+    else:
+        _VERSIONS[DEFAULT_TASK_LIST] += 1
+        _READ_CACHE.invalidate(lambda key: key[1] in (task_list_id, DEFAULT_TASK_LIST))
+
+
+def _version(task_list_id: str | None) -> tuple[int, int]:
+    """Return the version of a task list's cached reads.
+
+    It changes whenever _invalidate_task_list drops those reads.
+    """
+    if task_list_id is None:
+        return _VERSIONS[None], 0
+    return _VERSIONS[task_list_id], _VERSIONS[DEFAULT_TASK_LIST]
+
+
+def _cache_if_current(
+    cache: TTLCache, key: tuple, version: tuple[int, int], result: dict
+) -> None:
+    """Cache a read unless its task list was invalidated since version was taken."""
+    if _version(key[1]) == version:
+        cache.set(key, result)
+
+
+async def _collect_pages(
+    build_request: Callable[[str | None, int], HttpRequest],
+    max_results: int,
+    project: Callable[[dict], dict],
+) -> list[dict]:
+    """Collect up to max_results items from a paginated list call.
+
+    The next page is requested as soon as its token arrives, so converting
+    the items of one page overlaps with the round trip for the next.
+
+    Args:
+        build_request: Builds the list request for a page token and page size.
+        max_results: Maximum number of items to collect.
+        project: Converts one API item into the tool output shape.
+    """
+    items: list[dict] = []
+    pending: asyncio.Future[dict] | None = asyncio.ensure_future(
+        execute_async(build_request(None, min(max_results, PAGE_SIZE)))
+    )
+    try:
+        while pending is not None:
+            results = await pending
+            page = results.get("items", [])[: max_results - len(items)]
+            remaining = max_results - len(items) - len(page)
+            page_token = results.get("nextPageToken")
+            pending = None
+            if page_token and remaining > 0:
+                pending = asyncio.ensure_future(
+                    execute_async(build_request(page_token, min(remaining, PAGE_SIZE)))
+                )
+            items.extend(project(item) for item in page)
+    finally:
+        if pending is not None:
+            pending.cancel()
+    return items
+
+
+def _task_list_data(tl: dict) -> dict:
+    """Convert a TaskList resource (masked by TASK_LIST_FIELDS) into the output shape."""
+    return _TASK_LIST_DEFAULTS | tl
+
+
+async def _list_task_lists(service, max_results: int) -> dict:
+    """List the user's task lists, following pages up to max_results."""
+    task_lists = await _collect_pages(
+        lambda page_token, page_size: service.tasklists().list(
+            maxResults=page_size, pageToken=page_token, fields=TASK_LISTS_FIELDS
+        ),
+        max_results,
+        _task_list_data,
+    )
+    return {"task_lists": task_lists, "total": len(task_lists)}
+
+
+async def _refresh_task_lists(service, cache_key: tuple, max_results: int) -> None:
+    """Replace a cached task lists listing with a fresh one."""
+    version = _version(None)
+    try:
+        result = await _INFLIGHT.run(cache_key, _list_task_lists, service, max_results)
+    except Exception as e:
+        logger.debug("task lists refresh failed: %s", e)
+        return
+    _cache_if_current(_TASK_LISTS_CACHE, cache_key, version, result)
+
+
+def _schedule_task_lists_refresh(service, cache_key: tuple, max_results: int) -> None:
+    """Start refreshing a cached task lists listing without waiting for it."""
+    task = asyncio.create_task(_refresh_task_lists(service, cache_key, max_results))
+    _PREFETCHES.add(task)
+    task.add_done_callback(_PREFETCHES.discard)
+
 
 @tool()
-async def google_tasks_list_task_lists(max_results: int = 100) -> dict:
+async def google_tasks_list_task_lists(
+    max_results: int = 100, force_refresh: bool = False
+) -> dict:
     """List all task lists for the user.
 
-    Returns all task lists including the default list.
+    Returns all task lists including the default list, following result pages
+    until max_results lists are collected. Results are cached per user: for
+    30 seconds they are served as is, and for up to 10 minutes they are served
+    while a fresh listing is fetched in the background. The first list's tasks
+    are prefetched in the background, so a following google_tasks_list_tasks
+    call for it is served from the cache.
 
     Args:
         max_results: Maximum number of task lists to return (default: 100).
+        force_refresh: Bypass the cache and list task lists from Google (default: False).
 
     Returns:
         List of task lists with id, title, and updated timestamp.
     """
     try:
-
-        def _list():
-            service = get_google_service_from_mcp("tasks", "v3")
-            results = service.tasklists().list(maxResults=max_results).execute()
-            items = results.get("items", [])
-            return {
-                "task_lists": [
-                    {
-                        "id": tl["id"],
-                        "title": tl.get("title", ""),
-                        "updated": tl.get("updated", ""),
-                    }
-                    for tl in items
-                ],
-                "total": len(items),
-            }
-
-        logger.info("tasks_list_task_lists")
-        result = await asyncio.to_thread(_list)
+        logger.info("tasks_list_task_lists force_refresh=%s", force_refresh)
+        service = get_google_service_from_mcp("tasks", "v3")
+        cache_key = (credentials_cache_key(service), None, "list", max_results)
+        if not force_refresh:
+            entry = _TASK_LISTS_CACHE.get_with_age(cache_key)
+            if entry is not None:
+                cached, age = entry
+                logger.debug("tasks_list_task_lists cache hit age=%.0fs", age)
+                if age > TASK_LISTS_FRESH_TTL:
+                    _schedule_task_lists_refresh(service, cache_key, max_results)
+                return {"success": True, "data": cached}
+
+        version = _version(None)
+        result = await _INFLIGHT.run(cache_key, _list_task_lists, service, max_results)
+        _cache_if_current(_TASK_LISTS_CACHE, cache_key, version, result)
+        if PREFETCH_FIRST_LIST and result["task_lists"]:
+            _schedule_prefetch(result["task_lists"][0]["id"])
         return {"success": True, "data": result}
     except Exception as e:
         logger.exception("tasks_list_task_lists failed")
         return {"success": False, "error": str(e)}
 
 
+async def _get_task_list(service, task_list_id: str) -> dict:
+    """Fetch a single task list."""
+    tl = await execute_async(
+        service.tasklists().get(tasklist=task_list_id, fields=TASK_LIST_FIELDS)
+    )
+    return _task_list_data(tl)
+
+
 @tool()
-async def google_tasks_get_task_list(task_list_id: str) -> dict:
+async def google_tasks_get_task_list(
+    task_list_id: str, force_refresh: bool = False
+) -> dict:
     """Get details of a specific task list.
 
+    Results are cached for 30 seconds per user and task list.
+
     Args:
         task_list_id: ID of the task list.
+        force_refresh: Bypass the cache and fetch the task list from Google (default: False).
 
     Returns:
         Task list details with id, title, and updated timestamp.
     """
     try:
-
-        def _get():
-            service = get_google_service_from_mcp("tasks", "v3")
-            tl = service.tasklists().get(tasklist=task_list_id).execute()
-            return {
-                "id": tl["id"],
-                "title": tl.get("title", ""),
-                "updated": tl.get("updated", ""),
-            }
-
         logger.info("tasks_get_task_list id=%s", task_list_id)
-        result = await asyncio.to_thread(_get)
+        service = get_google_service_from_mcp("tasks", "v3")
+        cache_key = (credentials_cache_key(service), task_list_id, "get")
+        if not force_refresh:
+            cached = _READ_CACHE.get(cache_key)
+            if cached is not None:
+                logger.debug("tasks_get_task_list cache hit id=%s", task_list_id)
+                return {"success": True, "data": cached}
+
+        version = _version(task_list_id)
+        result = await _INFLIGHT.run(cache_key, _get_task_list, service, task_list_id)
+        _cache_if_current(_READ_CACHE, cache_key, version, result)
         return {"success": True, "data": result}
     except Exception as e:
         logger.exception("tasks_get_task_list failed")
         return {"success": False, "error": str(e)}
 
 
+async def _create_task_list(service, title: str) -> dict:
+    """Create a task list."""
+    tl = await execute_async(
+        service.tasklists().insert(body={"title": title}, fields=TASK_LIST_FIELDS)
+    )
+    return _task_list_data(tl)
+
+
 @tool()
 async def google_tasks_create_task_list(title: str) -> dict:
     """Create a new task list.
@@ -87,24 +287,22 @@ async def google_tasks_create_task_list(title: str) -> dict:
         Created task list with id, title, and updated timestamp.
     """
     try:
-
-        def _create():
-            service = get_google_service_from_mcp("tasks", "v3")
-            tl = service.tasklists().insert(body={"title": title}).execute()
-            return {
-                "id": tl["id"],
-                "title": tl.get("title", ""),
-                "updated": tl.get("updated", ""),
-            }
-
         logger.info("tasks_create_task_list title=%s", title)
-        result = await asyncio.to_thread(_create)
+        service = get_google_service_from_mcp("tasks", "v3")
+        result = await _create_task_list(service, title)
+        _invalidate_task_list(None)
         return {"success": True, "data": result}
     except Exception as e:
         logger.exception("tasks_create_task_list failed")
         return {"success": False, "error": str(e)}
 
 
+async def _delete_task_list(service, task_list_id: str) -> dict:
+    """Delete a task list."""
+    await execute_async(service.tasklists().delete(tasklist=task_list_id))
+    return {"deleted_task_list_id": task_list_id}
+
+
 @tool()
 async def google_tasks_delete_task_list(task_list_id: str) -> dict:
     """Delete a task list.
@@ -118,119 +316,328 @@ async def google_tasks_delete_task_list(task_list_id: str) -> dict:
         Confirmation with deleted_task_list_id.
     """
     try:
-
-        def _delete():
-            service = get_google_service_from_mcp("tasks", "v1")
-            service.tasklists().delete(tasklist=task_list_id).execute()
-            return {"deleted_task_list_id": task_list_id}
-
         logger.info("tasks_delete_task_list id=%s", task_list_id)
-        result = await asyncio.to_thread(_delete)
+        service = get_google_service_from_mcp("tasks", "v1")
+        result = await _delete_task_list(service, task_list_id)
+        _invalidate_task_list(None)
+        _invalidate_task_list(task_list_id)
         return {"success": True, "data": result}
     except Exception as e:
         logger.exception("tasks_delete_task_list failed")
         return {"success": False, "error": str(e)}
 
 
+def _task_summary(t: dict) -> dict:
+    """Convert a Task resource (masked by TASKS_FIELDS) into the list output shape."""
+    return _TASK_SUMMARY_DEFAULTS | t
+
+
+def _tasks_data(results: dict) -> dict:
+    """Convert a tasks.list response into the tool output shape."""
+    items = results.get("items", [])
+    return {"tasks": [_task_summary(t) for t in items], "total": len(items)}
+
+
+async def _list_tasks(
+    service,
+    task_list_id: str,
+    show_completed: bool,
+    show_hidden: bool,
+    max_results: int,
+) -> dict:
+    """List the tasks of a task list, following pages up to max_results."""
+    tasks = await _collect_pages(
+        lambda page_token, page_size: service.tasks().list(
+            tasklist=task_list_id,
+            showCompleted=show_completed,
+            showHidden=show_hidden,
+            maxResults=page_size,
+            pageToken=page_token,
+            fields=TASKS_FIELDS,
+        ),
+        max_results,
+        _task_summary,
+    )
+    return {"tasks": tasks, "total": len(tasks)}
+
+
+def _list_tasks_key(
+    user_key: str,
+    task_list_id: str,
+    show_completed: bool,
+    show_hidden: bool,
+    max_results: int,
+) -> tuple:
+    """Return the _READ_CACHE key of a tasks listing."""
+    return (user_key, task_list_id, "list", show_completed, show_hidden, max_results)
+
+
+async def _prefetch_tasks(service, task_list_id: str) -> None:
+    """Fill the cache for google_tasks_list_tasks(task_list_id) with defaults."""
+    cache_key = _list_tasks_key(
+        credentials_cache_key(service), task_list_id, True, False, 100
+    )
+    if _READ_CACHE.get(cache_key) is not None:
+        return
+    version = _version(task_list_id)
+    try:
+        result = await _INFLIGHT.run(
+            cache_key, _list_tasks, service, task_list_id, True, False, 100
+        )
+    except Exception as e:
+        logger.debug("tasks prefetch failed list_id=%s: %s", task_list_id, e)
+        return
+    _cache_if_current(_READ_CACHE, cache_key, version, result)
+
+
+def _schedule_prefetch(task_list_id: str) -> None:
+    """Start prefetching a task list's tasks without waiting for it."""
+    service = get_google_service_from_mcp("tasks", "v1")
+    task = asyncio.create_task(_prefetch_tasks(service, task_list_id))
+    _PREFETCHES.add(task)
+    task.add_done_callback(_PREFETCHES.discard)
+
+
 @tool()
 async def google_tasks_list_tasks(
-    task_list_id: str = "@default",
+    task_list_id: str = DEFAULT_TASK_LIST,
     show_completed: bool = True,
     show_hidden: bool = False,
     max_results: int = 100,
+    force_refresh: bool = False,
 ) -> dict:
     """List tasks in a task list.
 
     Returns tasks with their status, due dates, and hierarchy information.
+    Lists longer than one page (100 tasks) are fetched page by page up to
+    max_results. Results are cached for 30 seconds per user and query.
 
     Args:
         task_list_id: Task list ID (default: "@default" for the default list).
         show_completed: Include completed tasks (default: True).
         show_hidden: Include hidden tasks (default: False).
         max_results: Maximum number of tasks to return (default: 100).
+        force_refresh: Bypass the cache and list tasks from Google (default: False).
 
     Returns:
         List of tasks with id, title, notes, status, due date, and parent info.
     """
     try:
+        logger.info("tasks_list_tasks list_id=%s", task_list_id)
+        service = get_google_service_from_mcp("tasks", "v1")
+        cache_key = _list_tasks_key(
+            credentials_cache_key(service),
+            task_list_id,
+            show_completed,
+            show_hidden,
+            max_results,
+        )
+        if not force_refresh:
+            cached = _READ_CACHE.get(cache_key)
+            if cached is not None:
+                logger.debug("tasks_list_tasks cache hit list_id=%s", task_list_id)
+                return {"success": True, "data": cached}
+
+        version = _version(task_list_id)
+        result = await _INFLIGHT.run(
+            cache_key,
+            _list_tasks,
+            service,
+            task_list_id,
+            show_completed,
+            show_hidden,
+            max_results,
+        )
+        _cache_if_current(_READ_CACHE, cache_key, version, result)
+        return {"success": True, "data": result}
+    except Exception as e:
+        logger.exception("tasks_list_tasks failed")
+        return {"success": False, "error": str(e)}
 
-        def _list():
-            service = get_google_service_from_mcp("tasks", "v1")
-            results = (
-                service.tasks()
-                .list(
+
+async def _list_tasks_multi(
+    service,
+    task_list_ids: list[str],
+    show_completed: bool,
+    show_hidden: bool,
+    max_results: int,
+) -> dict:
+    """List the tasks of several task lists with Google batch requests."""
+    responses, errors = await run_blocking(
+        execute_batch,
+        service,
+        [
+            (
+                task_list_id,
+                service.tasks().list(
                     tasklist=task_list_id,
                     showCompleted=show_completed,
                     showHidden=show_hidden,
                     maxResults=max_results,
-                )
-                .execute()
+                    fields=TASKS_FIELDS,
+                ),
             )
-            items = results.get("items", [])
-            return {
-                "tasks": [
-                    {
-                        "id": t["id"],
-                        "title": t.get("title", ""),
-                        "notes": t.get("notes", ""),
-                        "status": t.get("status", ""),
-                        "due": t.get("due", ""),
-                        "completed": t.get("completed", ""),
-                        "parent": t.get("parent", ""),
-                        "position": t.get("position", ""),
-                    }
-                    for t in items
-                ],
-                "total": len(items),
-            }
+            for task_list_id in task_list_ids
+        ],
+    )
+    task_lists = [
+        {"task_list_id": task_list_id, **_tasks_data(responses[task_list_id])}
+        for task_list_id in task_list_ids
+        if task_list_id in responses
+    ]
+    return {
+        "task_lists": task_lists,
+        "errors": [
+            {"task_list_id": task_list_id, "error": errors[task_list_id]}
+            for task_list_id in task_list_ids
+            if task_list_id in errors
+        ],
+        "total": len(task_lists),
+    }
 
-        logger.info("tasks_list_tasks list_id=%s", task_list_id)
-        result = await asyncio.to_thread(_list)
+
+@tool()
+async def google_tasks_list_tasks_multi(
+    task_list_ids: list[str],
+    show_completed: bool = True,
+    show_hidden: bool = False,
+    max_results: int = 100,
+) -> dict:
+    """List tasks in several task lists at once.
+
+    Lists are fetched with Google batch requests (up to 100 lists per HTTP
+    request) instead of one call each.
+
+    Args:
+        task_list_ids: IDs of the task lists.
+        show_completed: Include completed tasks (default: True).
+        show_hidden: Include hidden tasks (default: False).
+        max_results: Maximum number of tasks to return per list (default: 100,
+            at most 100).
+
+    Returns:
+        Tasks (as in google_tasks_list_tasks) for each list in request order,
+        and errors for lists that could not be read.
+    """
+    try:
+        task_list_ids = list(dict.fromkeys(task_list_ids))
+        logger.info("tasks_list_tasks_multi count=%s", len(task_list_ids))
+        service = get_google_service_from_mcp("tasks", "v1")
+        result = await _list_tasks_multi(
+            service, task_list_ids, show_completed, show_hidden, max_results
+        )
         return {"success": True, "data": result}
     except Exception as e:
-        logger.exception("tasks_list_tasks failed")
+        logger.exception("tasks_list_tasks_multi failed")
+        return {"success": False, "error": str(e)}
+
+
+@tool()
+async def google_tasks_list_all_tasks(
+    show_completed: bool = True,
+    show_hidden: bool = False,
+    max_results: int = 100,
+) -> dict:
+    """List tasks across all of the user's task lists.
+
+    Takes two round trips regardless of the number of lists: one to list the
+    task lists, then one batch request (per 100 lists) for their tasks.
+
+    Args:
+        show_completed: Include completed tasks (default: True).
+        show_hidden: Include hidden tasks (default: False).
+        max_results: Maximum number of tasks to return per list (default: 100,
+            at most 100).
+
+    Returns:
+        Tasks (as in google_tasks_list_tasks) for each list with its title,
+        and errors for lists that could not be read.
+    """
+    try:
+        logger.info("tasks_list_all_tasks")
+        service = get_google_service_from_mcp("tasks", "v1")
+        lists = await _list_task_lists(service, 100)
+        titles = {tl["id"]: tl["title"] for tl in lists["task_lists"]}
+        result = await _list_tasks_multi(
+            service, list(titles), show_completed, show_hidden, max_results
+        )
+        for task_list in result["task_lists"]:
+            task_list["title"] = titles[task_list["task_list_id"]]
+        return {"success": True, "data": result}
+    except Exception as e:
+        logger.exception("tasks_list_all_tasks failed")
         return {"success": False, "error": str(e)}
 
 
+async def _get_task(service, task_list_id: str, task_id: str) -> dict:
+    """Fetch a single task."""
+    t = await execute_async(
+        service.tasks().get(tasklist=task_list_id, task=task_id, fields=TASK_FIELDS)
+    )
+    task = _TASK_SUMMARY_DEFAULTS | t
+    if "links" not in t:
+        task["links"] = []
+    return task
+
+
 @tool()
-async def google_tasks_get_task(task_list_id: str, task_id: str) -> dict:
+async def google_tasks_get_task(
+    task_list_id: str, task_id: str, force_refresh: bool = False
+) -> dict:
     """Get details of a specific task.
 
+    Results are cached for 30 seconds per user and task.
+
     Args:
         task_list_id: ID of the task list containing the task.
         task_id: ID of the task.
+        force_refresh: Bypass the cache and fetch the task from Google (default: False).
 
     Returns:
         Task details with id, title, notes, status, due, completed, parent, position, links.
     """
     try:
-
-        def _get():
-            service = get_google_service_from_mcp("tasks", "v1")
-            t = service.tasks().get(tasklist=task_list_id, task=task_id).execute()
-            return {
-                "id": t["id"],
-                "title": t.get("title", ""),
-                "notes": t.get("notes", ""),
-                "status": t.get("status", ""),
-                "due": t.get("due", ""),
-                "completed": t.get("completed", ""),
-                "parent": t.get("parent", ""),
-                "position": t.get("position", ""),
-                "links": t.get("links", []),
-            }
-
         logger.info("tasks_get_task list_id=%s task_id=%s", task_list_id, task_id)
-        result = await asyncio.to_thread(_get)
+        service = get_google_service_from_mcp("tasks", "v1")
+        cache_key = (credentials_cache_key(service), task_list_id, "get", task_id)
+        if not force_refresh:
+            cached = _READ_CACHE.get(cache_key)
+            if cached is not None:
+                logger.debug("tasks_get_task cache hit task_id=%s", task_id)
+                return {"success": True, "data": cached}
+
+        version = _version(task_list_id)
+        result = await _INFLIGHT.run(
+            cache_key, _get_task, service, task_list_id, task_id
+        )
+        _cache_if_current(_READ_CACHE, cache_key, version, result)
         return {"success": True, "data": result}
     except Exception as e:
         logger.exception("tasks_get_task failed")
         return {"success": False, "error": str(e)}
 
 
+async def _create_task(
+    service, task_list_id: str, title: str, notes: str, due: str, parent: str
+) -> dict:
+    """Insert a task, optionally as a subtask of parent."""
+    body = {"title": title}
+    if notes:
+        body["notes"] = notes
+    if due:
+        body["due"] = due
+
+    kwargs = {"tasklist": task_list_id, "body": body, "fields": CREATED_TASK_FIELDS}
+    if parent:
+        kwargs["parent"] = parent
+
+    t = await execute_async(service.tasks().insert(**kwargs))
+    return _CREATED_TASK_DEFAULTS | t
+
+
 @tool()
 async def google_tasks_create_task(
-    task_list_id: str = "@default",
+    task_list_id: str = DEFAULT_TASK_LIST,
     title: str = "",
     notes: str = "",
     due: str = "",
@@ -251,36 +658,44 @@ async def google_tasks_create_task(
         Created task with id, title, notes, status, and due date.
     """
     try:
-
-        def _create():
-            service = get_google_service_from_mcp("tasks", "v1")
-            body = {"title": title}
-            if notes:
-                body["notes"] = notes
-            if due:
-                body["due"] = due
-
-            kwargs = {"tasklist": task_list_id, "body": body}
-            if parent:
-                kwargs["parent"] = parent
-
-            t = service.tasks().insert(**kwargs).execute()
-            return {
-                "id": t["id"],
-                "title": t.get("title", ""),
-                "notes": t.get("notes", ""),
-                "status": t.get("status", ""),
-                "due": t.get("due", ""),
-            }
-
         logger.info("tasks_create_task title=%s", title)
-        result = await asyncio.to_thread(_create)
+        service = get_google_service_from_mcp("tasks", "v1")
+        result = await _create_task(service, task_list_id, title, notes, due, parent)
+        _invalidate_task_list(task_list_id)
         return {"success": True, "data": result}
     except Exception as e:
         logger.exception("tasks_create_task failed")
         return {"success": False, "error": str(e)}
 
 
+async def _update_task(
+    service,
+    task_list_id: str,
+    task_id: str,
+    title: str,
+    notes: str,
+    status: str,
+    due: str,
+) -> dict:
+    """Update the provided fields of a task with a single PATCH request."""
+    body = {}
+    if title:
+        body["title"] = title
+    if notes:
+        body["notes"] = notes
+    if status:
+        body["status"] = status
+    if due:
+        body["due"] = due
+
+    t = await execute_async(
+        service.tasks().patch(
+            tasklist=task_list_id, task=task_id, body=body, fields=UPDATED_TASK_FIELDS
+        )
+    )
+    return _UPDATED_TASK_DEFAULTS | t
+
+
 @tool()
 async def google_tasks_update_task(
     task_list_id: str,
@@ -292,7 +707,8 @@ async def google_tasks_update_task(
 ) -> dict:
     """Update an existing task.
 
-    Updates the specified fields of a task. Only provided fields are changed.
+    Updates the specified fields of a task. Only provided fields are sent and
+    changed, in a single PATCH request.
 
     Args:
         task_list_id: ID of the task list containing the task.
@@ -306,44 +722,24 @@ async def google_tasks_update_task(
         Updated task with id, title, notes, status, due, and completed.
     """
     try:
-
-        def _update():
-            service = get_google_service_from_mcp("tasks", "v1")
-            # Get current task first
-            current = service.tasks().get(tasklist=task_list_id, task=task_id).execute()
-
-            # Update only provided fields
-            if title:
-                current["title"] = title
-            if notes:
-                current["notes"] = notes
-            if status:
-                current["status"] = status
-            if due:
-                current["due"] = due
-
-            t = (
-                service.tasks()
-                .update(tasklist=task_list_id, task=task_id, body=current)
-                .execute()
-            )
-            return {
-                "id": t["id"],
-                "title": t.get("title", ""),
-                "notes": t.get("notes", ""),
-                "status": t.get("status", ""),
-                "due": t.get("due", ""),
-                "completed": t.get("completed", ""),
-            }
-
         logger.info("tasks_update_task task_id=%s", task_id)
-        result = await asyncio.to_thread(_update)
+        service = get_google_service_from_mcp("tasks", "v1")
+        result = await _update_task(
+            service, task_list_id, task_id, title, notes, status, due
+        )
+        _invalidate_task_list(task_list_id)
         return {"success": True, "data": result}
     except Exception as e:
         logger.exception("tasks_update_task failed")
         return {"success": False, "error": str(e)}
 
 
+async def _delete_task(service, task_list_id: str, task_id: str) -> dict:
+    """Delete a task."""
+    await execute_async(service.tasks().delete(tasklist=task_list_id, task=task_id))
+    return {"deleted_task_id": task_id}
+
+
 @tool()
 async def google_tasks_delete_task(task_list_id: str, task_id: str) -> dict:
     """Delete a task.
@@ -358,14 +754,10 @@ async def google_tasks_delete_task(task_list_id: str, task_id: str) -> dict:
         Confirmation with deleted_task_id.
     """
     try:
-
-        def _delete():
-            service = get_google_service_from_mcp("tasks", "v1")
-            service.tasks().delete(tasklist=task_list_id, task=task_id).execute()
-            return {"deleted_task_id": task_id}
-
         logger.info("tasks_delete_task task_id=%s", task_id)
-        result = await asyncio.to_thread(_delete)
+        service = get_google_service_from_mcp("tasks", "v1")
+        result = await _delete_task(service, task_list_id, task_id)
+        _invalidate_task_list(task_list_id)
         return {"success": True, "data": result}
     except Exception as e:
         logger.exception("tasks_delete_task failed")
@@ -376,7 +768,7 @@ async def google_tasks_delete_task(task_list_id: str, task_id: str) -> dict:
 async def google_tasks_complete_task(task_list_id: str, task_id: str) -> dict:
     """Mark a task as completed.
 
-    Convenience function to set a task's status to completed.
+    Sends a single PATCH that only sets the task's status to completed.
 
     Args:
         task_list_id: ID of the task list containing the task.
@@ -385,11 +777,33 @@ async def google_tasks_complete_task(task_list_id: str, task_id: str) -> dict:
     Returns:
         Updated task with completion status.
     """
-    return await google_tasks_update_task(task_list_id, task_id, status="completed")
+    try:
+        logger.info("tasks_complete_task task_id=%s", task_id)
+        service = get_google_service_from_mcp("tasks", "v1")
+        result = await _update_task(
+            service,
+            task_list_id,
+            task_id,
+            title="",
+            notes="",
+            status="completed",
+            due="",
+        )
+        _invalidate_task_list(task_list_id)
+        return {"success": True, "data": result}
+    except Exception as e:
+        logger.exception("tasks_complete_task failed")
+        return {"success": False, "error": str(e)}
+
+
+async def _clear_completed(service, task_list_id: str) -> dict:
+    """Hide all completed tasks of a task list."""
+    await execute_async(service.tasks().clear(tasklist=task_list_id))
+    return {"cleared": True, "task_list_id": task_list_id}
 
 
 @tool()
-async def google_tasks_clear_completed(task_list_id: str = "@default") -> dict:
+async def google_tasks_clear_completed(task_list_id: str = DEFAULT_TASK_LIST) -> dict:
     """Clear all completed tasks from a task list.
 
     Removes all tasks marked as completed from the specified list.
@@ -401,14 +815,10 @@ async def google_tasks_clear_completed(task_list_id: str = "@default") -> dict:
         Confirmation with cleared status and task_list_id.
     """
     try:
-
-        def _clear():
-            service = get_google_service_from_mcp("tasks", "v1")
-            service.tasks().clear(tasklist=task_list_id).execute()
-            return {"cleared": True, "task_list_id": task_list_id}
-
         logger.info("tasks_clear_completed list_id=%s", task_list_id)
-        result = await asyncio.to_thread(_clear)
+        service = get_google_service_from_mcp("tasks", "v1")
+        result = await _clear_completed(service, task_list_id)
+        _invalidate_task_list(task_list_id)
         return {"success": True, "data": result}
     except Exception as e:
         logger.exception("tasks_clear_completed failed")
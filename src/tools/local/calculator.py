@@ -1,110 +1,225 @@
 from __future__ import annotations
 
 import math
+import random
+from collections.abc import Iterable
+from functools import lru_cache
+from itertools import chain
 from typing import Any
 
+from pydantic import ValidationError, validate_call
+
 from src.humcp.decorator import tool
 
 
-def _ok(data: dict[str, Any]) -> dict:
-    return {"success": True, "data": data}
+def _prime_sieve(limit: int) -> bytearray:
+    """Sieve of Eratosthenes: sieve[i] is 1 exactly when i is prime."""
+    sieve = bytearray([1]) * limit
+    sieve[:2] = b"\x00\x00"
+    for i in range(2, math.isqrt(limit - 1) + 1):
+        if sieve[i]:
+            sieve[i * i :: i] = bytes(len(range(i * i, limit, i)))
+    return sieve
+
+
+# Primes below SIEVE_LIMIT are answered by lookup (a 1 MB table built at
+# import). Other numbers are trial divided by the primes below
+# SMALL_PRIME_LIMIT first so a small factor is still reported as divisible_by.
+# Dividing by primes only skips more candidates than a 6k+-1 wheel would.
+SIEVE_LIMIT = 1_000_000
+SMALL_PRIME_LIMIT = 10_000
+_SIEVE = _prime_sieve(SIEVE_LIMIT)
+_SMALL_PRIMES = tuple(i for i in range(SMALL_PRIME_LIMIT) if _SIEVE[i])
+
+# Miller-Rabin with these bases is exact for every n below MR_EXACT_LIMIT
+# (about 3.3 * 10**24). Above it, MR_RANDOM_ROUNDS random bases are tried as
+# well, so a composite passes with probability below 4**-MR_RANDOM_ROUNDS,
+# and a True answer is reported as a probable prime.
+_MR_WITNESSES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37)
+MR_EXACT_LIMIT = 3_317_044_064_679_887_385_961_981
+MR_RANDOM_ROUNDS = 20
 
 
-def _err(msg: str) -> dict:
-    return {"success": False, "error": msg}
+def _is_prime_mr(n: int) -> bool:
+    """Miller-Rabin test for odd n > 37; exact below MR_EXACT_LIMIT."""
+    d, s = n - 1, 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+    witnesses: Iterable[int] = _MR_WITNESSES
+    if n >= MR_EXACT_LIMIT:
+        witnesses = chain(
+            _MR_WITNESSES,
+            (random.randrange(41, n - 1) for _ in range(MR_RANDOM_ROUNDS)),
+        )
+    for a in witnesses:
+        x = pow(a, d, n)
+        if x == 1 or x == n - 1:
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+
+# Factorials up to this n are memoized; larger ones are too big to keep around
+FACTORIAL_CACHE_LIMIT = 10_000
+
+
+@lru_cache(maxsize=512)
+def _cached_factorial(n: int) -> int:
+    return math.factorial(n)
 
 
 @tool()
 async def add(a: float, b: float) -> dict:
     """Add two numbers."""
-    return _ok({"operation": "add", "a": a, "b": b, "result": a + b})
+    return {
+        "success": True,
+        "data": {"operation": "add", "a": a, "b": b, "result": a + b},
+    }
 
 
 @tool()
 async def subtract(a: float, b: float) -> dict:
     """Subtract b from a."""
-    return _ok({"operation": "subtract", "a": a, "b": b, "result": a - b})
+    return {
+        "success": True,
+        "data": {"operation": "subtract", "a": a, "b": b, "result": a - b},
+    }
 
 
 @tool()
 async def multiply(a: float, b: float) -> dict:
     """Multiply two numbers."""
-    return _ok({"operation": "multiply", "a": a, "b": b, "result": a * b})
+    return {
+        "success": True,
+        "data": {"operation": "multiply", "a": a, "b": b, "result": a * b},
+    }
 
 
 @tool()
 async def divide(a: float, b: float) -> dict:
     """Divide a by b."""
     if b == 0:
-        return _err("Division by zero")
-    return _ok({"operation": "divide", "a": a, "b": b, "result": a / b})
+        return {"success": False, "error": "Division by zero"}
+    return {
+        "success": True,
+        "data": {"operation": "divide", "a": a, "b": b, "result": a / b},
+    }
 
 
 @tool()
 async def exponentiate(a: float, b: float) -> dict:
     """Raise a to the power of b."""
     try:
-        result = math.pow(a, b)
-    except (OverflowError, ValueError) as exc:
-        return _err(f"Error computing power: {exc}")
-    return _ok({"operation": "power", "a": a, "b": b, "result": result})
+        result = a**b
+    except (OverflowError, ZeroDivisionError) as exc:
+        return {"success": False, "error": f"Error computing power: {exc}"}
+    if isinstance(result, complex):
+        # ** gives a complex root of a negative base where math.pow raised
+        return {"success": False, "error": "Error computing power: math domain error"}
+    return {
+        "success": True,
+        "data": {"operation": "power", "a": a, "b": b, "result": result},
+    }
 
 
 @tool()
 async def factorial(n: int) -> dict:
     """Calculate factorial of n (must be non-negative)."""
     if n < 0:
-        return _err("Factorial undefined for negative numbers")
+        return {"success": False, "error": "Factorial undefined for negative numbers"}
     try:
-        result = math.factorial(n)
+        if n <= FACTORIAL_CACHE_LIMIT:
+            result = _cached_factorial(n)
+        else:
+            result = math.factorial(n)
     except (OverflowError, MemoryError):
-        return _err("Factorial result too large to compute")
-    return _ok({"operation": "factorial", "n": n, "result": result})
+        return {"success": False, "error": "Factorial result too large to compute"}
+    return {
+        "success": True,
+        "data": {"operation": "factorial", "n": n, "result": result},
+    }
 
 
 @tool()
 async def is_prime(n: int) -> dict:
-    """Check if n is prime."""
+    """Check if n is prime.
+
+    Composites with a factor below 10000 report it as divisible_by; larger
+    numbers without one are tested with Miller-Rabin, which finds no divisor.
+    Miller-Rabin is exact below about 3.3 * 10**24; above that, a prime result
+    is marked probable_prime (the chance of a composite passing is < 4**-20).
+    """
     if n <= 1:
-        return _ok({"n": n, "is_prime": False})
-    for i in range(2, int(math.sqrt(n)) + 1):
-        if n % i == 0:
-            return _ok({"n": n, "is_prime": False, "divisible_by": i})
-    return _ok({"n": n, "is_prime": True})
+        return {"success": True, "data": {"n": n, "is_prime": False}}
+    if n < SIEVE_LIMIT and _SIEVE[n]:
+        return {"success": True, "data": {"n": n, "is_prime": True}}
+    for p in _SMALL_PRIMES:
+        if p * p > n:
+            return {"success": True, "data": {"n": n, "is_prime": True}}
+        if n % p == 0:
+            return {
+                "success": True,
+                "data": {"n": n, "is_prime": False, "divisible_by": p},
+            }
+    data: dict[str, Any] = {"n": n, "is_prime": _is_prime_mr(n)}
+    if data["is_prime"] and n >= MR_EXACT_LIMIT:
+        data["probable_prime"] = True
+    return {"success": True, "data": data}
 
 
 @tool()
 async def square_root(n: float) -> dict:
     """Calculate square root of n (must be non-negative)."""
     if n < 0:
-        return _err("Square root undefined for negative numbers")
-    return _ok({"operation": "sqrt", "n": n, "result": math.sqrt(n)})
+        return {"success": False, "error": "Square root undefined for negative numbers"}
+    return {
+        "success": True,
+        "data": {"operation": "sqrt", "n": n, "result": math.sqrt(n)},
+    }
 
 
 @tool()
 async def absolute_value(n: float) -> dict:
     """Calculate absolute value of n."""
-    return _ok({"operation": "abs", "n": n, "result": abs(n)})
+    return {"success": True, "data": {"operation": "abs", "n": n, "result": abs(n)}}
 
 
 @tool()
 async def logarithm(n: float, base: float = 0) -> dict:
     """Calculate logarithm of n. Base defaults to e (natural log) if 0."""
     if n <= 0:
-        return _err("Logarithm undefined for non-positive numbers")
+        return {
+            "success": False,
+            "error": "Logarithm undefined for non-positive numbers",
+        }
     if base == 0:
-        return _ok({"operation": "ln", "n": n, "result": math.log(n)})
+        return {
+            "success": True,
+            "data": {"operation": "ln", "n": n, "result": math.log(n)},
+        }
     if base <= 0 or base == 1:
-        return _err("Base must be positive and not 1")
-    return _ok({"operation": "log", "n": n, "base": base, "result": math.log(n, base)})
+        return {"success": False, "error": "Base must be positive and not 1"}
+    return {
+        "success": True,
+        "data": {"operation": "log", "n": n, "base": base, "result": math.log(n, base)},
+    }
 
 
 @tool()
 async def modulo(a: float, b: float) -> dict:
     """Calculate a modulo b."""
     if b == 0:
-        return _err("Modulo by zero")
-    return _ok({"operation": "mod", "a": a, "b": b, "result": a % b})
+        return {"success": False, "error": "Modulo by zero"}
+    return {
+        "success": True,
+        "data": {"operation": "mod", "a": a, "b": b, "result": a % b},
+    }
 
 
 @tool()
@@ -113,5 +228,74 @@ async def greatest_common_divisor(a: int, b: int) -> dict:
     try:
         result = math.gcd(a, b)
     except Exception as e:
-        return _err(f"GCD error: {e}")
-    return _ok({"operation": "gcd", "a": a, "b": b, "result": result})
+        return {"success": False, "error": f"GCD error: {e}"}
+    return {
+        "success": True,
+        "data": {"operation": "gcd", "a": a, "b": b, "result": result},
+    }
+
+
+# Operations calculator_batch can run, by tool name. validate_call coerces
+# arguments to the annotated types, as the MCP and REST layers do for a
+# single tool call.
+_OPERATIONS = {
+    fn.__name__: validate_call(fn)
+    for fn in (
+        add,
+        subtract,
+        multiply,
+        divide,
+        exponentiate,
+        factorial,
+        is_prime,
+        square_root,
+        absolute_value,
+        logarithm,
+        modulo,
+        greatest_common_divisor,
+    )
+}
+
+MAX_BATCH_OPERATIONS = 1000
+
+
+@tool()
+async def calculator_batch(operations: list[dict[str, Any]]) -> dict:
+    """Run several calculator operations in one call.
+
+    Each operation names a calculator tool and its arguments, e.g.
+    {"op": "add", "args": {"a": 1, "b": 2}}. Results are returned in order,
+    each in the form the single tool returns; a failing operation does not
+    stop the rest.
+
+    Args:
+        operations: Operations to run (at most 1000).
+    """
+    if len(operations) > MAX_BATCH_OPERATIONS:
+        return {
+            "success": False,
+            "error": f"At most {MAX_BATCH_OPERATIONS} operations per batch",
+        }
+    results = []
+    for operation in operations:
+        name = operation.get("op")
+        fn = _OPERATIONS.get(name) if isinstance(name, str) else None
+        if fn is None:
+            results.append({"success": False, "error": f"Unknown operation: {name}"})
+            continue
+        args = operation.get("args", {})
+        if not isinstance(args, dict):
+            results.append(
+                {"success": False, "error": f"Arguments for {name} must be an object"}
+            )
+            continue
+        try:
+            results.append(await fn(**args))
+        except ValidationError as e:
+            problems = "; ".join(
+                f"{'.'.join(map(str, err['loc']))}: {err['msg']}" for err in e.errors()
+            )
+            results.append(
+                {"success": False, "error": f"Invalid arguments for {name}: {problems}"}
+            )
+    return {"success": True, "data": {"results": results, "count": len(results)}}
@@ -9,9 +9,16 @@ Security Note:
 
 from __future__ import annotations
 
+import base64
+import fnmatch
 import logging
 import os
+import re
+import shutil
+from functools import lru_cache
 from pathlib import Path
+from stat import S_ISREG
+from typing import Any
 from uuid import uuid4
 
 from src.humcp.decorator import tool
@@ -19,6 +26,21 @@ from src.humcp.decorator import tool
 logger = logging.getLogger("humcp.tools.filesystem")
 
 
+@lru_cache(maxsize=1)
+def _working_directory() -> Path:
+    """Return the resolved working directory, looked up once.
+
+    The tools never change directory; call refresh_working_directory() after
+    os.chdir so defaults and the allowed base directory follow it.
+    """
+    return Path.cwd().resolve()
+
+
+def refresh_working_directory() -> None:
+    """Forget the cached working directory so the next call looks it up."""
+    _working_directory.cache_clear()
+
+
 def _allow_absolute_paths() -> bool:
     """Check if absolute paths are allowed (evaluated at runtime for testing)."""
     return os.getenv("HUMCP_ALLOW_ABSOLUTE_PATHS", "").lower() == "true"
@@ -46,9 +68,9 @@ def _validate_path(path: Path, base_dir: Path | None = None) -> tuple[bool, str]
 
     # Default base is current working directory
     if base_dir is None:
-        base_dir = Path.cwd()
-
-    base_resolved = base_dir.resolve()
+        base_resolved = _working_directory()
+    else:
+        base_resolved = base_dir.resolve()
 
     # Check if path is within base directory
     try:
@@ -73,7 +95,7 @@ def _get_safe_path(
     Returns:
         Tuple of (path, error_message). Path is None if validation fails.
     """
-    directory = directory if directory else str(Path.cwd())
+    directory = directory or str(_working_directory())
     file_path = Path(directory) / filename
 
     is_valid, error = _validate_path(file_path)
@@ -83,6 +105,81 @@ def _get_safe_path(
     return file_path.resolve(), None
 
 
+def _stat_or_none(path: Path) -> os.stat_result | None:
+    """Stat a path, following symlinks, or return None if it does not exist.
+
+    One stat call answers what exists(), is_file(), and stat() would ask
+    separately.
+    """
+    try:
+        return path.stat()
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+
+# Largest range handed to one os.copy_file_range call
+_COPY_CHUNK = 1 << 30
+
+
+def _copy_file(source: Path, dest: Path, source_st: os.stat_result) -> None:
+    """Copy a file with its metadata, like shutil.copy2.
+
+    Regular files are copied in the kernel with os.copy_file_range where it
+    exists (Linux), which also shares blocks on filesystems with reflinks.
+    Anything else goes through shutil.copy2, as does a copy the kernel
+    refuses or cuts short (some FUSE, network and virtual filesystems report
+    0 bytes copied instead of failing).
+    """
+    copy_range = getattr(os, "copy_file_range", None)
+    if copy_range is not None and S_ISREG(source_st.st_mode):
+        if dest.exists() and os.path.samefile(source, dest):
+            raise shutil.SameFileError(f"{source} and {dest} are the same file")
+        copied = 0
+        try:
+            with open(source, "rb") as src, open(dest, "wb") as dst:
+                while n := copy_range(src.fileno(), dst.fileno(), _COPY_CHUNK):
+                    copied += n
+        except OSError:
+            copied = 0
+        if copied and copied >= source_st.st_size:
+            shutil.copystat(source, dest)
+            return
+    shutil.copy2(source, dest)
+
+
+def _scan_files(dir_path: Path, pattern: str, recursive: bool) -> list[os.DirEntry]:
+    """Find files whose name matches a glob pattern, like Path.glob/rglob.
+
+    Uses os.scandir so each entry's type comes from the directory listing and
+    its stat() result is cached, instead of one stat per is_file/stat call.
+    Symlinked directories are not descended into, and unreadable directories
+    are skipped.
+
+    Args:
+        dir_path: Resolved directory to search.
+        pattern: Glob pattern matched against file names.
+        recursive: If True, also search all subdirectories.
+
+    Returns:
+        Matching file entries (symlinks to files included).
+    """
+    flags = re.IGNORECASE if os.name == "nt" else 0
+    match = re.compile(fnmatch.translate(pattern), flags).match
+    files: list[os.DirEntry] = []
+    pending = [str(dir_path)]
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as it:
+                for entry in it:
+                    if recursive and entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    elif match(entry.name) and entry.is_file():
+                        files.append(entry)
+        except OSError:
+            continue
+    return files
+
+
 @tool()
 async def filesystem_write_file(
     content: str,
@@ -118,7 +215,7 @@ async def filesystem_write_file(
             extension = extension or path_obj.suffix.lstrip(".")
 
         # Use defaults
-        directory = directory if directory else str(Path.cwd())
+        directory = directory or str(_working_directory())
         extension = (extension if extension else "txt").lstrip(".")
 
         # Construct full filename with extension
@@ -139,8 +236,9 @@ async def filesystem_write_file(
         # Create directory if it doesn't exist
         dir_path.mkdir(parents=True, exist_ok=True)
 
-        # Write content to file
-        file_path.write_text(content, encoding="utf-8")
+        # Encode once; the byte count is the size written
+        data = content.encode("utf-8")
+        file_path.write_bytes(data)
 
         return {
             "success": True,
@@ -149,7 +247,7 @@ async def filesystem_write_file(
                 "file_path": str(file_path),
                 "filename": full_filename,
                 "directory": str(dir_path),
-                "size_bytes": len(content),
+                "size_bytes": len(data),
             },
         }
 
@@ -161,6 +259,7 @@ async def filesystem_write_file(
 async def filesystem_read_file(
     filename: str,
     directory: str = "",
+    raw: bool = False,
 ) -> dict:
     """
     Read content from a local file.
@@ -168,6 +267,8 @@ async def filesystem_read_file(
     Args:
         filename: Name of the file to read
         directory: Directory containing the file (defaults to current working directory)
+        raw: If True, return the file's bytes base64-encoded instead of decoding
+            them as UTF-8 text (for binary files)
 
     Returns:
         File content and metadata
@@ -178,21 +279,28 @@ async def filesystem_read_file(
             logger.warning("Path validation failed: %s", error)
             return {"success": False, "error": error or "Invalid path"}
 
-        if not file_path.exists():
+        st = _stat_or_none(file_path)
+        if st is None:
             return {"success": False, "error": f"File not found: {file_path}"}
 
-        if not file_path.is_file():
+        if not S_ISREG(st.st_mode):
             return {"success": False, "error": f"Path is not a file: {file_path}"}
 
-        content = file_path.read_text(encoding="utf-8")
+        if raw:
+            content = base64.b64encode(file_path.read_bytes()).decode("ascii")
+            encoding = "base64"
+        else:
+            content = file_path.read_text(encoding="utf-8")
+            encoding = "utf-8"
 
         return {
             "success": True,
             "data": {
                 "content": content,
+                "encoding": encoding,
                 "file_path": str(file_path),
                 "filename": filename,
-                "size_bytes": file_path.stat().st_size,
+                "size_bytes": st.st_size,
             },
         }
 
@@ -205,6 +313,7 @@ async def filesystem_list_files(
     directory: str = "",
     pattern: str = "*",
     recursive: bool = False,
+    sort: bool = True,
 ) -> dict:
     """
     List files in a directory with optional pattern matching.
@@ -213,12 +322,14 @@ async def filesystem_list_files(
         directory: Directory to list files from (defaults to current working directory)
         pattern: Glob pattern to filter files (e.g., "*.txt", "*.py")
         recursive: If True, search recursively in subdirectories
+        sort: If True, order files by path; if False, return them in directory
+            order, which is faster for large listings
 
     Returns:
         List of files matching the pattern
     """
     try:
-        directory = directory if directory else str(Path.cwd())
+        directory = directory or str(_working_directory())
         dir_path = Path(directory)
 
         # Validate directory path
@@ -235,24 +346,28 @@ async def filesystem_list_files(
         if not dir_path.is_dir():
             return {"success": False, "error": f"Path is not a directory: {dir_path}"}
 
-        # Get files based on recursive flag
-        if recursive:
-            files = list(dir_path.rglob(pattern))
+        if "/" in pattern or os.sep in pattern or "**" in pattern:
+            # Patterns spanning directories keep pathlib's glob semantics
+            paths = dir_path.rglob(pattern) if recursive else dir_path.glob(pattern)
+            found = [(str(f), f.name, f.stat()) for f in paths if f.is_file()]
         else:
-            files = list(dir_path.glob(pattern))
-
-        # Filter to only include files (not directories)
-        files = [f for f in files if f.is_file()]
+            found = [
+                (entry.path, entry.name, entry.stat())
+                for entry in _scan_files(dir_path, pattern, recursive)
+            ]
+        if sort:
+            # Same order as sorting the paths: component by component
+            found.sort(key=lambda item: item[0].split(os.sep))
 
         file_list = [
             {
-                "name": f.name,
-                "path": str(f),
-                "size_bytes": f.stat().st_size,
-                "extension": f.suffix.lstrip(".") if f.suffix else None,
-                "modified_time": f.stat().st_mtime,
+                "name": name,
+                "path": path,
+                "size_bytes": st.st_size,
+                "extension": os.path.splitext(name)[1].lstrip(".") or None,
+                "modified_time": st.st_mtime,
             }
-            for f in sorted(files)
+            for path, name, st in found
         ]
 
         return {
@@ -287,10 +402,11 @@ async def filesystem_delete_file(
             logger.warning("Path validation failed: %s", error)
             return {"success": False, "error": error or "Invalid path"}
 
-        if not file_path.exists():
+        st = _stat_or_none(file_path)
+        if st is None:
             return {"success": False, "error": f"File not found: {file_path}"}
 
-        if not file_path.is_file():
+        if not S_ISREG(st.st_mode):
             return {"success": False, "error": f"Path is not a file: {file_path}"}
 
         file_path.unlink()
@@ -381,13 +497,17 @@ async def filesystem_file_exists(
             logger.warning("Path validation failed: %s", error)
             return {"success": False, "error": error or "Invalid path"}
 
-        exists = file_path.exists() and file_path.is_file()
-
-        result = {"exists": exists, "file_path": str(file_path), "filename": filename}
+        st = _stat_or_none(file_path)
+        result: dict[str, Any] = {
+            "exists": False,
+            "file_path": str(file_path),
+            "filename": filename,
+        }
 
-        if exists:
-            result["size_bytes"] = file_path.stat().st_size
-            result["modified_time"] = file_path.stat().st_mtime
+        if st is not None and S_ISREG(st.st_mode):
+            result["exists"] = True
+            result["size_bytes"] = st.st_size
+            result["modified_time"] = st.st_mtime
 
         return {"success": True, "data": result}
 
@@ -416,24 +536,23 @@ async def filesystem_get_file_info(
             logger.warning("Path validation failed: %s", error)
             return {"success": False, "error": error or "Invalid path"}
 
-        if not file_path.exists():
+        st = _stat_or_none(file_path)
+        if st is None:
             return {"success": False, "error": f"File not found: {file_path}"}
 
-        if not file_path.is_file():
+        if not S_ISREG(st.st_mode):
             return {"success": False, "error": f"Path is not a file: {file_path}"}
 
-        stat = file_path.stat()
-
         return {
             "success": True,
             "data": {
                 "name": file_path.name,
                 "path": str(file_path),
-                "size_bytes": stat.st_size,
+                "size_bytes": st.st_size,
                 "extension": file_path.suffix.lstrip(".") if file_path.suffix else None,
-                "created_time": stat.st_ctime,
-                "modified_time": stat.st_mtime,
-                "accessed_time": stat.st_atime,
+                "created_time": st.st_ctime,
+                "modified_time": st.st_mtime,
+                "accessed_time": st.st_atime,
                 "is_symlink": file_path.is_symlink(),
             },
         }
@@ -465,19 +584,22 @@ async def filesystem_append_to_file(
             logger.warning("Path validation failed: %s", error)
             return {"success": False, "error": error or "Invalid path"}
 
-        if not file_path.exists():
+        if _stat_or_none(file_path) is None:
             return {"success": False, "error": f"File not found: {file_path}"}
 
-        with open(file_path, "a", encoding="utf-8") as f:
-            f.write(content)
+        data = content.encode("utf-8")
+        with open(file_path, "ab") as f:
+            f.write(data)
+            # Append mode writes at the end, so the position is the new size
+            new_size = f.tell()
 
         return {
             "success": True,
             "data": {
                 "message": "Successfully appended to file",
                 "file_path": str(file_path),
-                "appended_bytes": len(content),
-                "new_size_bytes": file_path.stat().st_size,
+                "appended_bytes": len(data),
+                "new_size_bytes": new_size,
             },
         }
 
@@ -505,8 +627,6 @@ async def filesystem_copy_file(
         Confirmation of copy operation
     """
     try:
-        import shutil
-
         # Validate source path
         source_path, error = _get_safe_path(source_filename, source_directory)
         if error or source_path is None:
@@ -522,13 +642,14 @@ async def filesystem_copy_file(
                 "error": f"Destination: {error or 'Invalid path'}",
             }
 
-        if not source_path.exists():
+        source_st = _stat_or_none(source_path)
+        if source_st is None:
             return {"success": False, "error": f"Source file not found: {source_path}"}
 
         # Create destination directory if it doesn't exist
         dest_path.parent.mkdir(parents=True, exist_ok=True)
 
-        shutil.copy2(source_path, dest_path)
+        _copy_file(source_path, dest_path, source_st)
 
         return {
             "success": True,
@@ -34,6 +34,10 @@ class IsPrimeData(BaseModel):
     divisible_by: int | None = Field(
         None, description="First divisor found (if not prime)"
     )
+    probable_prime: bool = Field(
+        False,
+        description="True when the result is probabilistic (n above ~3.3e24)",
+    )
 
 
 class UnaryOperationData(BaseModel):
@@ -65,7 +69,7 @@ class LogarithmData(BaseModel):
 class ShellCommandData(BaseModel):
     """Output data for shell command execution."""
 
-    command: str = Field(..., description="Command that was executed")
+    argv: list[str] = Field(..., description="Command arguments that were executed")
     return_code: int = Field(..., description="Process return code (0 = success)")
     stdout: str = Field("", description="Standard output")
     stderr: str = Field("", description="Standard error output")
@@ -138,6 +142,9 @@ class ReadFileData(BaseModel):
     """Output data for file read operation."""
 
     content: str = Field(..., description="File content")
+    encoding: str = Field(
+        "utf-8", description="Content encoding: 'utf-8' text or 'base64' bytes"
+    )
     file_path: str = Field(..., description="Full path to the file")
     filename: str = Field(..., description="Name of the file")
     size_bytes: int = Field(..., description="File size in bytes")
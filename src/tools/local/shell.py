@@ -15,15 +15,131 @@ Security Warning:
 
 from __future__ import annotations
 
+import asyncio
 import logging
-import subprocess
+import os
+import platform
+import shutil
+from collections import deque
+from functools import lru_cache
 from pathlib import Path
+from stat import S_ISDIR
+from typing import NamedTuple
 
 from src.humcp.decorator import tool
 
 logger = logging.getLogger("humcp.tools.shell")
 
 
+# Bytes read from a pipe per call; lines are reassembled from these chunks
+_READ_CHUNK = 1 << 16
+
+# Cap on subprocesses running at once: one per usable core (process_cpu_count
+# honours CPU affinity where available), but never fewer than 4, since many
+# commands wait on I/O rather than the CPU
+MAX_CONCURRENT_PROCESSES = max(4, getattr(os, "process_cpu_count", os.cpu_count)() or 1)
+
+_process_slots: asyncio.Semaphore | None = None
+_process_slots_loop: asyncio.AbstractEventLoop | None = None
+
+
+def _get_process_slots() -> asyncio.Semaphore:
+    """Return the subprocess semaphore for the running event loop.
+
+    A new semaphore is created if the running loop changed (e.g. between
+    test cases), since asyncio primitives cannot be shared across loops.
+    """
+    global _process_slots, _process_slots_loop
+
+    loop = asyncio.get_running_loop()
+    if _process_slots is None or _process_slots_loop is not loop:
+        _process_slots = asyncio.Semaphore(MAX_CONCURRENT_PROCESSES)
+        _process_slots_loop = loop
+    return _process_slots
+
+
+class _ProcessResult(NamedTuple):
+    """Exit status and (tail of the) decoded output of a finished process."""
+
+    return_code: int
+    stdout: str
+    stderr: str
+    stdout_line_count: int
+
+
+async def _read_tail(stream: asyncio.StreamReader, tail: int) -> tuple[str, int]:
+    """Read a pipe to EOF, keeping only its last tail lines (all if tail <= 0).
+
+    Lines are split with universal newlines, matching text.split("\n") on the
+    decoded output, so memory stays bounded by tail rather than output size.
+
+    Returns:
+        Tuple of (kept lines joined with "\n", total line count).
+    """
+    lines: deque[str] = deque(maxlen=tail if tail > 0 else None)
+    count = 0
+
+    def keep(line: bytes) -> None:
+        nonlocal count
+        parts = line.decode("utf-8", errors="replace").split("\r")
+        lines.extend(parts)
+        count += len(parts)
+
+    partial: list[bytes] = []
+    while chunk := await stream.read(_READ_CHUNK):
+        *complete, rest = chunk.split(b"\n")
+        if complete:
+            complete[0] = b"".join([*partial, complete[0]])
+            partial.clear()
+            for line in complete:
+                keep(line.removesuffix(b"\r"))
+        partial.append(rest)
+
+    if partial:
+        keep(b"".join(partial))
+    return "\n".join(lines), count
+
+
+async def _run_process(
+    args: list[str], cwd: str | None, timeout: float, tail: int = 0
+) -> _ProcessResult:
+    """Run a process without blocking the event loop.
+
+    stdout and stderr are streamed concurrently and only their last tail
+    lines are kept (all lines if tail <= 0). At most MAX_CONCURRENT_PROCESSES
+    run at once; time spent waiting for a slot does not count toward timeout.
+
+    Raises:
+        TimeoutError: If the process runs longer than timeout seconds; it is
+            killed first.
+        FileNotFoundError: If the program does not exist.
+    """
+    async with _get_process_slots():
+        proc = await asyncio.create_subprocess_exec(
+            *args,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            cwd=cwd,
+        )
+        # Both pipes were requested above, so they are always present
+        assert proc.stdout is not None and proc.stderr is not None
+        try:
+            (stdout, stdout_count), (stderr, _), return_code = await asyncio.wait_for(
+                asyncio.gather(
+                    _read_tail(proc.stdout, tail),
+                    _read_tail(proc.stderr, tail),
+                    proc.wait(),
+                ),
+                timeout,
+            )
+        finally:
+            # Timed out or cancelled: do not leave the process running
+            if proc.returncode is None:
+                proc.kill()
+                await proc.wait()
+    return _ProcessResult(return_code, stdout, stderr, stdout_count)
+
+
 async def run_shell_command(
     args: list[str],
     tail: int = 100,
@@ -50,75 +166,58 @@ async def run_shell_command(
     try:
         if not args or len(args) == 0:
             return {"success": False, "error": "Command args cannot be empty"}
-        logger.info(
-            "Shell command requested cmd=%s cwd=%s", args[0], base_dir or Path.cwd()
-        )
+        # getcwd once, and only when no base_dir was given
+        working_directory = base_dir or str(Path.cwd())
+        logger.info("Shell command requested cmd=%s cwd=%s", args[0], working_directory)
 
         # Validate base_dir if provided
         cwd = None
         if base_dir:
-            base_path = Path(base_dir)
-            if not base_path.exists():
+            # One stat answers both "exists" and "is a directory"
+            try:
+                base_st = os.stat(base_dir)
+            except OSError:
                 return {
                     "success": False,
                     "error": f"Base directory does not exist: {base_dir}",
                 }
-            if not base_path.is_dir():
+            if not S_ISDIR(base_st.st_mode):
                 return {
                     "success": False,
                     "error": f"Base directory is not a directory: {base_dir}",
                 }
-            cwd = str(base_path)
-
-        # Run the command
-        result = subprocess.run(
-            args,
-            capture_output=True,
-            text=True,
-            cwd=cwd,
-            timeout=timeout,
-        )
-
-        # Process output
-        stdout_lines = result.stdout.split("\n") if result.stdout else []
-        stderr_lines = result.stderr.split("\n") if result.stderr else []
-
-        # Apply tail limit if specified
-        if tail > 0:
-            stdout_lines = stdout_lines[-tail:]
-            stderr_lines = stderr_lines[-tail:]
+            cwd = base_dir
 
-        stdout = "\n".join(stdout_lines)
-        stderr = "\n".join(stderr_lines)
+        # Run the command, keeping only the last tail lines of output
+        result = await _run_process(args, cwd, timeout, tail)
+        return_code = result.return_code
 
         # Determine success based on return code
-        success = result.returncode == 0
+        success = return_code == 0
         if success:
             logger.info(
                 "Shell command succeeded cmd=%s return_code=%s",
                 args[0],
-                result.returncode,
+                return_code,
             )
         else:
             logger.warning(
-                "Shell command failed cmd=%s return_code=%s", args[0], result.returncode
+                "Shell command failed cmd=%s return_code=%s", args[0], return_code
             )
 
         return {
             "success": success,
             "data": {
-                "command": " ".join(args),
-                "return_code": result.returncode,
-                "stdout": stdout,
-                "stderr": stderr,
-                "working_directory": cwd or str(Path.cwd()),
-                "output_truncated": tail > 0 and len(result.stdout.split("\n")) > tail
-                if result.stdout
-                else False,
+                "argv": args,
+                "return_code": return_code,
+                "stdout": result.stdout,
+                "stderr": result.stderr,
+                "working_directory": cwd or working_directory,
+                "output_truncated": tail > 0 and result.stdout_line_count > tail,
             },
         }
 
-    except subprocess.TimeoutExpired:
+    except TimeoutError:
         logger.warning(
             "Shell command timed out cmd=%s timeout=%s",
             args[0] if args else "",
@@ -159,51 +258,54 @@ async def shell_run_shell_script(
     try:
         if not script or script.strip() == "":
             return {"success": False, "error": "Script content cannot be empty"}
+        working_directory = base_dir or str(Path.cwd())
         logger.info(
             "Shell script requested length=%d cwd=%s",
             len(script),
-            base_dir or Path.cwd(),
+            working_directory,
         )
 
         # Validate base_dir if provided
         cwd = None
         if base_dir:
-            base_path = Path(base_dir)
-            if not base_path.exists():
+            try:
+                base_st = os.stat(base_dir)
+            except OSError:
                 return {
                     "success": False,
                     "error": f"Base directory does not exist: {base_dir}",
                 }
-            cwd = str(base_path)
+            if not S_ISDIR(base_st.st_mode):
+                return {
+                    "success": False,
+                    "error": f"Base directory is not a directory: {base_dir}",
+                }
+            cwd = base_dir
 
         # Run the script
-        result = subprocess.run(
-            [shell, "-c", script],
-            capture_output=True,
-            text=True,
-            cwd=cwd,
-            timeout=timeout,
+        return_code, stdout, stderr, _ = await _run_process(
+            [shell, "-c", script], cwd, timeout
         )
 
-        success = result.returncode == 0
+        success = return_code == 0
         if success:
-            logger.info("Shell script succeeded return_code=%s", result.returncode)
+            logger.info("Shell script succeeded return_code=%s", return_code)
         else:
-            logger.warning("Shell script failed return_code=%s", result.returncode)
+            logger.warning("Shell script failed return_code=%s", return_code)
 
         return {
             "success": success,
             "data": {
                 "script": script,
                 "shell": shell,
-                "return_code": result.returncode,
-                "stdout": result.stdout,
-                "stderr": result.stderr,
-                "working_directory": cwd or str(Path.cwd()),
+                "return_code": return_code,
+                "stdout": stdout,
+                "stderr": stderr,
+                "working_directory": cwd or working_directory,
             },
         }
 
-    except subprocess.TimeoutExpired:
+    except TimeoutError:
         logger.warning("Shell script timed out timeout=%s", timeout)
         return {"success": False, "error": f"Script timed out after {timeout} seconds"}
     except FileNotFoundError:
@@ -226,15 +328,9 @@ async def shell_check_command_exists(command: str) -> dict:
         Boolean indicating whether the command exists and its path if found
     """
     try:
-        result = subprocess.run(
-            ["which", command],
-            capture_output=True,
-            text=True,
-            timeout=5,
-        )
-
-        exists = result.returncode == 0
-        path = result.stdout.strip() if exists else None
+        # PATH lookup in-process; no need to fork `which`
+        path = shutil.which(command)
+        exists = path is not None
 
         logger.info("Checked command exists cmd=%s exists=%s", command, exists)
         return {
@@ -259,8 +355,6 @@ async def shell_get_environment_variable(variable_name: str) -> dict:
         Value of the environment variable or None if not set
     """
     try:
-        import os
-
         value = os.environ.get(variable_name)
 
         logger.info(
@@ -301,6 +395,23 @@ async def shell_get_current_directory() -> dict:
         return {"success": False, "error": str(e)}
 
 
+@lru_cache(1)
+def _static_system_info() -> dict:
+    """Platform details that cannot change while the process runs.
+
+    platform.processor() may shell out to uname, so look these up once.
+    """
+    return {
+        "os": platform.system(),
+        "os_version": platform.version(),
+        "platform": platform.platform(),
+        "architecture": platform.machine(),
+        "processor": platform.processor(),
+        "python_version": platform.python_version(),
+        "hostname": platform.node(),
+    }
+
+
 @tool()
 async def shell_get_system_info() -> dict:
     """
@@ -310,19 +421,8 @@ async def shell_get_system_info() -> dict:
         System information including OS, platform, Python version, etc.
     """
     try:
-        import os
-        import platform
-
-        info = {
-            "os": platform.system(),
-            "os_version": platform.version(),
-            "platform": platform.platform(),
-            "architecture": platform.machine(),
-            "processor": platform.processor(),
-            "python_version": platform.python_version(),
-            "hostname": platform.node(),
-            "user": os.environ.get("USER") or os.environ.get("USERNAME"),
-        }
+        info = dict(_static_system_info())
+        info["user"] = os.environ.get("USER") or os.environ.get("USERNAME")
 
         logger.info("Retrieved system info")
         return {"success": True, "data": info}
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
-import json
+import asyncio
 import logging
 import os
+from functools import lru_cache
+from itertools import islice
 from typing import Any
 
 from src.humcp.decorator import tool
@@ -16,6 +18,10 @@ except ImportError as err:
 
 logger = logging.getLogger("humcp.tools.tavily")
 
+# JSON keys, quotes and separators around the variable-length fields
+_ENVELOPE_OVERHEAD = 32
+_RESULT_OVERHEAD = 64
+
 
 class TavilySearchTool:
     """
@@ -57,15 +63,24 @@ class TavilySearchTool:
             clean_response["answer"] = response["answer"]
 
         clean_results = []
-        current_token_count = len(json.dumps(clean_response))
-        for result in response.get("results", []):
+        # Approximate serialized size from the string lengths instead of
+        # json.dumps-ing every result just to measure it
+        current_token_count = (
+            len(query) + len(clean_response.get("answer") or "") + _ENVELOPE_OVERHEAD
+        )
+        for result in islice(response.get("results") or (), max_results):
             _result = {
                 "title": result["title"],
                 "url": result["url"],
                 "content": result["content"],
                 "score": result["score"],
             }
-            current_token_count += len(json.dumps(_result))
+            current_token_count += (
+                len(_result["title"])
+                + len(_result["url"])
+                + len(_result["content"])
+                + _RESULT_OVERHEAD
+            )
             if current_token_count > self.max_tokens:
                 break
             clean_results.append(_result)
@@ -79,6 +94,14 @@ class TavilySearchTool:
         return clean_response if clean_response else {}
 
 
+@lru_cache(maxsize=8)
+def _get_searcher(api_key: str, search_depth: str, max_tokens: int) -> TavilySearchTool:
+    """Return a shared searcher so its client's HTTP session is reused."""
+    return TavilySearchTool(
+        api_key=api_key, search_depth=search_depth, max_tokens=max_tokens
+    )
+
+
 @tool()
 async def tavily_web_search(
     query: str,
@@ -112,12 +135,11 @@ async def tavily_web_search(
         logger.info(
             "Tavily tool invoked query_length=%d depth=%s", len(query), search_depth
         )
-        searcher = TavilySearchTool(
-            api_key=resolved_api_key,
-            search_depth=search_depth,
-            max_tokens=max_tokens,
+        searcher = _get_searcher(resolved_api_key, search_depth, max_tokens)
+        # The Tavily client is synchronous; keep the event loop free meanwhile
+        results = await asyncio.to_thread(
+            searcher.web_search_using_tavily, query=query, max_results=max_results
         )
-        results = searcher.web_search_using_tavily(query=query, max_results=max_results)
 
         if not results:
             return {"success": False, "error": "No results found."}
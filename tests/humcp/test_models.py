@@ -2,7 +2,11 @@
 
 from pydantic import BaseModel
 
-from src.humcp.routes import _create_model_from_schema, _pascal
+from src.humcp.routes import (
+    _create_model_from_schema,
+    _model_for_schema_key,
+    _pascal,
+)
 
 
 class TestPascalCase:
@@ -128,3 +132,29 @@ class TestCreateModelFromSchema:
         dumped = instance.model_dump(exclude_none=True)
 
         assert dumped == {"required_field": "value"}
+
+    def test_identical_schema_reuses_model(self):
+        schema = {
+            "type": "object",
+            "properties": {"a": {"type": "number"}, "b": {"type": "number"}},
+            "required": ["a"],
+        }
+        _model_for_schema_key.cache_clear()
+
+        first = _create_model_from_schema(schema, "CachedInput")
+        second = _create_model_from_schema(dict(schema), "CachedInput")
+        other_name = _create_model_from_schema(schema, "OtherInput")
+
+        assert first is second
+        assert other_name is not first
+        assert _model_for_schema_key.cache_info().misses == 2
+
+    def test_fields_keep_schema_order(self):
+        schema = {
+            "type": "object",
+            "properties": {"zeta": {"type": "string"}, "alpha": {"type": "string"}},
+        }
+
+        Model = _create_model_from_schema(schema, "OrderedInput")
+
+        assert list(Model.model_fields) == ["zeta", "alpha"]
@@ -1,5 +1,6 @@
 """Tests for humcp routes module."""
 
+from datetime import datetime
 from unittest.mock import Mock
 
 import pytest
@@ -171,6 +172,35 @@ class TestRegisterRoutes:
         assert resp.status_code == 200
         assert resp.json()["result"]["data"]["result"] == 15
 
+    def test_tool_execution_encodes_result(self, tmp_path):
+        async def list_items() -> dict:
+            return {
+                "success": True,
+                "data": {
+                    "items": [{"id": i, "tags": {"a"}} for i in range(500)],
+                    "updated": datetime(2024, 1, 15, 10, 30),
+                },
+            }
+
+        reg = make_registered_tool(
+            "list_items",
+            "test",
+            "List items.",
+            {"type": "object", "properties": {}},
+            list_items,
+        )
+        app = FastAPI()
+        register_routes(app, tmp_path, [reg])
+        client = TestClient(app)
+
+        resp = client.post("/tools/list_items", json={})
+        assert resp.status_code == 200
+        assert resp.headers["content-type"] == "application/json"
+        data = resp.json()["result"]["data"]
+        assert len(data["items"]) == 500
+        assert data["items"][0] == {"id": 0, "tags": ["a"]}
+        assert data["updated"] == "2024-01-15T10:30:00"
+
     def test_categories_endpoint(self, sample_registrations, tmp_path):
         app = FastAPI()
         register_routes(app, tmp_path, sample_registrations)
@@ -0,0 +1,393 @@
+import asyncio
+import gzip
+import json
+import logging
+import threading
+from unittest.mock import MagicMock, patch
+
+import httplib2
+import httpx
+import pytest
+from google.oauth2.credentials import Credentials
+from googleapiclient.discovery import build
+from googleapiclient.errors import HttpError, UnknownApiNameOrVersion
+
+from src.tools.google import auth
+from src.tools.google.auth import (
+    BATCH_MAX_REQUESTS,
+    GZIP_MIN_BODY_SIZE,
+    CompactJsonModel,
+    execute_async,
+    execute_batch,
+    get_google_service_from_mcp,
+    gzip_request,
+    log_tool_error,
+    rest_access_token,
+    run_blocking,
+)
+
+
+@pytest.fixture
+def gmail_service():
+    return build("gmail", "v1", credentials=Credentials(token="test-token"))
+
+
+def _patch_transport(handler):
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return patch("src.tools.google.auth._get_http_client", return_value=client)
+
+
+class TestExecuteAsync:
+    @pytest.mark.asyncio
+    async def test_sends_request_with_credentials(self, gmail_service):
+        seen = {}
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen["method"] = request.method
+            seen["url"] = str(request.url)
+            seen["authorization"] = request.headers.get("authorization")
+            return httpx.Response(200, json={"labels": [{"id": "INBOX"}]})
+
+        with _patch_transport(handler):
+            result = await execute_async(
+                gmail_service.users().labels().list(userId="me")
+            )
+
+        assert result == {"labels": [{"id": "INBOX"}]}
+        assert seen["method"] == "GET"
+        assert "/gmail/v1/users/me/labels" in seen["url"]
+        assert seen["authorization"] == "Bearer test-token"
+
+    @pytest.mark.asyncio
+    async def test_sends_json_body(self, gmail_service):
+        seen = {}
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen["body"] = json.loads(request.content)
+            return httpx.Response(200, json={"id": "sent"})
+
+        with _patch_transport(handler):
+            result = await execute_async(
+                gmail_service.users().messages().send(userId="me", body={"raw": "abc"})
+            )
+
+        assert result == {"id": "sent"}
+        assert seen["body"] == {"raw": "abc"}
+
+    @pytest.mark.asyncio
+    async def test_raises_http_error(self, gmail_service):
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(404, json={"error": {"message": "Not Found"}})
+
+        with _patch_transport(handler), pytest.raises(HttpError) as exc_info:
+            await execute_async(
+                gmail_service.users().messages().get(userId="me", id="missing")
+            )
+
+        assert exc_info.value.resp.status == 404
+
+    @pytest.mark.asyncio
+    async def test_retries_rate_limited_request(self, gmail_service):
+        statuses = iter([429, 503, 200])
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(next(statuses), json={"labels": []})
+
+        with (
+            _patch_transport(handler),
+            patch("src.tools.google.auth.asyncio.sleep") as sleep,
+        ):
+            result = await execute_async(
+                gmail_service.users().labels().list(userId="me")
+            )
+
+        assert result == {"labels": []}
+        assert sleep.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_honours_retry_after(self, gmail_service):
+        statuses = iter([429, 200])
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(
+                next(statuses), json={"labels": []}, headers={"Retry-After": "2"}
+            )
+
+        with (
+            _patch_transport(handler),
+            patch("src.tools.google.auth.asyncio.sleep") as sleep,
+        ):
+            await execute_async(gmail_service.users().labels().list(userId="me"))
+
+        sleep.assert_awaited_once_with(2.0)
+
+    @pytest.mark.asyncio
+    async def test_caps_long_retry_after(self, gmail_service):
+        statuses = iter([429, 200])
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(
+                next(statuses), json={"labels": []}, headers={"Retry-After": "3600"}
+            )
+
+        with (
+            _patch_transport(handler),
+            patch("src.tools.google.auth.asyncio.sleep") as sleep,
+        ):
+            await execute_async(gmail_service.users().labels().list(userId="me"))
+
+        sleep.assert_awaited_once_with(auth.RETRY_MAX_DELAY)
+
+    @pytest.mark.asyncio
+    async def test_retries_server_error_for_idempotent_method(self, gmail_service):
+        statuses = iter([502, 200])
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(next(statuses), json={"labels": []})
+
+        with (
+            _patch_transport(handler),
+            patch("src.tools.google.auth.asyncio.sleep") as sleep,
+        ):
+            result = await execute_async(
+                gmail_service.users().labels().list(userId="me")
+            )
+
+        assert result == {"labels": []}
+        sleep.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_does_not_retry_server_error_for_insert(self, gmail_service):
+        calls = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request)
+            return httpx.Response(500, json={"error": {"message": "Backend"}})
+
+        with (
+            _patch_transport(handler),
+            patch("src.tools.google.auth.asyncio.sleep"),
+            pytest.raises(HttpError),
+        ):
+            await execute_async(
+                gmail_service.users().labels().create(userId="me", body={"name": "A"})
+            )
+
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_max_retries(self, gmail_service):
+        calls = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request)
+            return httpx.Response(429, json={"error": {"message": "Quota"}})
+
+        with (
+            _patch_transport(handler),
+            patch("src.tools.google.auth.asyncio.sleep"),
+            pytest.raises(HttpError) as exc_info,
+        ):
+            await execute_async(gmail_service.users().labels().list(userId="me"))
+
+        assert exc_info.value.resp.status == 429
+        assert len(calls) == auth.MAX_RETRIES + 1
+
+
+class TestGzipRequest:
+    def test_compresses_large_body(self, gmail_service):
+        raw = "a" * GZIP_MIN_BODY_SIZE
+        request = gzip_request(
+            gmail_service.users().messages().send(userId="me", body={"raw": raw})
+        )
+
+        assert request.headers["content-encoding"] == "gzip"
+        assert request.headers["content-length"] == str(len(request.body))
+        assert json.loads(gzip.decompress(request.body)) == {"raw": raw}
+
+    def test_leaves_small_body(self, gmail_service):
+        request = gzip_request(
+            gmail_service.users().messages().send(userId="me", body={"raw": "abc"})
+        )
+
+        assert "content-encoding" not in request.headers
+        assert json.loads(request.body) == {"raw": "abc"}
+
+    @pytest.mark.asyncio
+    async def test_execute_async_sends_compressed_body(self, gmail_service):
+        seen = {}
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen["encoding"] = request.headers.get("content-encoding")
+            seen["body"] = json.loads(gzip.decompress(request.content))
+            return httpx.Response(200, json={"id": "sent"})
+
+        raw = "b" * GZIP_MIN_BODY_SIZE
+        with _patch_transport(handler):
+            await execute_async(
+                gzip_request(
+                    gmail_service.users()
+                    .messages()
+                    .send(userId="me", body={"raw": raw})
+                )
+            )
+
+        assert seen["encoding"] == "gzip"
+        assert seen["body"] == {"raw": raw}
+
+
+class TestCompactJsonModel:
+    def test_serializes_compact_utf8(self):
+        service = build(
+            "gmail",
+            "v1",
+            credentials=Credentials(token="test-token"),
+            model=CompactJsonModel(),
+        )
+        request = (
+            service.users()
+            .messages()
+            .send(userId="me", body={"raw": "héllo", "labelIds": ["A", "B"]})
+        )
+
+        assert request.body == '{"raw":"héllo","labelIds":["A","B"]}'.encode()
+        assert request.headers["content-type"] == "application/json"
+
+    def test_deserializes_response_bytes(self):
+        content = '{"values":[["héllo",1]]}'.encode()
+
+        assert CompactJsonModel().deserialize(content) == {"values": [["héllo", 1]]}
+
+    def test_deserializes_without_orjson(self):
+        with patch("src.tools.google.auth.orjson", None):
+            result = CompactJsonModel().deserialize(b'{"values":[]}')
+
+        assert result == {"values": []}
+
+
+class TestHttpClient:
+    @pytest.mark.asyncio
+    async def test_client_is_shared_within_loop(self):
+        client = auth._get_http_client()
+
+        assert auth._get_http_client() is client
+        assert client._transport._pool._max_connections == (
+            auth.HTTP_LIMITS.max_connections
+        )
+
+    @pytest.mark.asyncio
+    async def test_close_http_client(self):
+        client = auth._get_http_client()
+
+        await auth.close_http_client()
+
+        assert client.is_closed
+        assert auth._get_http_client() is not client
+
+    def test_client_per_loop(self):
+        async def _client():
+            return auth._get_http_client()
+
+        first_loop, second_loop = asyncio.new_event_loop(), asyncio.new_event_loop()
+        try:
+            first = first_loop.run_until_complete(_client())
+            second = second_loop.run_until_complete(_client())
+        finally:
+            first_loop.close()
+            second_loop.close()
+
+        assert first is not second
+        assert auth._http_clients[first_loop] is first
+
+
+class TestGetGoogleService:
+    def test_discovery_document_parsed_once(self):
+        auth._discovery_document.cache_clear()
+        reset = rest_access_token.set("test-token")
+        try:
+            first = get_google_service_from_mcp("gmail", "v1")
+            second = get_google_service_from_mcp("gmail", "v1")
+        finally:
+            rest_access_token.reset(reset)
+
+        assert first is not second
+        assert auth._discovery_document.cache_info().misses == 1
+        assert auth._discovery_document.cache_info().hits == 1
+        request = second.users().labels().list(userId="me")
+        assert "/gmail/v1/users/me/labels" in request.uri
+
+    def test_unknown_api_version(self):
+        reset = rest_access_token.set("test-token")
+        try:
+            with pytest.raises(UnknownApiNameOrVersion):
+                get_google_service_from_mcp("gmail", "v99")
+        finally:
+            rest_access_token.reset(reset)
+
+
+class TestExecuteBatch:
+    def test_collects_responses_and_errors_in_chunks(self):
+        batches = []
+
+        def new_batch(callback):
+            batch = MagicMock()
+            added = []
+            batch.add.side_effect = lambda request, request_id: added.append(request_id)
+
+            def execute():
+                for request_id in added:
+                    if request_id == "bad":
+                        callback(request_id, None, Exception("Not Found"))
+                    else:
+                        callback(request_id, {"id": request_id}, None)
+
+            batch.execute.side_effect = execute
+            batches.append(added)
+            return batch
+
+        service = MagicMock()
+        service.new_batch_http_request.side_effect = new_batch
+        ids = [f"id{i}" for i in range(BATCH_MAX_REQUESTS)] + ["bad"]
+
+        responses, errors = execute_batch(service, [(i, MagicMock()) for i in ids])
+
+        assert [len(b) for b in batches] == [BATCH_MAX_REQUESTS, 1]
+        assert len(responses) == BATCH_MAX_REQUESTS
+        assert responses["id0"] == {"id": "id0"}
+        assert errors == {"bad": "Not Found"}
+
+
+class TestRunBlocking:
+    @pytest.mark.asyncio
+    async def test_runs_on_dedicated_pool(self):
+        def _thread_name(suffix):
+            return threading.current_thread().name + suffix
+
+        name = await run_blocking(_thread_name, "!")
+
+        assert name.startswith("google-api")
+        assert name.endswith("!")
+
+
+class TestLogToolError:
+    def test_transient_error_logged_without_traceback(self, caplog):
+        error = HttpError(httplib2.Response({"status": 429}), b"Quota exceeded")
+        test_logger = logging.getLogger("test.google")
+
+        with caplog.at_level(logging.WARNING, logger="test.google"):
+            log_tool_error(test_logger, "sheets_read_values", error)
+
+        assert caplog.records[0].levelno == logging.WARNING
+        assert caplog.records[0].exc_info is None
+
+    def test_unexpected_error_logged_with_traceback(self, caplog):
+        test_logger = logging.getLogger("test.google")
+
+        with caplog.at_level(logging.WARNING, logger="test.google"):
+            try:
+                raise ValueError("boom")
+            except ValueError as e:
+                log_tool_error(test_logger, "sheets_read_values", e)
+
+        assert caplog.records[0].levelno == logging.ERROR
+        assert caplog.records[0].exc_info is not None
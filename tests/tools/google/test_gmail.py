@@ -1,21 +1,34 @@
 from unittest.mock import MagicMock, patch
 
+import httplib2
 import pytest
+from googleapiclient.errors import HttpError
 
+from src.tools.google import auth, gmail
 from src.tools.google.gmail import (
     google_gmail_labels,
     google_gmail_read,
+    google_gmail_read_batch,
     google_gmail_search,
     google_gmail_send,
 )
 
 
+async def _execute(request):
+    return request.execute()
+
+
 @pytest.fixture
 def mock_gmail_service():
-    with patch("src.tools.google.gmail.get_google_service_from_mcp") as mock:
+    with (
+        patch("src.tools.google.gmail.get_google_service_from_mcp") as mock,
+        patch("src.tools.google.gmail.execute_async", side_effect=_execute),
+    ):
         service = MagicMock()
         mock.return_value = service
         yield service
+    gmail._LABELS_CACHE.clear()
+    gmail._SEARCH_CACHE.clear()
 
 
 class TestSearch:
@@ -43,6 +56,32 @@ class TestSearch:
         assert result["data"]["total"] == 1
         assert result["data"]["messages"][0]["subject"] == "Test Subject"
         assert result["data"]["messages"][0]["from"] == "sender@example.com"
+        mock_gmail_service.users().messages().get.assert_called_with(
+            userId="me",
+            id="msg1",
+            format="metadata",
+            metadataHeaders=["Subject", "From", "To", "Date"],
+        )
+
+    @pytest.mark.asyncio
+    async def test_search_prefetch_bodies(self, mock_gmail_service):
+        mock_gmail_service.users().messages().list().execute.return_value = {
+            "messages": [{"id": "msg1"}, {"id": "msg2"}]
+        }
+        mock_gmail_service.users().messages().get().execute.return_value = {
+            "id": "msg1",
+            "threadId": "thread1",
+            "payload": {
+                "headers": [{"name": "Subject", "value": "Hi"}],
+                "body": {"data": "SGVsbG8sIFdvcmxkIQ=="},  # "Hello, World!"
+            },
+        }
+
+        result = await google_gmail_search("test", prefetch_bodies=1)
+        assert result["success"] is True
+        messages = result["data"]["messages"]
+        assert messages[0]["body"] == "Hello, World!"
+        assert messages[1]["body"] is None
 
     @pytest.mark.asyncio
     async def test_search_no_results(self, mock_gmail_service):
@@ -54,6 +93,32 @@ class TestSearch:
         assert result["success"] is True
         assert result["data"]["total"] == 0
 
+    @pytest.mark.asyncio
+    async def test_search_cached(self, mock_gmail_service):
+        messages = mock_gmail_service.users().messages()
+        messages.list().execute.return_value = {"messages": []}
+        messages.list.reset_mock()
+
+        await google_gmail_search("test")
+        result = await google_gmail_search("test")
+        assert result["success"] is True
+        assert messages.list.call_count == 1
+
+        await google_gmail_search("test", force_refresh=True)
+        assert messages.list.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_search_cache_cleared_by_send(self, mock_gmail_service):
+        messages = mock_gmail_service.users().messages()
+        messages.list().execute.return_value = {"messages": []}
+        messages.send().execute.return_value = {"id": "sent1"}
+        messages.list.reset_mock()
+
+        await google_gmail_search("test")
+        await google_gmail_send("a@example.com", "Hi", "Body")
+        await google_gmail_search("test")
+        assert messages.list.call_count == 2
+
     @pytest.mark.asyncio
     async def test_search_error(self, mock_gmail_service):
         mock_gmail_service.users().messages().list().execute.side_effect = Exception(
@@ -117,6 +182,54 @@ class TestRead:
         assert result["success"] is True
         assert result["data"]["body"] == "Plain text"
 
+    @pytest.mark.asyncio
+    async def test_read_nested_multipart(self, mock_gmail_service):
+        mock_gmail_service.users().messages().get().execute.return_value = {
+            "id": "msg4",
+            "payload": {
+                "mimeType": "multipart/mixed",
+                "headers": [],
+                "parts": [
+                    {
+                        "mimeType": "multipart/alternative",
+                        "parts": [
+                            {
+                                "mimeType": "text/html",
+                                "body": {"data": "SFRNTA=="},  # "HTML"
+                            },
+                            {
+                                "mimeType": "text/plain",
+                                "body": {"data": "UGxhaW4gdGV4dA=="},  # "Plain text"
+                            },
+                        ],
+                    },
+                    {
+                        "mimeType": "application/pdf",
+                        "filename": "report.pdf",
+                        "body": {"attachmentId": "att1"},
+                    },
+                ],
+            },
+        }
+
+        result = await google_gmail_read("msg4")
+        assert result["success"] is True
+        assert result["data"]["body"] == "Plain text"
+
+    @pytest.mark.asyncio
+    async def test_read_normalizes_line_endings(self, mock_gmail_service):
+        mock_gmail_service.users().messages().get().execute.return_value = {
+            "id": "msg3",
+            "payload": {
+                "headers": [],
+                "body": {"data": "bGluZTENCmxpbmUyDQo="},  # "line1\r\nline2\r\n"
+            },
+        }
+
+        result = await google_gmail_read("msg3")
+        assert result["success"] is True
+        assert result["data"]["body"] == "line1\nline2\n"
+
     @pytest.mark.asyncio
     async def test_read_error(self, mock_gmail_service):
         mock_gmail_service.users().messages().get().execute.side_effect = Exception(
@@ -127,6 +240,81 @@ class TestRead:
         assert result["success"] is False
 
 
+class _FakeBatch:
+    def __init__(self, callback):
+        self.callback = callback
+        self.requests = []
+
+    def add(self, request, request_id):
+        self.requests.append((request_id, request))
+
+    def execute(self):
+        for request_id, request in self.requests:
+            try:
+                self.callback(request_id, request.execute(), None)
+            except Exception as e:
+                self.callback(request_id, None, e)
+
+
+def _get_message(userId, id, format):
+    request = MagicMock()
+    if id == "bad":
+        request.execute.side_effect = Exception("Not Found")
+    else:
+        request.execute.return_value = {
+            "id": id,
+            "payload": {
+                "headers": [{"name": "Subject", "value": f"Subject {id}"}],
+                "body": {"data": "SGVsbG8="},  # "Hello"
+            },
+        }
+    return request
+
+
+class TestReadBatch:
+    @pytest.mark.asyncio
+    async def test_read_batch_success(self, mock_gmail_service):
+        mock_gmail_service.users().messages().get.side_effect = _get_message
+        mock_gmail_service.new_batch_http_request.side_effect = _FakeBatch
+
+        result = await google_gmail_read_batch(["msg1", "bad", "msg2"])
+        assert result["success"] is True
+        assert result["data"]["total"] == 2
+        assert [m["id"] for m in result["data"]["messages"]] == ["msg1", "msg2"]
+        assert result["data"]["messages"][0]["subject"] == "Subject msg1"
+        assert result["data"]["messages"][0]["body"] == "Hello"
+        assert result["data"]["errors"] == [{"id": "bad", "error": "Not Found"}]
+
+    @pytest.mark.asyncio
+    async def test_read_batch_chunks_requests(self, mock_gmail_service):
+        mock_gmail_service.users().messages().get.side_effect = _get_message
+        mock_gmail_service.new_batch_http_request.side_effect = _FakeBatch
+
+        ids = [f"msg{i}" for i in range(auth.BATCH_MAX_REQUESTS + 1)]
+        result = await google_gmail_read_batch(ids)
+        assert result["data"]["total"] == len(ids)
+        assert mock_gmail_service.new_batch_http_request.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_read_batch_falls_back_to_individual_reads(self, mock_gmail_service):
+        mock_gmail_service.users().messages().get.side_effect = _get_message
+        batch = mock_gmail_service.new_batch_http_request.return_value
+        batch.execute.side_effect = HttpError(
+            httplib2.Response({"status": 400}), b"batch not supported"
+        )
+
+        result = await google_gmail_read_batch(["msg1", "msg2"])
+        assert result["success"] is True
+        assert [m["id"] for m in result["data"]["messages"]] == ["msg1", "msg2"]
+
+    @pytest.mark.asyncio
+    async def test_read_batch_error(self, mock_gmail_service):
+        mock_gmail_service.new_batch_http_request.side_effect = Exception("API error")
+
+        result = await google_gmail_read_batch(["msg1"])
+        assert result["success"] is False
+
+
 class TestSend:
     @pytest.mark.asyncio
     async def test_send_success(self, mock_gmail_service):
@@ -189,6 +377,22 @@ class TestLabels:
         assert result["data"]["total"] == 3
         assert result["data"]["labels"][0]["name"] == "INBOX"
 
+    @pytest.mark.asyncio
+    async def test_labels_cached(self, mock_gmail_service):
+        list_request = mock_gmail_service.users().labels().list()
+        list_request.execute.return_value = {
+            "labels": [{"id": "INBOX", "name": "INBOX"}]
+        }
+
+        await google_gmail_labels()
+        result = await google_gmail_labels()
+        assert result["success"] is True
+        assert result["data"]["total"] == 1
+        assert list_request.execute.call_count == 1
+
+        await google_gmail_labels(force_refresh=True)
+        assert list_request.execute.call_count == 2
+
     @pytest.mark.asyncio
     async def test_labels_error(self, mock_gmail_service):
         mock_gmail_service.users().labels().list().execute.side_effect = Exception(
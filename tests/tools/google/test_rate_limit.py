@@ -0,0 +1,37 @@
+from unittest.mock import patch
+
+import pytest
+
+from src.tools.google.rate_limit import AsyncTokenBucket
+
+
+class TestAsyncTokenBucket:
+    @pytest.mark.asyncio
+    async def test_allows_burst_up_to_capacity(self):
+        bucket = AsyncTokenBucket(rate=1, capacity=3)
+
+        with patch("src.tools.google.rate_limit.asyncio.sleep") as sleep:
+            for _ in range(3):
+                await bucket.acquire()
+
+        sleep.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_waits_when_empty(self):
+        bucket = AsyncTokenBucket(rate=10, capacity=1)
+        await bucket.acquire()
+
+        with patch("src.tools.google.rate_limit.time.monotonic") as monotonic:
+            # Start the fake clock at 0 so 0.1s steps stay exact in floating point
+            monotonic.return_value = bucket._updated = 0.0
+
+            async def _sleep(delay):
+                monotonic.return_value += delay
+
+            with patch(
+                "src.tools.google.rate_limit.asyncio.sleep", side_effect=_sleep
+            ) as sleep:
+                await bucket.acquire()
+
+        sleep.assert_awaited_once()
+        assert sleep.await_args.args[0] == pytest.approx(0.1)
@@ -2,24 +2,40 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+from src.tools.google import sheets
 from src.tools.google.sheets import (
     google_sheets_add_sheet,
+    google_sheets_add_sheets,
     google_sheets_append_values,
+    google_sheets_batch_read_values,
+    google_sheets_batch_write_values,
     google_sheets_clear_values,
     google_sheets_create_spreadsheet,
     google_sheets_get_info,
+    google_sheets_get_info_many,
     google_sheets_list_spreadsheets,
+    google_sheets_read_new_rows,
     google_sheets_read_values,
     google_sheets_write_values,
 )
 
 
+async def _execute(request):
+    return request.execute()
+
+
 @pytest.fixture
 def mock_sheets_service():
-    with patch("src.tools.google.sheets.get_google_service_from_mcp") as mock:
+    with (
+        patch("src.tools.google.sheets.get_google_service_from_mcp") as mock,
+        patch("src.tools.google.sheets.execute_async", side_effect=_execute),
+    ):
         service = MagicMock()
         mock.return_value = service
         yield service
+    sheets._INFO_CACHE.clear()
+    sheets._LIST_CACHE.clear()
+    sheets._WRITE_BUCKETS.clear()
 
 
 class TestListSpreadsheets:
@@ -50,6 +66,26 @@ class TestListSpreadsheets:
         assert result["success"] is True
         assert result["data"]["total"] == 0
 
+    @pytest.mark.asyncio
+    async def test_list_spreadsheets_cached(self, mock_sheets_service):
+        files_list = mock_sheets_service.files().list
+        files_list.return_value.execute.return_value = {"files": []}
+        files_list.reset_mock()
+
+        await google_sheets_list_spreadsheets()
+        await google_sheets_list_spreadsheets()
+        assert files_list.call_count == 1
+
+        await google_sheets_list_spreadsheets(force_refresh=True)
+        assert files_list.call_count == 2
+
+        mock_sheets_service.spreadsheets().create().execute.return_value = {
+            "spreadsheetId": "new_sheet"
+        }
+        await google_sheets_create_spreadsheet("New")
+        await google_sheets_list_spreadsheets()
+        assert files_list.call_count == 3
+
     @pytest.mark.asyncio
     async def test_list_spreadsheets_error(self, mock_sheets_service):
         mock_sheets_service.files().list().execute.side_effect = Exception("API error")
@@ -84,6 +120,9 @@ class TestGetSpreadsheetInfo:
         assert result["data"]["title"] == "My Spreadsheet"
         assert len(result["data"]["sheets"]) == 1
         assert result["data"]["sheets"][0]["title"] == "Sheet1"
+        mock_sheets_service.spreadsheets().get.assert_called_with(
+            spreadsheetId="sheet1", fields=sheets.INFO_FIELDS
+        )
 
     @pytest.mark.asyncio
     async def test_get_spreadsheet_info_error(self, mock_sheets_service):
@@ -94,6 +133,79 @@ class TestGetSpreadsheetInfo:
         result = await google_sheets_get_info("nonexistent")
         assert result["success"] is False
 
+    @pytest.mark.asyncio
+    async def test_get_spreadsheet_info_cached(self, mock_sheets_service):
+        get_request = mock_sheets_service.spreadsheets().get()
+        get_request.execute.return_value = {
+            "spreadsheetId": "sheet1",
+            "properties": {"title": "Cached"},
+            "sheets": [],
+        }
+
+        await google_sheets_get_info("sheet1")
+        result = await google_sheets_get_info("sheet1")
+        assert result["data"]["title"] == "Cached"
+        assert get_request.execute.call_count == 1
+
+        await google_sheets_get_info("sheet1", force_refresh=True)
+        assert get_request.execute.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_get_spreadsheet_info_invalidated_by_add_sheet(
+        self, mock_sheets_service
+    ):
+        get_request = mock_sheets_service.spreadsheets().get()
+        get_request.execute.return_value = {
+            "spreadsheetId": "sheet1",
+            "properties": {"title": "Cached"},
+            "sheets": [],
+        }
+        mock_sheets_service.spreadsheets().batchUpdate().execute.return_value = {
+            "replies": [{"addSheet": {"properties": {"sheetId": 1, "title": "New"}}}]
+        }
+
+        await google_sheets_get_info("sheet1")
+        await google_sheets_add_sheet("sheet1", "New")
+        await google_sheets_get_info("sheet1")
+        assert get_request.execute.call_count == 2
+
+
+class TestGetSpreadsheetInfoMany:
+    @pytest.mark.asyncio
+    async def test_get_info_many_uses_cache_and_batch(self, mock_sheets_service):
+        mock_sheets_service.spreadsheets().get().execute.return_value = {
+            "spreadsheetId": "sheet1",
+            "properties": {"title": "Cached"},
+            "sheets": [],
+        }
+        await google_sheets_get_info("sheet1")
+
+        batch_result = (
+            {"sheet2": {"spreadsheetId": "sheet2", "properties": {"title": "Two"}}},
+            {"missing": "Not found"},
+        )
+        with patch(
+            "src.tools.google.sheets.execute_batch", return_value=batch_result
+        ) as execute_batch:
+            result = await google_sheets_get_info_many(["sheet1", "sheet2", "missing"])
+
+        assert result["success"] is True
+        assert [s["title"] for s in result["data"]["spreadsheets"]] == [
+            "Cached",
+            "Two",
+        ]
+        assert result["data"]["errors"] == [{"id": "missing", "error": "Not found"}]
+        batched_ids = [request_id for request_id, _ in execute_batch.call_args.args[1]]
+        assert batched_ids == ["sheet2", "missing"]
+
+    @pytest.mark.asyncio
+    async def test_get_info_many_error(self, mock_sheets_service):
+        with patch(
+            "src.tools.google.sheets.execute_batch", side_effect=Exception("API error")
+        ):
+            result = await google_sheets_get_info_many(["sheet1"])
+        assert result["success"] is False
+
 
 class TestReadSheetValues:
     @pytest.mark.asyncio
@@ -124,6 +236,30 @@ class TestReadSheetValues:
         assert result["success"] is True
         assert result["data"]["row_count"] == 0
 
+    @pytest.mark.asyncio
+    async def test_read_sheet_values_unformatted(self, mock_sheets_service):
+        get = mock_sheets_service.spreadsheets().values().get
+        get.return_value.execute.return_value = {
+            "range": "Sheet1!A1:B1",
+            "majorDimension": "COLUMNS",
+            "values": [[1], [2.5]],
+        }
+
+        result = await google_sheets_read_values(
+            "sheet1",
+            "Sheet1!A1:B1",
+            value_render_option="UNFORMATTED_VALUE",
+            major_dimension="COLUMNS",
+        )
+        assert result["success"] is True
+        assert result["data"]["rows"] == [[1], [2.5]]
+        get.assert_called_with(
+            spreadsheetId="sheet1",
+            range="Sheet1!A1:B1",
+            valueRenderOption="UNFORMATTED_VALUE",
+            majorDimension="COLUMNS",
+        )
+
     @pytest.mark.asyncio
     async def test_read_sheet_values_error(self, mock_sheets_service):
         mock_sheets_service.spreadsheets().values().get().execute.side_effect = (
@@ -134,6 +270,85 @@ class TestReadSheetValues:
         assert result["success"] is False
 
 
+class TestReadNewRows:
+    @pytest.mark.asyncio
+    async def test_read_new_rows_success(self, mock_sheets_service):
+        get = mock_sheets_service.spreadsheets().values().get
+        get.return_value.execute.return_value = {
+            "range": "'Sales Log'!A11:C12",
+            "values": [["a", 1, 2], ["b", 3]],
+        }
+
+        result = await google_sheets_read_new_rows(
+            "sheet1", "Sales Log", last_row_seen=10, max_rows=50
+        )
+        assert result["success"] is True
+        assert result["data"]["rows"] == [["a", 1, 2], ["b", 3]]
+        assert result["data"]["new_last_row"] == 12
+        get.assert_called_with(
+            spreadsheetId="sheet1",
+            range="'Sales Log'!11:60",
+            valueRenderOption="UNFORMATTED_VALUE",
+            majorDimension="ROWS",
+        )
+
+    @pytest.mark.asyncio
+    async def test_read_new_rows_none_added(self, mock_sheets_service):
+        mock_sheets_service.spreadsheets().values().get().execute.return_value = {
+            "range": "Sheet1!A6:Z1005"
+        }
+
+        result = await google_sheets_read_new_rows("sheet1", "Sheet1", last_row_seen=5)
+        assert result["success"] is True
+        assert result["data"]["row_count"] == 0
+        assert result["data"]["new_last_row"] == 5
+
+    @pytest.mark.asyncio
+    async def test_read_new_rows_invalid_cursor(self, mock_sheets_service):
+        result = await google_sheets_read_new_rows("sheet1", "Sheet1", last_row_seen=-1)
+        assert result["success"] is False
+
+
+class TestBatchReadSheetValues:
+    @pytest.mark.asyncio
+    async def test_batch_read_values_success(self, mock_sheets_service):
+        mock_sheets_service.spreadsheets().values().batchGet().execute.return_value = {
+            "valueRanges": [
+                {"range": "Sheet1!A1:B2", "values": [["a", "b"], ["c"]]},
+                {"range": "Summary!A1:A1"},
+            ]
+        }
+
+        result = await google_sheets_batch_read_values(
+            "sheet1", ["Sheet1!A1:B2", "Summary!A1:A1"]
+        )
+        assert result["success"] is True
+        assert result["data"]["total"] == 2
+        assert result["data"]["value_ranges"][0]["column_count"] == 2
+        assert result["data"]["value_ranges"][1]["row_count"] == 0
+
+    @pytest.mark.asyncio
+    async def test_batch_read_values_chunks_ranges(self, mock_sheets_service):
+        batch_get = mock_sheets_service.spreadsheets().values().batchGet
+        batch_get.return_value.execute.return_value = {"valueRanges": []}
+        batch_get.reset_mock()
+
+        ranges = [f"Sheet1!A{i}" for i in range(sheets.BATCH_GET_MAX_RANGES + 1)]
+        result = await google_sheets_batch_read_values("sheet1", ranges)
+        assert result["success"] is True
+        assert batch_get.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_batch_read_values_error(self, mock_sheets_service):
+        mock_sheets_service.spreadsheets().values().batchGet().execute.side_effect = (
+            Exception("Invalid range")
+        )
+
+        result = await google_sheets_batch_read_values("sheet1", ["Invalid!"])
+        assert result["success"] is False
+        assert result["error"] == "Invalid range"
+
+
 class TestWriteSheetValues:
     @pytest.mark.asyncio
     async def test_write_sheet_values_success(self, mock_sheets_service):
@@ -151,6 +366,30 @@ class TestWriteSheetValues:
         assert result["data"]["updated_cells"] == 4
         assert result["data"]["updated_rows"] == 2
 
+    @pytest.mark.asyncio
+    async def test_write_sheet_values_raw(self, mock_sheets_service):
+        update = mock_sheets_service.spreadsheets().values().update
+        update.return_value.execute.return_value = {"updatedCells": 2}
+
+        result = await google_sheets_write_values(
+            "sheet1", "Sheet1!A1:B1", [[1, True]], input_option="RAW"
+        )
+        assert result["success"] is True
+        assert update.call_args.kwargs["valueInputOption"] == "RAW"
+        assert update.call_args.kwargs["body"] == {"values": [[1, True]]}
+
+    @pytest.mark.asyncio
+    async def test_write_sheet_values_invalid_input_option(self, mock_sheets_service):
+        update = mock_sheets_service.spreadsheets().values().update
+        update.reset_mock()
+
+        result = await google_sheets_write_values(
+            "sheet1", "Sheet1!A1", [["A"]], input_option="FORMULA"
+        )
+        assert result["success"] is False
+        assert "input_option" in result["error"]
+        update.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_write_sheet_values_error(self, mock_sheets_service):
         mock_sheets_service.spreadsheets().values().update().execute.side_effect = (
@@ -161,6 +400,46 @@ class TestWriteSheetValues:
         assert result["success"] is False
 
 
+class TestBatchWriteSheetValues:
+    @pytest.mark.asyncio
+    async def test_batch_write_values_success(self, mock_sheets_service):
+        batch_update = mock_sheets_service.spreadsheets().values().batchUpdate
+        batch_update.return_value.execute.return_value = {
+            "totalUpdatedRows": 3,
+            "totalUpdatedColumns": 2,
+            "totalUpdatedCells": 5,
+            "responses": [
+                {"updatedRange": "Sheet1!A1:B2"},
+                {"updatedRange": "Summary!A1"},
+            ],
+        }
+        batch_update.reset_mock()
+
+        result = await google_sheets_batch_write_values(
+            "sheet1",
+            [
+                {"range": "Sheet1!A1:B2", "values": [["A", "B"], ["C", "D"]]},
+                {"range": "Summary!A1", "values": [["Total"]]},
+            ],
+        )
+        assert result["success"] is True
+        assert result["data"]["total_updated_cells"] == 5
+        assert result["data"]["updated_ranges"] == ["Sheet1!A1:B2", "Summary!A1"]
+        body = batch_update.call_args.kwargs["body"]
+        assert body["valueInputOption"] == "USER_ENTERED"
+        assert len(body["data"]) == 2
+
+    @pytest.mark.asyncio
+    async def test_batch_write_values_error(self, mock_sheets_service):
+        batch_update = mock_sheets_service.spreadsheets().values().batchUpdate
+        batch_update.return_value.execute.side_effect = Exception("Permission denied")
+
+        result = await google_sheets_batch_write_values(
+            "sheet1", [{"range": "Sheet1!A1", "values": [["data"]]}]
+        )
+        assert result["success"] is False
+
+
 class TestAppendSheetValues:
     @pytest.mark.asyncio
     async def test_append_sheet_values_success(self, mock_sheets_service):
@@ -253,6 +532,35 @@ class TestAddSheet:
         assert result["success"] is False
 
 
+class TestAddSheets:
+    @pytest.mark.asyncio
+    async def test_add_sheets_success(self, mock_sheets_service):
+        batch_update = mock_sheets_service.spreadsheets().batchUpdate
+        batch_update.return_value.execute.return_value = {
+            "replies": [
+                {"addSheet": {"properties": {"sheetId": 1, "title": "Jan"}}},
+                {"addSheet": {"properties": {"sheetId": 2, "title": "Feb"}}},
+            ]
+        }
+        batch_update.reset_mock()
+
+        result = await google_sheets_add_sheets("sheet1", ["Jan", "Feb"])
+        assert result["success"] is True
+        assert result["data"]["total"] == 2
+        assert result["data"]["sheets"][1]["sheet_id"] == 2
+        assert batch_update.call_count == 1
+        assert len(batch_update.call_args.kwargs["body"]["requests"]) == 2
+
+    @pytest.mark.asyncio
+    async def test_add_sheets_error(self, mock_sheets_service):
+        mock_sheets_service.spreadsheets().batchUpdate().execute.side_effect = (
+            Exception("Duplicate name")
+        )
+
+        result = await google_sheets_add_sheets("sheet1", ["Sheet1"])
+        assert result["success"] is False
+
+
 class TestClearSheetValues:
     @pytest.mark.asyncio
     async def test_clear_sheet_values_success(self, mock_sheets_service):
@@ -2,22 +2,34 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+from src.tools.google import slides
 from src.tools.google.slides import (
+    google_slides_add_many_text,
     google_slides_add_slide,
     google_slides_add_text,
     google_slides_create_presentation,
+    google_slides_get_all_thumbnails,
     google_slides_get_presentation,
     google_slides_get_thumbnail,
     google_slides_list_presentations,
 )
 
 
+async def _execute(request):
+    return request.execute()
+
+
 @pytest.fixture
 def mock_slides_service():
-    with patch("src.tools.google.slides.get_google_service_from_mcp") as mock:
+    with (
+        patch("src.tools.google.slides.get_google_service_from_mcp") as mock,
+        patch("src.tools.google.slides.execute_async", side_effect=_execute),
+    ):
         service = MagicMock()
         mock.return_value = service
         yield service
+    slides._LIST_CACHE.clear()
+    slides._PRESENTATION_CACHE.clear()
 
 
 class TestListPresentations:
@@ -47,6 +59,19 @@ class TestListPresentations:
         assert result["success"] is True
         assert result["data"]["total"] == 0
 
+    @pytest.mark.asyncio
+    async def test_list_presentations_cached(self, mock_slides_service):
+        files_list = mock_slides_service.files().list
+        files_list.return_value.execute.return_value = {"files": []}
+        files_list.reset_mock()
+
+        await google_slides_list_presentations()
+        await google_slides_list_presentations()
+        assert files_list.call_count == 1
+
+        await google_slides_list_presentations(force_refresh=True)
+        assert files_list.call_count == 2
+
     @pytest.mark.asyncio
     async def test_list_presentations_error(self, mock_slides_service):
         mock_slides_service.files().list().execute.side_effect = Exception("API error")
@@ -89,6 +114,61 @@ class TestGetPresentation:
         assert result["data"]["title"] == "My Presentation"
         assert result["data"]["slide_count"] == 1
 
+    @pytest.mark.asyncio
+    async def test_get_presentation_extracts_text(self, mock_slides_service):
+        get = mock_slides_service.presentations().get
+        get.return_value.execute.return_value = {
+            "presentationId": "pres1",
+            "slides": [
+                {
+                    "objectId": "slide1",
+                    "pageElements": [
+                        {"image": {"contentUrl": "https://example.com/a.png"}},
+                        {
+                            "shape": {
+                                "text": {"textElements": [{"paragraphMarker": {}}]}
+                            }
+                        },
+                        {
+                            "shape": {
+                                "text": {
+                                    "textElements": [
+                                        {"textRun": {"content": "Hello "}},
+                                        {"textRun": {"content": "world\n"}},
+                                    ]
+                                }
+                            }
+                        },
+                    ],
+                }
+            ],
+        }
+        get.reset_mock()
+
+        result = await google_slides_get_presentation("pres1")
+        assert result["data"]["slides"][0]["elements"] == [
+            {"type": "text", "content": "Hello world"}
+        ]
+        assert get.call_args.kwargs["fields"] == slides.PRESENTATION_FIELDS
+
+    @pytest.mark.asyncio
+    async def test_get_presentation_cached(self, mock_slides_service):
+        get = mock_slides_service.presentations().get
+        get.return_value.execute.return_value = {"presentationId": "pres1"}
+        get.reset_mock()
+
+        await google_slides_get_presentation("pres1")
+        await google_slides_get_presentation("pres1")
+        assert get.call_count == 1
+
+        mock_slides_service.presentations().batchUpdate().execute.return_value = {}
+        await google_slides_add_text("pres1", "slide1", "Hello")
+        await google_slides_get_presentation("pres1")
+        assert get.call_count == 2
+
+        await google_slides_get_presentation("pres1", force_refresh=True)
+        assert get.call_count == 3
+
     @pytest.mark.asyncio
     async def test_get_presentation_error(self, mock_slides_service):
         mock_slides_service.presentations().get().execute.side_effect = Exception(
@@ -181,6 +261,14 @@ class TestAddTextToSlide:
         )
         assert result["success"] is True
 
+    @pytest.mark.asyncio
+    async def test_add_text_same_position_unique_ids(self, mock_slides_service):
+        mock_slides_service.presentations().batchUpdate().execute.return_value = {}
+
+        first = await google_slides_add_text("pres1", "slide1", "One")
+        second = await google_slides_add_text("pres1", "slide1", "Two")
+        assert first["data"]["shape_id"] != second["data"]["shape_id"]
+
     @pytest.mark.asyncio
     async def test_add_text_to_slide_error(self, mock_slides_service):
         mock_slides_service.presentations().batchUpdate().execute.side_effect = (
@@ -191,6 +279,49 @@ class TestAddTextToSlide:
         assert result["success"] is False
 
 
+class TestAddManyText:
+    @pytest.mark.asyncio
+    async def test_add_many_text_single_request(self, mock_slides_service):
+        batch_update = mock_slides_service.presentations().batchUpdate
+        batch_update.return_value.execute.return_value = {}
+        batch_update.reset_mock()
+
+        result = await google_slides_add_many_text(
+            "pres1",
+            [
+                {"slide_id": "slide1", "text": "One"},
+                {"slide_id": "slide2", "text": "Two", "x": 10, "y": 20},
+            ],
+        )
+        assert result["success"] is True
+        assert result["data"]["total"] == 2
+        assert [t["text"] for t in result["data"]["texts"]] == ["One", "Two"]
+        assert batch_update.call_count == 1
+        requests = batch_update.call_args.kwargs["body"]["requests"]
+        assert len(requests) == 4
+
+    @pytest.mark.asyncio
+    async def test_add_many_text_empty(self, mock_slides_service):
+        batch_update = mock_slides_service.presentations().batchUpdate
+        batch_update.reset_mock()
+
+        result = await google_slides_add_many_text("pres1", [])
+        assert result["success"] is True
+        assert result["data"]["total"] == 0
+        batch_update.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_add_many_text_error(self, mock_slides_service):
+        mock_slides_service.presentations().batchUpdate().execute.side_effect = (
+            Exception("Slide not found")
+        )
+
+        result = await google_slides_add_many_text(
+            "pres1", [{"slide_id": "invalid", "text": "text"}]
+        )
+        assert result["success"] is False
+
+
 class TestGetSlideThumbnail:
     @pytest.mark.asyncio
     async def test_get_slide_thumbnail_success(self, mock_slides_service):
@@ -215,6 +346,12 @@ class TestGetSlideThumbnail:
 
         result = await google_slides_get_thumbnail("pres1", "slide1", size="LARGE")
         assert result["success"] is True
+        mock_slides_service.presentations().pages().getThumbnail.assert_called_with(
+            presentationId="pres1",
+            pageObjectId="slide1",
+            thumbnailProperties_thumbnailSize="LARGE",
+            fields="contentUrl,width,height",
+        )
 
     @pytest.mark.asyncio
     async def test_get_slide_thumbnail_error(self, mock_slides_service):
@@ -224,3 +361,36 @@ class TestGetSlideThumbnail:
 
         result = await google_slides_get_thumbnail("pres1", "invalid")
         assert result["success"] is False
+
+
+class TestGetAllThumbnails:
+    @pytest.mark.asyncio
+    async def test_get_all_thumbnails_success(self, mock_slides_service):
+        mock_slides_service.presentations().get().execute.return_value = {
+            "slides": [{"objectId": "slide1"}, {"objectId": "slide2"}]
+        }
+        batch_result = (
+            {"slide1": {"contentUrl": "https://example.com/1.png", "width": 800}},
+            {"slide2": "Internal error"},
+        )
+        with patch(
+            "src.tools.google.slides.execute_batch", return_value=batch_result
+        ) as execute_batch:
+            result = await google_slides_get_all_thumbnails("pres1")
+
+        assert result["success"] is True
+        assert result["data"]["total"] == 1
+        assert result["data"]["thumbnails"][0]["content_url"].endswith("1.png")
+        assert result["data"]["errors"] == [
+            {"slide_id": "slide2", "error": "Internal error"}
+        ]
+        assert len(execute_batch.call_args.args[1]) == 2
+
+    @pytest.mark.asyncio
+    async def test_get_all_thumbnails_error(self, mock_slides_service):
+        mock_slides_service.presentations().get().execute.side_effect = Exception(
+            "Not found"
+        )
+
+        result = await google_slides_get_all_thumbnails("invalid")
+        assert result["success"] is False
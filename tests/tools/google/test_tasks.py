@@ -1,7 +1,9 @@
+import asyncio
 from unittest.mock import MagicMock, patch
 
 import pytest
 
+from src.tools.google import tasks
 from src.tools.google.tasks import (
     google_tasks_clear_completed,
     google_tasks_complete_task,
@@ -11,18 +13,30 @@ from src.tools.google.tasks import (
     google_tasks_delete_task_list,
     google_tasks_get_task,
     google_tasks_get_task_list,
+    google_tasks_list_all_tasks,
     google_tasks_list_task_lists,
     google_tasks_list_tasks,
+    google_tasks_list_tasks_multi,
     google_tasks_update_task,
 )
 
 
+async def _execute(request):
+    return request.execute()
+
+
 @pytest.fixture
 def mock_tasks_service():
-    with patch("src.tools.google.tasks.get_google_service_from_mcp") as mock:
+    with (
+        patch("src.tools.google.tasks.get_google_service_from_mcp") as mock,
+        patch("src.tools.google.tasks.execute_async", side_effect=_execute),
+        patch("src.tools.google.tasks.PREFETCH_FIRST_LIST", False),
+    ):
         service = MagicMock()
         mock.return_value = service
         yield service
+    tasks._READ_CACHE.clear()
+    tasks._TASK_LISTS_CACHE.clear()
 
 
 class TestListTaskLists:
@@ -150,6 +164,12 @@ class TestListTasks:
         assert result["success"] is True
         assert result["data"]["total"] == 2
         assert result["data"]["tasks"][0]["title"] == "Buy groceries"
+        assert result["data"]["tasks"][1]["notes"] == ""
+        assert result["data"]["tasks"][1]["parent"] == ""
+        assert (
+            mock_tasks_service.tasks().list.call_args.kwargs["fields"]
+            == tasks.TASKS_FIELDS
+        )
 
     @pytest.mark.asyncio
     async def test_list_tasks_empty(self, mock_tasks_service):
@@ -167,6 +187,321 @@ class TestListTasks:
         assert result["success"] is False
 
 
+class TestListTasksPagination:
+    @pytest.mark.asyncio
+    async def test_list_tasks_follows_pages(self, mock_tasks_service):
+        tasks_list = mock_tasks_service.tasks().list
+        tasks_list.return_value.execute.side_effect = [
+            {
+                "items": [{"id": f"task{i}"} for i in range(100)],
+                "nextPageToken": "page2",
+            },
+            {"items": [{"id": "task100"}, {"id": "task101"}], "nextPageToken": "p3"},
+        ]
+        tasks_list.reset_mock()
+
+        result = await google_tasks_list_tasks("list1", max_results=102)
+        assert result["success"] is True
+        assert result["data"]["total"] == 102
+        assert result["data"]["tasks"][-1]["id"] == "task101"
+        assert tasks_list.call_count == 2
+        assert tasks_list.call_args.kwargs["pageToken"] == "page2"
+        assert tasks_list.call_args.kwargs["maxResults"] == 2
+
+    @pytest.mark.asyncio
+    async def test_list_tasks_single_page(self, mock_tasks_service):
+        tasks_list = mock_tasks_service.tasks().list
+        tasks_list.return_value.execute.return_value = {
+            "items": [{"id": "task1"}],
+        }
+        tasks_list.reset_mock()
+
+        result = await google_tasks_list_tasks("list1", max_results=500)
+        assert result["data"]["total"] == 1
+        assert tasks_list.call_count == 1
+        assert tasks_list.call_args.kwargs["maxResults"] == tasks.PAGE_SIZE
+
+
+class TestListTasksCache:
+    @pytest.mark.asyncio
+    async def test_list_tasks_cached(self, mock_tasks_service):
+        tasks_list = mock_tasks_service.tasks().list
+        tasks_list.return_value.execute.return_value = {"items": []}
+        tasks_list.reset_mock()
+
+        await google_tasks_list_tasks("list1")
+        await google_tasks_list_tasks("list1")
+        assert tasks_list.call_count == 1
+
+        await google_tasks_list_tasks("list1", force_refresh=True)
+        assert tasks_list.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_list_tasks_invalidated_by_create_task(self, mock_tasks_service):
+        tasks_list = mock_tasks_service.tasks().list
+        tasks_list.return_value.execute.return_value = {"items": []}
+        mock_tasks_service.tasks().insert().execute.return_value = {"id": "task1"}
+        tasks_list.reset_mock()
+
+        await google_tasks_list_tasks("list1")
+        await google_tasks_create_task("list1", title="New task")
+        await google_tasks_list_tasks("list1")
+        assert tasks_list.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_list_tasks_invalidated_by_default_list_write(
+        self, mock_tasks_service
+    ):
+        tasks_list = mock_tasks_service.tasks().list
+        tasks_list.return_value.execute.return_value = {"items": []}
+        mock_tasks_service.tasks().insert().execute.return_value = {"id": "task1"}
+        tasks_list.reset_mock()
+
+        await google_tasks_list_tasks("list1")
+        await google_tasks_create_task(title="New task")
+        await google_tasks_list_tasks("list1")
+        assert tasks_list.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_default_list_invalidated_by_write_to_list(self, mock_tasks_service):
+        tasks_list = mock_tasks_service.tasks().list
+        tasks_list.return_value.execute.return_value = {"items": []}
+        mock_tasks_service.tasks().delete().execute.return_value = None
+        tasks_list.reset_mock()
+
+        await google_tasks_list_tasks()
+        await google_tasks_delete_task("list1", "task1")
+        await google_tasks_list_tasks()
+        assert tasks_list.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_task_lists_invalidated_by_create_task_list(self, mock_tasks_service):
+        lists_list = mock_tasks_service.tasklists().list
+        lists_list.return_value.execute.return_value = {"items": []}
+        mock_tasks_service.tasklists().insert().execute.return_value = {"id": "list2"}
+        lists_list.reset_mock()
+
+        await google_tasks_list_task_lists()
+        await google_tasks_list_task_lists()
+        assert lists_list.call_count == 1
+
+        await google_tasks_create_task_list("Work")
+        await google_tasks_list_task_lists()
+        assert lists_list.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_stale_task_lists_served_and_refreshed(self, mock_tasks_service):
+        lists_list = mock_tasks_service.tasklists().list
+        lists_list.return_value.execute.side_effect = [
+            {"items": [{"id": "list1", "title": "Old"}]},
+            {"items": [{"id": "list1", "title": "New"}]},
+        ]
+        lists_list.reset_mock()
+
+        await google_tasks_list_task_lists()
+        with patch("src.tools.google.tasks.TASK_LISTS_FRESH_TTL", 0):
+            result = await google_tasks_list_task_lists()
+            await asyncio.gather(*tasks._PREFETCHES)
+
+        assert result["data"]["task_lists"][0]["title"] == "Old"
+        assert lists_list.call_count == 2
+        result = await google_tasks_list_task_lists()
+        assert result["data"]["task_lists"][0]["title"] == "New"
+        assert lists_list.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_refresh_overlapping_write_not_cached(self, mock_tasks_service):
+        lists_list = mock_tasks_service.tasklists().list
+        lists_list.return_value.execute.side_effect = [
+            {"items": [{"id": "list1", "title": "My Tasks"}]},
+            {"items": [{"id": "list1", "title": "My Tasks"}]},
+            {"items": [{"id": "list1", "title": "My Tasks"}, {"id": "list2"}]},
+        ]
+        mock_tasks_service.tasklists().insert().execute.return_value = {"id": "list2"}
+        lists_list.reset_mock()
+        release = asyncio.Event()
+
+        async def _gated_execute(request):
+            if request is lists_list.return_value:
+                await release.wait()
+            return request.execute()
+
+        await google_tasks_list_task_lists()
+        with (
+            patch("src.tools.google.tasks.TASK_LISTS_FRESH_TTL", 0),
+            patch("src.tools.google.tasks.execute_async", side_effect=_gated_execute),
+        ):
+            await google_tasks_list_task_lists()
+            await asyncio.sleep(0)
+            await google_tasks_create_task_list("Work")
+            release.set()
+            await asyncio.gather(*tasks._PREFETCHES)
+
+        result = await google_tasks_list_task_lists()
+        assert result["data"]["total"] == 2
+        assert lists_list.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_expired_task_lists_refetched(self, mock_tasks_service):
+        lists_list = mock_tasks_service.tasklists().list
+        lists_list.return_value.execute.return_value = {"items": []}
+        lists_list.reset_mock()
+
+        await google_tasks_list_task_lists()
+        with patch.object(tasks._TASK_LISTS_CACHE, "ttl", 0):
+            await google_tasks_list_task_lists()
+
+        assert lists_list.call_count == 2
+        assert not tasks._PREFETCHES
+
+
+class TestSingleFlight:
+    @pytest.mark.asyncio
+    async def test_concurrent_get_task_shares_request(self, mock_tasks_service):
+        mock_tasks_service.tasks().get().execute.return_value = {"id": "task1"}
+        started = []
+
+        async def _slow_execute(request):
+            started.append(request)
+            await asyncio.sleep(0.01)
+            return request.execute()
+
+        with patch("src.tools.google.tasks.execute_async", side_effect=_slow_execute):
+            results = await asyncio.gather(
+                google_tasks_get_task("list1", "task1"),
+                google_tasks_get_task("list1", "task1"),
+                google_tasks_get_task("list1", "task1"),
+            )
+
+        assert [r["data"]["id"] for r in results] == ["task1"] * 3
+        assert len(started) == 1
+        assert len(tasks._INFLIGHT) == 0
+
+
+class TestPrefetch:
+    @pytest.mark.asyncio
+    async def test_list_task_lists_prefetches_first_list(self, mock_tasks_service):
+        mock_tasks_service.tasklists().list().execute.return_value = {
+            "items": [{"id": "list1", "title": "My Tasks"}]
+        }
+        tasks_list = mock_tasks_service.tasks().list
+        tasks_list.return_value.execute.return_value = {"items": [{"id": "task1"}]}
+        tasks_list.reset_mock()
+
+        with patch("src.tools.google.tasks.PREFETCH_FIRST_LIST", True):
+            await google_tasks_list_task_lists()
+            await asyncio.gather(*tasks._PREFETCHES)
+
+        assert tasks_list.call_count == 1
+        result = await google_tasks_list_tasks("list1")
+        assert result["data"]["tasks"][0]["id"] == "task1"
+        assert tasks_list.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_prefetch_overlapping_write_not_cached(self, mock_tasks_service):
+        mock_tasks_service.tasklists().list().execute.return_value = {
+            "items": [{"id": "list1", "title": "My Tasks"}]
+        }
+        tasks_list = mock_tasks_service.tasks().list
+        tasks_list.return_value.execute.side_effect = [
+            {"items": []},
+            {"items": [{"id": "task1"}]},
+        ]
+        mock_tasks_service.tasks().insert().execute.return_value = {"id": "task1"}
+        tasks_list.reset_mock()
+        release = asyncio.Event()
+
+        async def _gated_execute(request):
+            if request is tasks_list.return_value:
+                await release.wait()
+            return request.execute()
+
+        with (
+            patch("src.tools.google.tasks.PREFETCH_FIRST_LIST", True),
+            patch("src.tools.google.tasks.execute_async", side_effect=_gated_execute),
+        ):
+            await google_tasks_list_task_lists()
+            await asyncio.sleep(0)
+            await google_tasks_create_task("list1", title="New task")
+            release.set()
+            await asyncio.gather(*tasks._PREFETCHES)
+
+        result = await google_tasks_list_tasks("list1")
+        assert result["data"]["tasks"][0]["id"] == "task1"
+        assert tasks_list.call_count == 2
+
+
+class TestListTasksMulti:
+    @pytest.mark.asyncio
+    async def test_list_tasks_multi_batches_lists(self, mock_tasks_service):
+        batch_result = (
+            {"list1": {"items": [{"id": "task1", "title": "Buy groceries"}]}},
+            {"missing": "Not found"},
+        )
+        with patch(
+            "src.tools.google.tasks.execute_batch", return_value=batch_result
+        ) as execute_batch:
+            result = await google_tasks_list_tasks_multi(["list1", "missing", "list1"])
+
+        assert result["success"] is True
+        assert result["data"]["total"] == 1
+        assert result["data"]["task_lists"][0]["task_list_id"] == "list1"
+        assert result["data"]["task_lists"][0]["tasks"][0]["title"] == "Buy groceries"
+        assert result["data"]["errors"] == [
+            {"task_list_id": "missing", "error": "Not found"}
+        ]
+        batched_ids = [request_id for request_id, _ in execute_batch.call_args.args[1]]
+        assert batched_ids == ["list1", "missing"]
+
+    @pytest.mark.asyncio
+    async def test_list_tasks_multi_error(self, mock_tasks_service):
+        with patch(
+            "src.tools.google.tasks.execute_batch", side_effect=Exception("API error")
+        ):
+            result = await google_tasks_list_tasks_multi(["list1"])
+        assert result["success"] is False
+
+
+class TestListAllTasks:
+    @pytest.mark.asyncio
+    async def test_list_all_tasks_success(self, mock_tasks_service):
+        mock_tasks_service.tasklists().list().execute.return_value = {
+            "items": [
+                {"id": "list1", "title": "My Tasks"},
+                {"id": "list2", "title": "Work"},
+            ]
+        }
+        batch_result = (
+            {
+                "list1": {"items": [{"id": "task1", "title": "Buy groceries"}]},
+                "list2": {"items": []},
+            },
+            {},
+        )
+        with patch(
+            "src.tools.google.tasks.execute_batch", return_value=batch_result
+        ) as execute_batch:
+            result = await google_tasks_list_all_tasks()
+
+        assert result["success"] is True
+        assert result["data"]["total"] == 2
+        assert [tl["title"] for tl in result["data"]["task_lists"]] == [
+            "My Tasks",
+            "Work",
+        ]
+        assert result["data"]["task_lists"][0]["tasks"][0]["id"] == "task1"
+        execute_batch.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_list_all_tasks_error(self, mock_tasks_service):
+        mock_tasks_service.tasklists().list().execute.side_effect = Exception(
+            "API error"
+        )
+
+        result = await google_tasks_list_all_tasks()
+        assert result["success"] is False
+
+
 class TestGetTask:
     @pytest.mark.asyncio
     async def test_get_task_success(self, mock_tasks_service):
@@ -184,6 +519,23 @@ class TestGetTask:
         assert result["data"]["id"] == "task1"
         assert result["data"]["title"] == "Important task"
 
+    @pytest.mark.asyncio
+    async def test_get_task_fills_missing_fields(self, mock_tasks_service):
+        mock_tasks_service.tasks().get().execute.return_value = {"id": "task1"}
+
+        result = await google_tasks_get_task("list1", "task1")
+        assert result["data"] == {
+            "id": "task1",
+            "title": "",
+            "notes": "",
+            "status": "",
+            "due": "",
+            "completed": "",
+            "parent": "",
+            "position": "",
+            "links": [],
+        }
+
     @pytest.mark.asyncio
     async def test_get_task_error(self, mock_tasks_service):
         mock_tasks_service.tasks().get().execute.side_effect = Exception("Not found")
@@ -221,24 +573,28 @@ class TestCreateTask:
 class TestUpdateTask:
     @pytest.mark.asyncio
     async def test_update_task_success(self, mock_tasks_service):
-        mock_tasks_service.tasks().get().execute.return_value = {
-            "id": "task1",
-            "title": "Old title",
-            "status": "needsAction",
-        }
-        mock_tasks_service.tasks().update().execute.return_value = {
+        patch_task = mock_tasks_service.tasks().patch
+        patch_task.return_value.execute.return_value = {
             "id": "task1",
             "title": "Updated title",
             "status": "needsAction",
         }
+        mock_tasks_service.tasks().get.reset_mock()
 
         result = await google_tasks_update_task("list1", "task1", title="Updated title")
         assert result["success"] is True
         assert result["data"]["title"] == "Updated title"
+        patch_task.assert_called_with(
+            tasklist="list1",
+            task="task1",
+            body={"title": "Updated title"},
+            fields=tasks.UPDATED_TASK_FIELDS,
+        )
+        mock_tasks_service.tasks().get.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_update_task_error(self, mock_tasks_service):
-        mock_tasks_service.tasks().get().execute.side_effect = Exception("Not found")
+        mock_tasks_service.tasks().patch().execute.side_effect = Exception("Not found")
 
         result = await google_tasks_update_task("list1", "invalid", title="New title")
         assert result["success"] is False
@@ -264,12 +620,7 @@ class TestDeleteTask:
 class TestCompleteTask:
     @pytest.mark.asyncio
     async def test_complete_task_success(self, mock_tasks_service):
-        mock_tasks_service.tasks().get().execute.return_value = {
-            "id": "task1",
-            "title": "Task to complete",
-            "status": "needsAction",
-        }
-        mock_tasks_service.tasks().update().execute.return_value = {
+        mock_tasks_service.tasks().patch().execute.return_value = {
             "id": "task1",
             "title": "Task to complete",
             "status": "completed",
@@ -279,6 +630,16 @@ class TestCompleteTask:
         result = await google_tasks_complete_task("list1", "task1")
         assert result["success"] is True
         assert result["data"]["status"] == "completed"
+        assert mock_tasks_service.tasks().patch.call_args.kwargs["body"] == {
+            "status": "completed"
+        }
+
+    @pytest.mark.asyncio
+    async def test_complete_task_error(self, mock_tasks_service):
+        mock_tasks_service.tasks().patch().execute.side_effect = Exception("Not found")
+
+        result = await google_tasks_complete_task("list1", "invalid")
+        assert result["success"] is False
 
 
 class TestClearCompletedTasks:
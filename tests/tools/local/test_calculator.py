@@ -1,8 +1,10 @@
 import pytest
 
 from src.tools.local.calculator import (
+    _cached_factorial,
     absolute_value,
     add,
+    calculator_batch,
     divide,
     exponentiate,
     factorial,
@@ -97,6 +99,22 @@ class TestExponentiate:
         assert result["success"] is True
         assert result["data"]["result"] == 1
 
+    @pytest.mark.asyncio
+    async def test_exponentiate_negative_base_fractional_power(self):
+        result = await exponentiate(-8, 0.5)
+        assert result["success"] is False
+        assert "domain" in result["error"]
+
+    @pytest.mark.asyncio
+    async def test_exponentiate_zero_negative_power(self):
+        result = await exponentiate(0.0, -1)
+        assert result["success"] is False
+
+    @pytest.mark.asyncio
+    async def test_exponentiate_overflow(self):
+        result = await exponentiate(10.0, 400)
+        assert result["success"] is False
+
 
 class TestFactorial:
     @pytest.mark.asyncio
@@ -111,6 +129,14 @@ class TestFactorial:
         assert result["success"] is True
         assert result["data"]["result"] == 1
 
+    @pytest.mark.asyncio
+    async def test_factorial_cached(self):
+        _cached_factorial.cache_clear()
+        await factorial(20)
+        result = await factorial(20)
+        assert result["data"]["result"] == 2432902008176640000
+        assert _cached_factorial.cache_info().hits == 1
+
     @pytest.mark.asyncio
     async def test_factorial_negative(self):
         result = await factorial(-1)
@@ -137,6 +163,49 @@ class TestIsPrime:
         assert result["success"] is True
         assert result["data"]["is_prime"] is False
 
+    @pytest.mark.asyncio
+    async def test_is_prime_reports_smallest_divisor(self):
+        result = await is_prime(151 * 21313)
+        assert result["data"]["is_prime"] is False
+        assert result["data"]["divisible_by"] == 151
+
+    @pytest.mark.asyncio
+    async def test_is_prime_reports_divisor_up_to_trial_limit(self):
+        result = await is_prime(9973 * 1_000_003)
+        assert result["data"]["is_prime"] is False
+        assert result["data"]["divisible_by"] == 9973
+
+    @pytest.mark.asyncio
+    async def test_is_prime_sieve_range(self):
+        assert (await is_prime(999_983))["data"]["is_prime"] is True
+        result = await is_prime(999_981)
+        assert result["data"]["is_prime"] is False
+        assert result["data"]["divisible_by"] == 3
+
+    @pytest.mark.asyncio
+    async def test_is_prime_large_prime(self):
+        result = await is_prime(2**61 - 1)
+        assert result["data"]["is_prime"] is True
+        assert "probable_prime" not in result["data"]
+
+    @pytest.mark.asyncio
+    async def test_is_prime_large_composite_without_small_factor(self):
+        result = await is_prime(1_000_003 * 1_000_033)
+        assert result["data"]["is_prime"] is False
+
+    @pytest.mark.asyncio
+    async def test_is_prime_strong_pseudoprime_to_fixed_witnesses(self):
+        # Smallest strong pseudoprime to all prime bases up to 37
+        result = await is_prime(1287836182261 * 2575672364521)
+        assert result["data"]["is_prime"] is False
+
+    @pytest.mark.asyncio
+    async def test_is_prime_above_exact_limit_is_probable(self):
+        result = await is_prime(2**89 - 1)
+        assert result["data"]["is_prime"] is True
+        assert result["data"]["probable_prime"] is True
+        assert "divisible_by" not in result["data"]
+
 
 class TestSquareRoot:
     @pytest.mark.asyncio
@@ -216,3 +285,61 @@ class TestGCD:
         result = await greatest_common_divisor(7, 11)
         assert result["success"] is True
         assert result["data"]["result"] == 1
+
+
+class TestCalculatorBatch:
+    @pytest.mark.asyncio
+    async def test_batch_runs_operations_in_order(self):
+        result = await calculator_batch(
+            [
+                {"op": "add", "args": {"a": 2, "b": 3}},
+                {"op": "multiply", "args": {"a": 4, "b": 5}},
+                {"op": "is_prime", "args": {"n": 7}},
+            ]
+        )
+        assert result["success"] is True
+        assert result["data"]["count"] == 3
+        results = result["data"]["results"]
+        assert results[0]["data"]["result"] == 5
+        assert results[1]["data"]["result"] == 20
+        assert results[2]["data"]["is_prime"] is True
+
+    @pytest.mark.asyncio
+    async def test_batch_reports_failures_per_operation(self):
+        result = await calculator_batch(
+            [
+                {"op": "divide", "args": {"a": 1, "b": 0}},
+                {"op": "unknown", "args": {}},
+                {"op": "factorial", "args": {"n": "x"}},
+                {"op": "subtract", "args": {"a": 5, "b": 2}},
+            ]
+        )
+        assert result["success"] is True
+        results = result["data"]["results"]
+        assert "zero" in results[0]["error"].lower()
+        assert "Unknown operation" in results[1]["error"]
+        assert "Invalid arguments for factorial" in results[2]["error"]
+        assert results[3]["data"]["result"] == 3
+
+    @pytest.mark.asyncio
+    async def test_batch_rejects_malformed_entries(self):
+        result = await calculator_batch(
+            [
+                {"op": "add", "args": None},
+                {"op": "add", "args": [1, 2]},
+                {"op": ["x"]},
+                {"op": "add", "args": {"a": 1, "b": 2}},
+            ]
+        )
+        assert result["success"] is True
+        results = result["data"]["results"]
+        assert "must be an object" in results[0]["error"]
+        assert "must be an object" in results[1]["error"]
+        assert "Unknown operation" in results[2]["error"]
+        assert results[3]["data"]["result"] == 3
+
+    @pytest.mark.asyncio
+    async def test_batch_too_many_operations(self):
+        op = {"op": "add", "args": {"a": 1, "b": 1}}
+        result = await calculator_batch([op] * 1001)
+        assert result["success"] is False
@@ -1,3 +1,6 @@
+import base64
+import os
+
 import pytest
 
 from src.tools.local.local_file_system import (
@@ -10,6 +13,7 @@ from src.tools.local.local_file_system import (
     filesystem_list_files,
     filesystem_read_file,
     filesystem_write_file,
+    refresh_working_directory,
 )
 
 
@@ -23,6 +27,14 @@ class TestWriteFile:
         assert (tmp_path / "test.txt").exists()
         assert (tmp_path / "test.txt").read_text() == "Hello, World!"
 
+    @pytest.mark.asyncio
+    async def test_write_file_reports_utf8_size(self, tmp_path):
+        result = await filesystem_write_file(
+            content="héllo", filename="utf8.txt", directory=str(tmp_path)
+        )
+        assert result["data"]["size_bytes"] == 6
+        assert (tmp_path / "utf8.txt").read_text(encoding="utf-8") == "héllo"
+
     @pytest.mark.asyncio
     async def test_write_file_with_extension(self, tmp_path):
         result = await filesystem_write_file(
@@ -31,6 +43,20 @@ class TestWriteFile:
         assert result["success"] is True
         assert (tmp_path / "myfile.json").exists()
 
+    @pytest.mark.asyncio
+    async def test_write_file_default_directory_follows_refresh(
+        self, tmp_path, monkeypatch
+    ):
+        monkeypatch.chdir(tmp_path)
+        refresh_working_directory()
+        try:
+            result = await filesystem_write_file(content="x", filename="cwd.txt")
+        finally:
+            monkeypatch.undo()
+            refresh_working_directory()
+        assert result["success"] is True
+        assert (tmp_path / "cwd.txt").read_text() == "x"
+
 
 class TestReadFile:
     @pytest.mark.asyncio
@@ -52,6 +78,18 @@ class TestReadFile:
         assert result["success"] is False
         assert "not found" in result["error"].lower()
 
+    @pytest.mark.asyncio
+    async def test_read_file_raw(self, tmp_path):
+        (tmp_path / "data.bin").write_bytes(b"\x00\xff\x10")
+
+        result = await filesystem_read_file(
+            filename="data.bin", directory=str(tmp_path), raw=True
+        )
+        assert result["success"] is True
+        assert result["data"]["encoding"] == "base64"
+        assert base64.b64decode(result["data"]["content"]) == b"\x00\xff\x10"
+        assert result["data"]["size_bytes"] == 3
+
 
 class TestListFiles:
     @pytest.mark.asyncio
@@ -72,6 +110,31 @@ class TestListFiles:
         assert result["success"] is True
         assert result["count"] == 1
 
+    @pytest.mark.asyncio
+    async def test_list_files_recursive(self, tmp_path):
+        (tmp_path / "sub" / "deeper").mkdir(parents=True)
+        (tmp_path / "top.txt").write_text("a")
+        (tmp_path / "sub" / "mid.txt").write_text("bb")
+        (tmp_path / "sub" / "deeper" / "low.txt").write_text("ccc")
+        (tmp_path / "sub" / "skip.py").write_text("")
+
+        result = await filesystem_list_files(
+            directory=str(tmp_path), pattern="*.txt", recursive=True
+        )
+        assert result["success"] is True
+        assert [f["name"] for f in result["data"]] == ["low.txt", "mid.txt", "top.txt"]
+        assert [f["size_bytes"] for f in result["data"]] == [3, 2, 1]
+        assert result["data"][0]["extension"] == "txt"
+
+    @pytest.mark.asyncio
+    async def test_list_files_unsorted(self, tmp_path):
+        for name in ("c.txt", "a.txt", "b.txt"):
+            (tmp_path / name).write_text(name)
+
+        result = await filesystem_list_files(directory=str(tmp_path), sort=False)
+        assert result["success"] is True
+        assert sorted(f["name"] for f in result["data"]) == ["a.txt", "b.txt", "c.txt"]
+
     @pytest.mark.asyncio
     async def test_list_files_empty_dir(self, tmp_path):
         result = await filesystem_list_files(directory=str(tmp_path))
@@ -170,6 +233,7 @@ class TestAppendToFile:
         )
         assert result["success"] is True
         assert test_file.read_text() == "Hello, World!"
+        assert result["data"]["new_size_bytes"] == test_file.stat().st_size
 
     @pytest.mark.asyncio
     async def test_append_to_nonexistent_file(self, tmp_path):
@@ -195,6 +259,62 @@ class TestCopyFile:
         assert (tmp_path / "dest.txt").exists()
         assert (tmp_path / "dest.txt").read_text() == "content"
 
+    @pytest.mark.asyncio
+    async def test_copy_file_preserves_content_and_mtime(self, tmp_path):
+        source = tmp_path / "source.bin"
+        source.write_bytes(bytes(range(256)) * 4096)
+        os.utime(source, (1_000_000, 1_000_000))
+
+        result = await filesystem_copy_file(
+            source_filename="source.bin",
+            destination_filename="nested/dest.bin",
+            source_directory=str(tmp_path),
+            destination_directory=str(tmp_path),
+        )
+        dest = tmp_path / "nested" / "dest.bin"
+        assert result["success"] is True
+        assert result["data"]["size_bytes"] == 256 * 4096
+        assert dest.read_bytes() == source.read_bytes()
+        assert dest.stat().st_mtime == 1_000_000
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("copied", [b"", b"abc"])
+    async def test_copy_file_falls_back_after_short_kernel_copy(
+        self, tmp_path, monkeypatch, copied
+    ):
+        # Some filesystems report 0 bytes, or stop early, instead of failing
+        def short_copy(src, dst, count, *args):
+            if os.lseek(dst, 0, os.SEEK_CUR) or not copied:
+                return 0
+            return os.write(dst, copied)
+
+        monkeypatch.setattr(os, "copy_file_range", short_copy, raising=False)
+        source = tmp_path / "source.txt"
+        source.write_text("abcdefgh")
+
+        result = await filesystem_copy_file(
+            source_filename="source.txt",
+            destination_filename="dest.txt",
+            source_directory=str(tmp_path),
+            destination_directory=str(tmp_path),
+        )
+        assert result["success"] is True
+        assert result["data"]["size_bytes"] == 8
+        assert (tmp_path / "dest.txt").read_text() == "abcdefgh"
+
+    @pytest.mark.asyncio
+    async def test_copy_file_onto_itself(self, tmp_path):
+        (tmp_path / "same.txt").write_text("content")
+
+        result = await filesystem_copy_file(
+            source_filename="same.txt",
+            destination_filename="same.txt",
+            source_directory=str(tmp_path),
+            destination_directory=str(tmp_path),
+        )
+        assert result["success"] is False
+        assert (tmp_path / "same.txt").read_text() == "content"
+
     @pytest.mark.asyncio
     async def test_copy_file_source_not_found(self, tmp_path):
         result = await filesystem_copy_file(
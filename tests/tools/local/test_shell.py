@@ -1,5 +1,9 @@
+import asyncio
+import time
+
 import pytest
 
+from src.tools.local import shell
 from src.tools.local.shell import (
     run_shell_command,
     shell_check_command_exists,
@@ -16,6 +20,7 @@ class TestRunShellCommand:
         result = await run_shell_command(args=["echo", "hello"])
         assert result["success"] is True
         assert "hello" in result["data"]["stdout"]
+        assert result["data"]["argv"] == ["echo", "hello"]
 
     @pytest.mark.asyncio
     async def test_run_with_base_dir(self, tmp_path):
@@ -43,11 +48,58 @@ class TestRunShellCommand:
         assert result["success"] is False
         assert "does not exist" in result["error"].lower()
 
+    @pytest.mark.asyncio
+    async def test_run_base_dir_is_file(self, tmp_path):
+        file_path = tmp_path / "file.txt"
+        file_path.write_text("x")
+        result = await run_shell_command(args=["pwd"], base_dir=str(file_path))
+        assert result["success"] is False
+        assert "not a directory" in result["error"].lower()
+
     @pytest.mark.asyncio
     async def test_run_with_tail(self):
         result = await run_shell_command(args=["echo", "line1\nline2\nline3"], tail=2)
         assert result["success"] is True
 
+    @pytest.mark.asyncio
+    async def test_run_tail_of_large_output(self):
+        result = await run_shell_command(args=["seq", "1", "100000"], tail=3)
+        assert result["success"] is True
+        assert result["data"]["stdout"] == "99999\n100000\n"
+        assert result["data"]["output_truncated"] is True
+
+    @pytest.mark.asyncio
+    async def test_run_without_tail_keeps_all_output(self):
+        result = await run_shell_command(args=["printf", "a\r\nb\rc"], tail=0)
+        assert result["data"]["stdout"] == "a\nb\nc"
+        assert result["data"]["output_truncated"] is False
+
+    @pytest.mark.asyncio
+    async def test_run_timeout_kills_command(self):
+        result = await run_shell_command(args=["sleep", "5"], timeout=0.2)
+        assert result["success"] is False
+        assert "timed out" in result["error"].lower()
+
+    @pytest.mark.asyncio
+    async def test_run_commands_concurrently(self):
+        start = time.monotonic()
+        results = await asyncio.gather(
+            *(run_shell_command(args=["sleep", "0.5"]) for _ in range(4))
+        )
+        assert all(r["success"] for r in results)
+        assert time.monotonic() - start < 1.5
+
+    @pytest.mark.asyncio
+    async def test_run_limits_concurrent_processes(self, monkeypatch):
+        monkeypatch.setattr(shell, "MAX_CONCURRENT_PROCESSES", 1)
+        monkeypatch.setattr(shell, "_process_slots", None)
+        start = time.monotonic()
+        results = await asyncio.gather(
+            *(run_shell_command(args=["sleep", "0.3"], timeout=1) for _ in range(3))
+        )
+        assert all(r["success"] for r in results)
+        assert time.monotonic() - start >= 0.9
+
 
 class TestRunShellScript:
     @pytest.mark.asyncio
@@ -78,6 +130,14 @@ class TestRunShellScript:
         assert result["success"] is True
         assert str(tmp_path) in result["data"]["stdout"]
 
+    @pytest.mark.asyncio
+    async def test_run_script_base_dir_is_file(self, tmp_path):
+        file_path = tmp_path / "file.txt"
+        file_path.write_text("x")
+        result = await shell_run_shell_script(script="pwd", base_dir=str(file_path))
+        assert result["success"] is False
+        assert "not a directory" in result["error"].lower()
+
 
 class TestCheckCommandExists:
     @pytest.mark.asyncio
@@ -129,3 +189,13 @@ class TestGetSystemInfo:
         assert "platform" in result["data"]
         assert "python_version" in result["data"]
         assert "architecture" in result["data"]
+
+    @pytest.mark.asyncio
+    async def test_system_info_reads_user_each_call(self, monkeypatch):
+        monkeypatch.setenv("USER", "first")
+        first = await shell_get_system_info()
+        monkeypatch.setenv("USER", "second")
+        second = await shell_get_system_info()
+        assert first["data"]["user"] == "first"
+        assert second["data"]["user"] == "second"
+        assert first["data"]["platform"] == second["data"]["platform"]
@@ -1,15 +1,23 @@
+import asyncio
 import os
+import time
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from src.tools.search.tavily_tool import TavilySearchTool, tavily_web_search
+from src.tools.search.tavily_tool import (
+    TavilySearchTool,
+    _get_searcher,
+    tavily_web_search,
+)
 
 
 @pytest.fixture
 def mock_tavily_client():
+    _get_searcher.cache_clear()
     with patch("src.tools.search.tavily_tool.TavilyClient") as mock:
         yield mock
+    _get_searcher.cache_clear()
 
 
 @pytest.fixture
@@ -99,6 +107,47 @@ class TestTavilySearchTool:
         # Should have fewer results due to token limit
         assert len(result["results"]) < 10
 
+    def test_web_search_token_limit_keeps_results_that_fit(self, mock_tavily_client):
+        mock_client = MagicMock()
+        mock_client.search.return_value = {
+            "results": [
+                {
+                    "title": f"Result {i}",
+                    "url": f"https://example.com/{i}",
+                    "content": "A" * 1000,
+                    "score": 0.9,
+                }
+                for i in range(5)
+            ]
+        }
+        mock_tavily_client.return_value = mock_client
+
+        # Each result is a little over 1000 characters once serialized
+        tool = TavilySearchTool(api_key="test-key", max_tokens=2300)
+        result = tool.web_search_using_tavily("test query", max_results=5)
+
+        assert [r["title"] for r in result["results"]] == ["Result 0", "Result 1"]
+
+    def test_web_search_caps_results_at_max_results(self, mock_tavily_client):
+        mock_client = MagicMock()
+        mock_client.search.return_value = {
+            "results": [
+                {
+                    "title": f"Result {i}",
+                    "url": f"https://example.com/{i}",
+                    "content": "Content",
+                    "score": 0.9,
+                }
+                for i in range(5)
+            ]
+        }
+        mock_tavily_client.return_value = mock_client
+
+        tool = TavilySearchTool(api_key="test-key")
+        result = tool.web_search_using_tavily("test query", max_results=2)
+
+        assert len(result["results"]) == 2
+
     def test_web_search_empty_results(self, mock_tavily_client):
         mock_client = MagicMock()
         mock_client.search.return_value = {"results": []}
@@ -265,3 +314,32 @@ class TestTavilyWebSearch:
         assert res["score"] == 0.87
         # Extra fields should not be included in cleaned response
         assert "extra_field" not in res
+
+    @pytest.mark.asyncio
+    async def test_client_reused_across_calls(
+        self, mock_tavily_client, mock_env_api_key
+    ):
+        mock_tavily_client.return_value.search.return_value = {"results": []}
+
+        await tavily_web_search("first")
+        await tavily_web_search("second")
+        await tavily_web_search("third", search_depth="advanced")
+
+        assert mock_tavily_client.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_searches_run_concurrently(
+        self, mock_tavily_client, mock_env_api_key
+    ):
+        def slow_search(**kwargs):
+            time.sleep(0.3)
+            return {"results": []}
+
+        mock_client = MagicMock()
+        mock_client.search.side_effect = slow_search
+        mock_tavily_client.return_value = mock_client
+
+        start = time.monotonic()
+        results = await asyncio.gather(*(tavily_web_search("q") for _ in range(4)))
+        assert all(r["success"] for r in results)
+        assert time.monotonic() - start < 0.9